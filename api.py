@@ -0,0 +1,182 @@
+"""Local JSON API over the dashboard's aggregates.
+
+    python api.py [--host 127.0.0.1] [--port 8502]
+
+    GET /sections                           names of the available sections
+    GET /sections/<name>?Country=India&Decade=1990s&Decade=2000s
+
+Each section is the same table (or KPI dict) the dashboard shows for the
+selection, computed with the same filter engine and report functions. Filters
+are the six sidebar columns; repeat a parameter to select several values.
+Responses carry an ETag derived from the dataset version, the selection and
+the section, so a matching If-None-Match is answered with 304 before anything
+is computed; bodies are cached per selection and gzipped when the client
+accepts it. The data is shared with the rest of the process through the same
+background refresher as the dashboard.
+"""
+import argparse
+import gzip
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from precompute import PrecomputedTables
+from refresher import Refresher
+from report import SECTIONS
+from result_cache import ResultCache, filter_key
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 512
+
+
+class BadRequest(Exception):
+    pass
+
+
+class QueryService:
+    """Turns (section, query parameters) into cached JSON bodies for the current dataset."""
+
+    def __init__(self, refresher, cache=None):
+        self.refresher = refresher
+        self.cache = cache or ResultCache(max_entries=4096)
+        self._precomputed = None
+        self._values_by_engine = None
+
+    def _values(self, engine):
+        # Query parameters arrive as strings; map them back to the engine's typed values
+        values = self._values_by_engine
+        if values is None or values[0] is not engine:
+            values = self._values_by_engine = (
+                engine, {col: {str(v): v for v in options} for col, options in engine.options.items()},
+            )
+        return values[1]
+
+    def selection(self, engine, query):
+        """{column: [values]} from parsed query parameters; raises BadRequest for unknown ones."""
+        values = self._values(engine)
+        selection = {col: [] for col in engine.options}
+        for col, raw in query.items():
+            if col not in values:
+                raise BadRequest(f"unknown filter {col!r}; filters are {', '.join(engine.options)}")
+            unknown = [v for v in raw if v not in values[col]]
+            if unknown:
+                raise BadRequest(f"unknown {col} value(s): {', '.join(unknown)}")
+            selection[col] = [values[col][v] for v in raw]
+        return selection
+
+    def etag(self, version, key, name):
+        return f'"{version[:16]}-{key[:16]}-{name}"'
+
+    def precomputed(self, version):
+        if self._precomputed is None or self._precomputed.version != version:
+            self._precomputed = PrecomputedTables(version)
+        return self._precomputed
+
+    def body(self, dataset, selection, key, name):
+        """(json bytes, gzipped bytes or None) for one section of one selection."""
+        def compute():
+            found = self.precomputed(dataset.version).lookup(key)
+            if found is not None and name in found:
+                result = found[name]
+            else:
+                result = SECTIONS[name](dataset.filter_engine.apply(dataset.cube, selection))
+            data = result.to_json(orient="records") if hasattr(result, "to_json") else json.dumps(result, default=int)
+            raw = (
+                f'{{"section": {json.dumps(name)}, "version": "{dataset.version[:16]}", '
+                f'"as_of": "{dataset.as_of.isoformat()}", '
+                f'"filters": {json.dumps({c: v for c, v in selection.items() if v}, default=str)}, '
+                f'"data": {data}}}'
+            ).encode("utf-8")
+            return raw, gzip.compress(raw, compresslevel=6) if len(raw) >= GZIP_MIN_BYTES else None
+        return self.cache.get_or_compute(dataset.version, f"{key}:{name}", compute)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive clients wait ~40ms for each
+    disable_nagle_algorithm = True
+    server_version = "AircrashAPI/1.0"
+    service = None
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, status, payload, headers=()):
+        body = json.dumps(payload).encode("utf-8")
+        self._send(status, body, [("Content-Type", "application/json"), *headers])
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        if parts == ["sections"]:
+            return self._json(200, list(SECTIONS))
+        if len(parts) != 2 or parts[0] != "sections":
+            return self._json(404, {"error": "not found; try /sections"})
+        name = parts[1]
+        if name not in SECTIONS:
+            return self._json(404, {"error": f"unknown section {name!r}; sections are {', '.join(SECTIONS)}"})
+
+        service = self.service
+        dataset = service.refresher.current()
+        try:
+            selection = service.selection(dataset.filter_engine, parse_qs(url.query))
+        except BadRequest as error:
+            return self._json(400, {"error": str(error)})
+
+        key = filter_key(selection)
+        etag = service.etag(dataset.version, key, name)
+        headers = [("ETag", etag), ("Cache-Control", "no-cache"), ("Vary", "Accept-Encoding")]
+        if etag in (t.strip() for t in self.headers.get("If-None-Match", "").split(",")):
+            return self._send(304, headers=headers)
+
+        raw, compressed = service.body(dataset, selection, key, name)
+        headers.append(("Content-Type", "application/json"))
+        if compressed is not None and "gzip" in self.headers.get("Accept-Encoding", ""):
+            return self._send(200, compressed, [*headers, ("Content-Encoding", "gzip")])
+        return self._send(200, raw, headers)
+
+
+def make_server(host="127.0.0.1", port=8502, refresher=None):
+    """A threading HTTP server answering from ``refresher``'s data (a started Refresher by default)."""
+    service = QueryService(refresher or Refresher().start())
+    service.refresher.current()
+    handler = type("BoundHandler", (Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = make_server(args.host, args.port)
+    print(f"Serving the crash aggregates on http://{args.host}:{server.server_port}/sections")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
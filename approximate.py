@@ -0,0 +1,200 @@
+"""Approximate rate sections from a stratified sample of crashes, with confidence intervals.
+
+For crash histories too large for the exact roll-ups to keep up, questions 4,
+5 and 8-10 can be answered from a sample that keeps at most
+SAMPLE_PER_STRATUM random crashes of every Decade x Aircraft Category stratum,
+each weighted by the number of crashes it stands for. Rates and averages are
+ratio estimates; their standard errors use the linearized variance of a
+stratified sample with finite population correction, so strata kept whole
+contribute no error. Each approximate section has the exact section's columns
+plus ``<column>_low`` and ``<column>_high`` bounds of a 95% interval.
+
+The dashboard asks for the exact section first and only falls back to these
+estimates when the exact one hasn't finished within EXACT_WAIT_SECONDS; the
+exact computation carries on in ExactJobs and replaces the estimate when done.
+Selections scoped to some decades or years draw their own sample from just
+those partitions (data_loader.load_crashes), so the time range they look at
+gets up to SAMPLE_PER_STRATUM crashes per stratum rather than its share of the
+full sample.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from filters import FILTER_COLUMNS, FilterEngine
+from report import AIR
+
+STRATA = ["Decade", "Aircraft Category"]
+TIME_COLUMNS = ["Decade", "Year"]
+SAMPLE_PER_STRATUM = 1000
+# Two-sided 95% normal interval
+Z = 1.96
+EXACT_WAIT_SECONDS = 0.3
+
+SAMPLE_COLUMNS = list(dict.fromkeys(FILTER_COLUMNS + ["Aircraft Manufacturer", "Aboard", AIR]))
+
+
+class StratifiedSample:
+    """Up to ``per_stratum`` random crashes of each stratum, with their weights."""
+
+    def __init__(self, air, per_stratum=SAMPLE_PER_STRATUM, seed=0):
+        strata = air.groupby(STRATA, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+        self.population = np.bincount(strata)
+
+        # Rank every crash within its stratum in a random order and keep the first per_stratum
+        order = np.random.default_rng(seed).permutation(len(air))
+        rank = pd.Series(strata[order]).groupby(strata[order]).cumcount().to_numpy()
+        keep = np.sort(order[rank < per_stratum])
+        self.sampled = np.bincount(strata[keep], minlength=len(self.population))
+
+        self.rows = air.iloc[keep][SAMPLE_COLUMNS].reset_index(drop=True)
+        self.rows["_stratum"] = strata[keep]
+        self.rows["_weight"] = self.population[strata[keep]] / self.sampled[strata[keep]]
+        self.engine = FilterEngine(self.rows)
+
+    def apply(self, selected_filters):
+        return self.engine.apply(self.rows, selected_filters)
+
+    def ratio(self, rows, by, numerator, denominator=None):
+        """Estimated sum(numerator) / sum(denominator) per ``by`` group, with its standard error.
+
+        Without a denominator, the ratio is the mean of ``numerator`` per crash.
+        Returns a frame indexed by group with total_y, total_x, ratio and se.
+        """
+        y = rows[numerator].to_numpy(np.float64)
+        x = np.ones(len(rows)) if denominator is None else rows[denominator].to_numpy(np.float64)
+        w = rows["_weight"].to_numpy()
+        frame = rows[by].assign(_stratum=rows["_stratum"], _wy=w * y, _wx=w * x)
+
+        groups = frame.groupby(by, observed=True, sort=True)
+        totals = groups[["_wy", "_wx"]].sum()
+        ratio = totals["_wy"] / totals["_wx"]
+
+        # Residuals of the linearized ratio, summed per group and stratum; rows outside a
+        # group count as zeros, so the stratum sizes are those of the whole sample
+        row_ratio = (groups["_wy"].transform("sum") / groups["_wx"].transform("sum")).to_numpy()
+        d = np.nan_to_num(y - row_ratio * x)
+        frame = frame.assign(_d=d, _d2=d * d)
+        per_stratum = frame.groupby(by + ["_stratum"], observed=True, sort=False)[["_d", "_d2"]].sum()
+        h = per_stratum.index.get_level_values("_stratum").to_numpy()
+        n, N = self.sampled[h].astype(np.float64), self.population[h].astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s2 = np.where(n > 1, (per_stratum["_d2"] - per_stratum["_d"] ** 2 / n) / (n - 1), 0.0)
+        contribution = pd.Series(N * N * (1 - n / N) * s2 / n, index=per_stratum.index)
+        variance = contribution.groupby(level=list(range(len(by))), observed=True).sum()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            se = np.sqrt(variance.reindex(totals.index).to_numpy()) / totals["_wx"].to_numpy()
+        return pd.DataFrame(
+            {"total_y": totals["_wy"], "total_x": totals["_wx"], "ratio": ratio, "se": se},
+            index=totals.index,
+        )
+
+
+def _bounds(frame, column, value, se, lower=None, upper=None):
+    frame[f"{column}_low"] = np.clip(value - Z * se, lower, upper)
+    frame[f"{column}_high"] = np.clip(value + Z * se, lower, upper)
+    return frame
+
+
+def _rates(sample, rows, by):
+    est = sample.ratio(rows, [by], AIR, "Aboard")
+    frame = pd.DataFrame({
+        by: est.index.to_numpy(),
+        "Total_Aboard": est["total_x"].to_numpy(),
+        "Total_Fatalities": est["total_y"].to_numpy(),
+        "Survival_Rate": 1 - est["ratio"].to_numpy(),
+        "Death_Rate": est["ratio"].to_numpy(),
+    })
+    _bounds(frame, "Survival_Rate", frame["Survival_Rate"], est["se"].to_numpy(), 0, 1)
+    return _bounds(frame, "Death_Rate", frame["Death_Rate"], est["se"].to_numpy(), 0, 1)
+
+
+# 4.
+def survival_trend(sample, rows):
+    return _rates(sample, rows, "Decade")
+
+
+# 5.
+def avg_fatalities_by_year(sample, rows):
+    est = sample.ratio(rows, ["Year"], AIR)
+    frame = pd.DataFrame({"Year": est.index.to_numpy(), "Avg_Fatalities": est["ratio"].to_numpy()})
+    return _bounds(frame, "Avg_Fatalities", frame["Avg_Fatalities"], est["se"].to_numpy(), 0)
+
+
+# 8.
+def manufacturer_stats(sample, rows):
+    return _rates(sample, rows, "Aircraft Manufacturer")
+
+
+# 9.
+def manufacturer_severity(sample, rows):
+    est = sample.ratio(rows, ["Aircraft Manufacturer"], AIR)
+    frame = pd.DataFrame({"Manufacturer": est.index.to_numpy(), "Avg_Fatalities": est["ratio"].to_numpy()})
+    frame = _bounds(frame, "Avg_Fatalities", frame["Avg_Fatalities"], est["se"].to_numpy(), 0)
+    return frame.sort_values("Avg_Fatalities", ascending=False).head(20).reset_index(drop=True)
+
+
+# 10.
+def manufacturer_improvement(sample, rows):
+    est = sample.ratio(rows, ["Aircraft Manufacturer", "Decade"], AIR, "Aboard")
+    manufacturers = est.index.get_level_values("Aircraft Manufacturer").unique()
+    # Like groupby first/last: each manufacturer's first and last decade with a rate, NaN without any
+    est = est.dropna(subset=["ratio"]).assign(rate=lambda df: 1 - df["ratio"]).reset_index()
+    grouped = est.groupby("Aircraft Manufacturer", observed=True, sort=True)
+    first = grouped.head(1).set_index("Aircraft Manufacturer").reindex(manufacturers)
+    last = grouped.tail(1).set_index("Aircraft Manufacturer").reindex(manufacturers)
+    # Different decades are different strata, so the two estimates are independent
+    se = np.where(first["Decade"] == last["Decade"], 0.0, np.hypot(first["se"], last["se"]))
+    frame = pd.DataFrame({
+        "Aircraft Manufacturer": manufacturers.to_numpy(),
+        "First_Survival_Rate": first["rate"].to_numpy(),
+        "Last_Survival_Rate": last["rate"].to_numpy(),
+    })
+    frame["Improvement"] = frame["Last_Survival_Rate"] - frame["First_Survival_Rate"]
+    frame = _bounds(frame, "Improvement", frame["Improvement"], se, -1, 1)
+    return frame.sort_values(by="Improvement", ascending=False).reset_index(drop=True)
+
+
+# Report entry -> estimate from the filtered sample rows
+APPROXIMATE_SECTIONS = {
+    "survival_trend": survival_trend,
+    "avg_fatalities_by_year": avg_fatalities_by_year,
+    "manufacturer_stats": manufacturer_stats,
+    "manufacturer_severity": manufacturer_severity,
+    "improvement": manufacturer_improvement,
+}
+
+
+def time_scope(selected_filters):
+    """The Decade and Year selections as sorted tuples, or None when neither is set."""
+    scope = tuple(tuple(sorted(selected_filters.get(col, []))) for col in TIME_COLUMNS)
+    return scope if any(scope) else None
+
+
+def estimate(sample, name, selected_filters):
+    return APPROXIMATE_SECTIONS[name](sample, sample.apply(selected_filters))
+
+
+class ExactJobs:
+    """Exact sections computing in the background, one job per key however many sessions ask."""
+
+    def __init__(self, workers=2):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exact-section")
+        self._jobs = {}
+        # Reentrant: a job that is already done runs its callback inside submit()
+        self._lock = threading.RLock()
+
+    def submit(self, key, compute):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = self._pool.submit(compute)
+                job.add_done_callback(lambda _: self._forget(key))
+            return job
+
+    def _forget(self, key):
+        with self._lock:
+            self._jobs.pop(key, None)
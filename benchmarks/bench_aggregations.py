@@ -0,0 +1,147 @@
+"""Regression benchmark: legacy groupby.apply aggregations vs the cube roll-ups.
+
+Checks that questions 4 and 10 give the same numbers both ways on the bundled
+dataset scaled up 10x, 100x and 1000x, and prints the timings. Every copy of
+the data brings its own countries and manufacturers, so the cube, and with it
+the roll-ups, grows with the scale.
+
+    python benchmarks/bench_aggregations.py [--scales 10 100 1000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import load_air  # noqa: E402
+
+
+# Dimensions scale_dataset(new_groups=True) gives every copy its own values of
+GROWN_COLUMNS = ["Country", "Aircraft Manufacturer"]
+
+
+def scale_dataset(air, factor, seed=0, new_groups=False):
+    """Tile the crash table ``factor`` times, jittering the measures so copies differ.
+
+    With ``new_groups``, every copy after the first also gets its own countries
+    and manufacturers ("Boeing #2", ...), so the cube cells, the rankings and the
+    filter options grow with the rows instead of staying at the bundled data's.
+    """
+    rng = np.random.default_rng(seed)
+    scaled = pd.concat([air] * factor, ignore_index=True)
+    if new_groups:
+        copy = np.repeat(np.arange(factor), len(air))
+        for col in GROWN_COLUMNS:
+            values = pd.Categorical(air[col])
+            names = list(values.categories)
+            codes = np.tile(values.codes.astype(np.int64), factor)
+            codes = np.where(codes >= 0, codes + copy * len(names), -1)
+            categories = names + [f"{name} #{i}" for i in range(2, factor + 1) for name in names]
+            scaled[col] = pd.Categorical.from_codes(codes, categories)
+    aboard = scaled['Aboard'].to_numpy() + rng.integers(0, 5, len(scaled))
+    scaled['Aboard'] = aboard
+    scaled['Fatalities (air)'] = np.minimum(scaled['Fatalities (air)'].to_numpy() + rng.integers(0, 3, len(scaled)), aboard)
+    scaled['Ground'] = scaled['Ground'].to_numpy() + (rng.random(len(scaled)) < 0.01)
+    return scaled
+
+
+# Reference implementations, as they were written in mine.py before the cube
+def legacy_survival_trend(filtered_air):
+    survival_trend = filtered_air.groupby('Decade').apply(
+        lambda x: pd.Series({
+            'Total_Aboard': x['Aboard'].sum(),
+            'Total_Fatalities': x['Fatalities (air)'].sum()
+        }),
+        include_groups=False
+    ).reset_index()
+    survival_trend['Survival_Rate'] = (survival_trend['Total_Aboard'] - survival_trend['Total_Fatalities']) / survival_trend['Total_Aboard']
+    survival_trend['Death_Rate'] = survival_trend['Total_Fatalities'] / survival_trend['Total_Aboard']
+    return survival_trend
+
+
+def legacy_manufacturer_improvement(filtered_air):
+    manufacturer_trend = filtered_air.groupby(['Aircraft Manufacturer', 'Decade']).apply(
+        lambda x: pd.Series({
+            'Total_Aboard': x['Aboard'].sum(),
+            'Total_Fatalities': x['Fatalities (air)'].sum()
+        }),
+        include_groups=False
+    ).reset_index()
+    manufacturer_trend['Survival_Rate'] = (
+        (manufacturer_trend['Total_Aboard'] - manufacturer_trend['Total_Fatalities']) /
+        manufacturer_trend['Total_Aboard']
+    )
+    return (
+        manufacturer_trend.groupby('Aircraft Manufacturer')
+        .agg(
+            First_Survival_Rate=('Survival_Rate', 'first'),
+            Last_Survival_Rate=('Survival_Rate', 'last')
+        )
+        .assign(Improvement=lambda df: df['Last_Survival_Rate'] - df['First_Survival_Rate'])
+        .sort_values(by='Improvement', ascending=False)
+        .reset_index()
+    )
+
+
+def best_of(repeat, fn, *args, patience=5.0):
+    """Best time of ``repeat`` runs; a run slower than ``patience`` seconds isn't repeated."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+        if best > patience:
+            break
+    return best, result
+
+
+def assert_same(legacy, current, key):
+    # compact() makes the keys categorical, so the legacy groupby returns categorical keys
+    # where the cube roll-ups return plain values; compare the values themselves
+    legacy = legacy.assign(**{key: np.asarray(legacy[key], dtype=object)})
+    current = current.assign(**{key: np.asarray(current[key], dtype=object)})
+    # Sort on the key so ties in the ranking don't count as differences
+    legacy = legacy.sort_values(key).reset_index(drop=True)
+    current = current.sort_values(key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(legacy, current, check_dtype=False, check_exact=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    air = load_air()
+    print(f"{'scale':>6} {'rows':>10} {'cells':>9} {'cube build':>11} "
+          f"{'q4 apply':>9} {'q4 cube':>8} {'q10 apply':>10} {'q10 cube':>9}")
+
+    for factor in args.scales:
+        scaled = scale_dataset(air, factor, new_groups=True)
+        build_time, cube = best_of(1, build_cube, scaled)
+        # The legacy code grouped the plain columns the workbook loaded as
+        legacy_input = scaled.astype({'Decade': object, 'Aircraft Manufacturer': object})
+
+        q4_legacy_time, q4_legacy = best_of(args.repeat, legacy_survival_trend, legacy_input)
+        q4_time, q4 = best_of(args.repeat, report.survival_trend, cube)
+        q10_legacy_time, q10_legacy = best_of(args.repeat, legacy_manufacturer_improvement, legacy_input)
+        q10_time, q10 = best_of(args.repeat, report.manufacturer_improvement, cube)
+
+        assert_same(q4_legacy, q4, 'Decade')
+        assert_same(q10_legacy, q10, 'Aircraft Manufacturer')
+
+        print(f"{factor:>5}x {len(scaled):>10,} {len(cube):>9,} {build_time * 1e3:>9.1f}ms "
+              f"{q4_legacy_time * 1e3:>7.1f}ms {q4_time * 1e3:>6.2f}ms "
+              f"{q10_legacy_time * 1e3:>8.1f}ms {q10_time * 1e3:>7.2f}ms")
+
+    print("Results identical at every scale.")
+
+
+if __name__ == "__main__":
+    main()
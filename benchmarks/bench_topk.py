@@ -0,0 +1,97 @@
+"""Top-N charts from the partition lists (topk.py) against the full roll-up, with many groups.
+
+Tiles the dataset --scale times and gives every copy its own countries and
+manufacturers, so the rankings have tens of thousands of groups. For random
+selections over the partition dimensions (and countries, for question 2) it
+checks that the chart data from the index equals the full section's top rows,
+then reports the time per chart for both paths.
+
+    python benchmarks/bench_topk.py [--scale 100] [--selections 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run_benchmarks import random_selection  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import compact, load_air  # noqa: E402
+from filters import FilterEngine  # noqa: E402
+from report import SECTIONS  # noqa: E402
+from topk import PARTITION_DIMENSIONS, RANKED_CHARTS, Rankings  # noqa: E402
+
+
+def many_groups(air, factor):
+    """``factor`` copies of the crashes, each copy with its own country and manufacturer names."""
+    copies = []
+    for i in range(factor):
+        copy = air.copy()
+        for col in ["Country", "Aircraft Manufacturer"]:
+            copy[col] = copy[col].astype(str) + f" #{i}"
+        copies.append(copy)
+    return compact(pd.concat(copies, ignore_index=True))
+
+
+def full_chart_data(name, view):
+    section = SECTIONS[name](view)
+    if name == "manufacturer_stats":
+        # What the chart keeps of the full table
+        return section.sort_values("Total_Fatalities", ascending=False, kind="stable").head(20).reset_index(drop=True)
+    return section
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--selections", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    air = many_groups(load_air(), args.scale)
+    cube = build_cube(air)
+    engine = FilterEngine(cube)
+    start = time.perf_counter()
+    rankings = Rankings(cube)
+    print(f"{len(air):,} crashes, {len(cube):,} cube cells, {air['Country'].nunique():,} countries, "
+          f"{air['Aircraft Manufacturer'].nunique():,} manufacturers; index built in {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(args.seed)
+    empty = {col: [] for col in engine.options}
+    selections = [empty]
+    while len(selections) < args.selections:
+        selection = random_selection(engine, rng)
+        selections.append({col: v if col in PARTITION_DIMENSIONS + ["Country"] else [] for col, v in selection.items()})
+
+    timings = {name: ([], []) for name in RANKED_CHARTS}
+    fallbacks = {name: 0 for name in RANKED_CHARTS}
+    for selection in selections:
+        for name in RANKED_CHARTS:
+            start = time.perf_counter()
+            expected = full_chart_data(name, engine.apply(cube, selection))
+            middle = time.perf_counter()
+            found = rankings.chart_data(name, selection)
+            end = time.perf_counter()
+            if found is None:
+                fallbacks[name] += 1
+                continue
+            if name == "manufacturer_stats":
+                found = found.sort_values("Total_Fatalities", ascending=False, kind="stable").head(20).reset_index(drop=True)
+            pd.testing.assert_frame_equal(found, expected)
+            timings[name][0].append(middle - start)
+            timings[name][1].append(end - middle)
+
+    print(f"\n{'chart':<24} {'full p50':>10} {'index p50':>10} {'full p95':>10} {'index p95':>10} {'fallbacks':>10}")
+    for name, (full, index) in timings.items():
+        full, index = np.asarray(full) * 1000, np.asarray(index) * 1000
+        print(f"{name:<24} {np.median(full):>8.2f}ms {np.median(index):>8.2f}ms "
+              f"{np.percentile(full, 95):>8.2f}ms {np.percentile(index, 95):>8.2f}ms {fallbacks[name]:>10}")
+    print(f"\nIndex results match the full roll-up for all {len(selections)} selections.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Accuracy and speed of the approximate rate sections (approximate.py).
+
+Tiles the dataset --scale times, draws the stratified sample and, for random
+filter selections, compares every estimated rate with the exact section:
+the share of exact values inside their 95% interval (coverage), the median
+interval half-width, and the time per section for both paths.
+
+    python benchmarks/check_approximate.py [--scale 200] [--per-stratum 1000] [--selections 50]
+
+Exits with status 1 when coverage falls below --min-coverage.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_aggregations import scale_dataset  # noqa: E402
+from run_benchmarks import random_selection  # noqa: E402
+import approximate  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import compact, load_air  # noqa: E402
+from filters import FilterEngine  # noqa: E402
+from report import SECTIONS  # noqa: E402
+
+# Estimated column of each section and the key its rows are matched on
+CHECKED = {
+    "survival_trend": ("Decade", ["Survival_Rate", "Death_Rate"]),
+    "avg_fatalities_by_year": ("Year", ["Avg_Fatalities"]),
+    "manufacturer_stats": ("Aircraft Manufacturer", ["Survival_Rate", "Death_Rate"]),
+    "manufacturer_severity": ("Manufacturer", ["Avg_Fatalities"]),
+    "improvement": ("Aircraft Manufacturer", ["Improvement"]),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--per-stratum", type=int, default=approximate.SAMPLE_PER_STRATUM)
+    parser.add_argument("--selections", type=int, default=50)
+    parser.add_argument("--min-coverage", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    air = load_air()
+    air = compact(scale_dataset(air, args.scale, seed=args.seed)) if args.scale > 1 else air
+    cube = build_cube(air)
+    engine = FilterEngine(cube)
+    start = time.perf_counter()
+    sample = approximate.StratifiedSample(air, args.per_stratum, seed=args.seed)
+    print(f"{len(air):,} crashes, {len(cube):,} cube cells, {len(sample.rows):,} sampled "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(args.seed)
+    selections = [{col: [] for col in engine.options}] + [random_selection(engine, rng) for _ in range(args.selections)]
+    inside = {name: 0 for name in CHECKED}
+    checked = {name: 0 for name in CHECKED}
+    widths = {name: [] for name in CHECKED}
+    timings = {name: ([], []) for name in CHECKED}
+
+    for selection in selections:
+        view = engine.apply(cube, selection)
+        rows = sample.apply(selection)
+        for name, (key, columns) in CHECKED.items():
+            start = time.perf_counter()
+            exact = SECTIONS[name](view)
+            middle = time.perf_counter()
+            estimate = approximate.APPROXIMATE_SECTIONS[name](sample, rows)
+            timings[name][0].append(middle - start)
+            timings[name][1].append(time.perf_counter() - middle)
+
+            merged = exact.merge(estimate, on=key, suffixes=("", "_est"))
+            for column in columns:
+                low, high, value = merged[f"{column}_low"], merged[f"{column}_high"], merged[column]
+                known = value.notna() & low.notna()
+                inside[name] += int(((value >= low - 1e-12) & (value <= high + 1e-12))[known].sum())
+                checked[name] += int(known.sum())
+                widths[name] += list(((high - low) / 2)[known])
+
+    failed = False
+    print(f"\n{'section':<24} {'coverage':>9} {'half-width':>11} {'exact p50':>10} {'approx p50':>11}")
+    for name in CHECKED:
+        coverage = inside[name] / checked[name] if checked[name] else float("nan")
+        failed |= coverage < args.min_coverage
+        print(f"{name:<24} {coverage:>8.1%} {np.median(widths[name]):>11.4f} "
+              f"{np.median(timings[name][0]) * 1000:>8.2f}ms {np.median(timings[name][1]) * 1000:>9.2f}ms")
+    if failed:
+        print(f"Coverage below {args.min_coverage:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
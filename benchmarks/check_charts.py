@@ -0,0 +1,114 @@
+"""Chart payload check: the LTTB cap and the "Other" fold of charts.py.
+
+On the bundled data neither reduction fires (question 5 has about 120 years,
+question 7 fewer than MAX_CATEGORIES categories), so this check first prints
+what every chart embeds as-is, then builds data that does outgrow them:
+
+* question 5 over the crash history tiled --copies times with each copy
+  shifted past the previous one's last year, exact and approximate;
+* question 7 with every copy's aircraft categories relabelled.
+
+It renders those through charts.CHARTS and checks the embedded rows: the
+yearly series is cut to MAX_SERIES_POINTS keeping its first and last points,
+its highest and lowest values and the interval columns of the estimate, and the category
+donut keeps MAX_CATEGORIES slices whose fatalities and percentages still add
+up to the whole.
+
+    python benchmarks/check_charts.py [--copies 10]
+"""
+import argparse
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import approximate  # noqa: E402
+import charts  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import compact, load_air  # noqa: E402
+from report import SECTIONS  # noqa: E402
+
+
+def embedded(chart):
+    """The rows the chart's Vega-Lite spec inlines."""
+    with warnings.catch_warnings():
+        # Altair warns about charts that fold an empty frame; not the case here
+        warnings.simplefilter("ignore")
+        spec = chart.to_dict()
+    (rows,) = spec["datasets"].values()
+    return pd.DataFrame(rows)
+
+
+def outgrown(air, copies):
+    """``copies`` copies of the crashes, each in its own years and with its own aircraft categories."""
+    span = int(air["Year"].max()) - int(air["Year"].min()) + 1
+    tiled = []
+    for i in range(copies):
+        copy = air.copy()
+        copy["Year"] = copy["Year"].astype(np.int64) + i * span
+        copy["Aircraft Category"] = copy["Aircraft Category"].astype(str) + f" #{i}"
+        tiled.append(copy)
+    return compact(pd.concat(tiled, ignore_index=True))
+
+
+def check_series(series, chart):
+    rows = embedded(chart)
+    assert len(series) > charts.MAX_SERIES_POINTS, "series too short to be downsampled"
+    assert len(rows) == charts.MAX_SERIES_POINTS, len(rows)
+    years = rows["Year"].to_numpy()
+    assert np.all(np.diff(years) > 0), "downsampled points out of order"
+    assert years[0] == series["Year"].iloc[0] and years[-1] == series["Year"].iloc[-1], "end points dropped"
+    # The copies repeat each other, so check the extreme values rather than their years
+    assert rows["Avg_Fatalities"].max() == series["Avg_Fatalities"].max(), "highest point dropped"
+    assert rows["Avg_Fatalities"].min() == series["Avg_Fatalities"].min(), "lowest point dropped"
+    for column in charts.interval_columns(series, "Avg_Fatalities"):
+        assert column in rows, f"{column} dropped"
+    return rows
+
+
+def check_categories(categories, chart):
+    rows = embedded(chart)
+    assert len(categories) > charts.MAX_CATEGORIES, "too few categories to fold"
+    assert len(rows) == charts.MAX_CATEGORIES, len(rows)
+    assert rows["Category"].iloc[-1] == "Other"
+    kept = categories.nlargest(charts.MAX_CATEGORIES - 1, "Total_Fatalities")["Category"]
+    assert set(rows["Category"].iloc[:-1]) == set(kept), "largest categories not kept"
+    assert rows["Total_Fatalities"].sum() == categories["Total_Fatalities"].sum()
+    assert np.isclose(rows["Percentage"].sum(), 100)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    air = load_air()
+    cube = build_cube(air)
+    print(f"{'chart':<28} {'section rows':>12} {'embedded':>9}")
+    for name, build in charts.CHARTS.items():
+        section = SECTIONS[name](cube)
+        print(f"{name:<28} {len(section):>12} {len(embedded(build(section))):>9}")
+
+    big = outgrown(air, args.copies)
+    big_cube = build_cube(big)
+    series = SECTIONS["avg_fatalities_by_year"](big_cube)
+    check_series(series, charts.CHARTS["avg_fatalities_by_year"](series))
+
+    sample = approximate.StratifiedSample(big)
+    estimated = approximate.estimate(sample, "avg_fatalities_by_year", {})
+    check_series(estimated, charts.CHARTS["avg_fatalities_by_year"](estimated))
+
+    categories = SECTIONS["category_deaths"](big_cube)
+    check_categories(categories, charts.CHARTS["category_deaths"](categories))
+
+    print(f"\n{args.copies} copies: {len(series)} years -> {charts.MAX_SERIES_POINTS} points (exact and estimated), "
+          f"{len(categories)} categories -> {charts.MAX_CATEGORIES} slices; reductions check out.")
+
+
+if __name__ == "__main__":
+    main()
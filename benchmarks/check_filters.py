@@ -0,0 +1,120 @@
+"""Filter regression check for questions 2 and 5 and the incremental KPIs.
+
+Computes both questions straight from the filtered crash rows, the way the
+original notebook did, and compares them with the cube roll-ups for each sidebar
+filter on its own and for random filter mixes. Question 2 used to rank every
+crash in the remaining countries and ignore the other filters; question 5 used
+to group the filtered rows by the full table's years.
+
+Then replays a random walk of single-value filter toggles through the KPI
+engine and compares every step with KPIs computed from scratch.
+
+    python benchmarks/check_filters.py [--selections 200] [--toggles 2000]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run_benchmarks import random_selection  # noqa: E402
+import report  # noqa: E402
+from data_loader import load_air, load_cube  # noqa: E402
+from filters import FilterEngine  # noqa: E402
+from kpis import KPIEngine  # noqa: E402
+
+
+def filter_rows(air, selection):
+    filtered_air = air
+    for key, selected_values in selection.items():
+        if len(selected_values):
+            filtered_air = filtered_air[filtered_air[key].isin(selected_values)]
+    return filtered_air
+
+
+def reference_top_countries(filtered_air):
+    return (
+        filtered_air.loc[~filtered_air['Country'].isin(report.EXCLUDED_COUNTRIES)]
+        .groupby('Country', observed=True)[report.AIR].sum()
+        .sort_values(ascending=False)
+    )
+
+
+def reference_avg_fatalities_by_year(filtered_air):
+    return filtered_air.groupby('Year', observed=True)[report.AIR].mean()
+
+
+def check(air, cube, engine, selection):
+    filtered_air = filter_rows(air, selection)
+    view = engine.apply(cube, selection)
+    assert view['Crashes'].sum() == len(filtered_air)
+
+    expected = reference_top_countries(filtered_air)
+    top = report.top_countries(view)
+    np.testing.assert_array_equal(top[report.AIR].to_numpy(), expected.head(10).to_numpy())
+    # Countries tied with the 10th place may be listed in either order
+    if len(top):
+        above_cutoff = set(expected.index[expected > top[report.AIR].iloc[-1]])
+        assert above_cutoff <= set(top['Country']), (above_cutoff, list(top['Country']))
+
+    expected = reference_avg_fatalities_by_year(filtered_air)
+    yearly = report.avg_fatalities_by_year(view)
+    np.testing.assert_array_equal(yearly['Year'].to_numpy(), expected.index.to_numpy())
+    np.testing.assert_allclose(yearly['Avg_Fatalities'].to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def check_kpi_toggles(cube, engine, rng, steps):
+    """Toggle one value at a time, mostly in the same column, like a user editing a multiselect."""
+    kpi_engine = KPIEngine(cube, engine)
+    columns = list(engine.options)
+    selection = {col: [] for col in columns}
+    state = None
+    col = columns[0]
+    for _ in range(steps):
+        if rng.random() < 0.1:
+            col = columns[rng.integers(len(columns))]
+        options = engine.options[col]
+        value = options[rng.integers(len(options))]
+        values = selection[col]
+        selection = {**selection, col: [v for v in values if v != value] if value in values else values + [value]}
+
+        kpis, state = kpi_engine.kpis(selection, state)
+        expected = {k: int(v) for k, v in report.compute_kpis(engine.apply(cube, selection)).items()}
+        assert kpis == expected, ({c: v for c, v in selection.items() if v}, kpis, expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--selections", type=int, default=200)
+    parser.add_argument("--toggles", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    air = load_air()
+    cube = load_cube()
+    engine = FilterEngine(cube)
+    empty = {col: [] for col in engine.options}
+
+    selections = []
+    for col, options in engine.options.items():
+        for value in options:
+            selections.append({**empty, col: [value]})
+    rng = np.random.default_rng(args.seed)
+    selections += [random_selection(engine, rng) for _ in range(args.selections)]
+
+    for selection in selections:
+        try:
+            check(air, cube, engine, selection)
+        except AssertionError:
+            print("Failed for", {col: list(values) for col, values in selection.items() if len(values)})
+            raise
+    print(f"Questions 2 and 5 match the filtered rows for {len(selections)} selections.")
+
+    check_kpi_toggles(cube, engine, rng, args.toggles)
+    print(f"Incremental KPIs match a full recompute over {args.toggles} filter toggles.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Cold start of the dashboard: from process launch to the first rendered page.
+
+Copies the app to a scratch directory (optionally with the dataset tiled
+--scales times), builds its caches once, then launches fresh Python processes
+that each render mine.py once with Streamlit's headless AppTest and exit. The
+time is measured by this script from launch until the child reports the
+render, so it covers interpreter start, imports and the first script run.
+
+Each scale is measured twice: with the startup file (the normal path after
+any previous run) and without it, where the first paint waits for the cube.
+
+    python benchmarks/cold_start.py [--runs 5] [--scales 1 10] [--max-seconds 10] [--output cold_start.json]
+
+With --max-seconds, the script exits with status 1 when the median cold start
+with the startup file exceeds it at any scale.
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(REPO_DIR, "benchmarks")
+
+# Scales the copied dataset and builds everything a previous run would have left behind
+SETUP = """
+import sys
+sys.path[:0] = [".", {bench_dir!r}]
+import data_loader, precompute, startup
+factor = {factor}
+if factor > 1:
+    from bench_aggregations import scale_dataset
+    data_loader.save_air(scale_dataset(data_loader.load_air(), factor))
+dataset = startup.build_dataset()
+precompute.precompute(dataset.cube, dataset.version)
+print(len(data_loader.load_air()), len(dataset.cube))
+"""
+
+RENDER = """
+import os, sys, time, json
+sys.path.insert(0, ".")
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file("mine.py", default_timeout=300).run()
+rendered = time.perf_counter()
+print(json.dumps({
+    "import_s": imported - started,
+    "script_s": rendered - imported,
+    "errors": [e.message for e in app.exception],
+    "altair": "altair" in sys.modules,
+    "openpyxl": "openpyxl" in sys.modules,
+}), flush=True)
+os._exit(0)
+"""
+
+
+def copy_app(workdir):
+    app_dir = os.path.join(workdir, "app")
+    os.makedirs(app_dir)
+    for path in glob.glob(os.path.join(REPO_DIR, "*.py")) + glob.glob(os.path.join(REPO_DIR, "*.xlsx")):
+        shutil.copy2(path, app_dir)
+    return app_dir
+
+
+def launch(app_dir):
+    """Seconds from process launch until the child has rendered the page, plus the child's report."""
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, "-c", RENDER], cwd=app_dir, stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True)
+    line = child.stdout.readline()
+    elapsed = time.perf_counter() - start
+    child.wait()
+    if not line:
+        raise RuntimeError(f"render process exited with status {child.returncode}")
+    report = json.loads(line)
+    if report["errors"]:
+        raise RuntimeError(f"mine.py raised: {report['errors']}")
+    return elapsed, report
+
+
+def measure(app_dir, runs, with_startup):
+    startup_path = os.path.join(app_dir, ".cache", "startup.pkl")
+    saved = startup_path + ".saved"
+    shutil.copy2(startup_path, saved)
+    samples = []
+    for _ in range(runs):
+        if with_startup:
+            shutil.copy2(saved, startup_path)
+        elif os.path.exists(startup_path):
+            os.remove(startup_path)
+        samples.append(launch(app_dir))
+    shutil.copy2(saved, startup_path)
+    seconds = [s for s, _ in samples]
+    return {
+        "median_s": statistics.median(seconds),
+        "max_s": max(seconds),
+        "import_s": statistics.median(r["import_s"] for _, r in samples),
+        "script_s": statistics.median(r["script_s"] for _, r in samples),
+        "altair_imported": any(r["altair"] for _, r in samples),
+        "openpyxl_imported": any(r["openpyxl"] for _, r in samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="cold starts per scale and mode")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1])
+    parser.add_argument("--max-seconds", type=float, help="fail when a median cold start exceeds this")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for factor in args.scales:
+        with tempfile.TemporaryDirectory() as workdir:
+            app_dir = copy_app(workdir)
+            setup = subprocess.run([sys.executable, "-c", SETUP.format(bench_dir=BENCH_DIR, factor=factor)],
+                                   cwd=app_dir, capture_output=True, text=True, check=True)
+            rows, cells = (int(n) for n in setup.stdout.split()[-2:])
+            print(f"\n{factor}x: {rows:,} rows, {cells:,} cube cells")
+            print(f"  {'first paint':<16} {'median':>8} {'max':>8} {'imports':>8} {'script':>8}  modules")
+            for mode, with_startup in [("startup file", True), ("wait for cube", False)]:
+                numbers = measure(app_dir, args.runs, with_startup)
+                modules = [m for m in ("altair", "openpyxl") if numbers[f"{m}_imported"]]
+                print(f"  {mode:<16} {numbers['median_s']:>7.2f}s {numbers['max_s']:>7.2f}s "
+                      f"{numbers['import_s']:>7.2f}s {numbers['script_s']:>7.2f}s  {', '.join(modules) or '-'}")
+                results.append({"scale": factor, "rows": rows, "cells": cells, "mode": mode, **numbers})
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "results": results}, f, indent=2)
+
+    if args.max_seconds is not None:
+        slow = [r for r in results if r["mode"] == "startup file" and r["median_s"] > args.max_seconds]
+        for r in slow:
+            print(f"SLOW {r['scale']}x: median cold start {r['median_s']:.2f}s > {args.max_seconds:.2f}s")
+        if slow:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
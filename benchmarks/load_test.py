@@ -0,0 +1,140 @@
+"""Load test of the JSON API (api.py) from concurrent keep-alive clients.
+
+Starts api.py as a process of its own on a free port (or targets --url) and
+runs three phases for --duration seconds each: "cold" requests spread over
+many random selections and sections, "warm" requests over a small hot set,
+and "conditional" requests that send back the ETag they were given and are
+answered with 304. Reports throughput, latency percentiles and status codes.
+
+    python benchmarks/load_test.py [--clients 8] [--duration 10] [--url http://127.0.0.1:8502]
+"""
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run_benchmarks import random_selection  # noqa: E402
+from data_loader import load_cube  # noqa: E402
+from filters import FilterEngine  # noqa: E402
+from report import SECTIONS  # noqa: E402
+
+API_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api.py")
+
+
+def request_paths(engine, rng, count):
+    paths = []
+    sections = list(SECTIONS)
+    for _ in range(count):
+        selection = random_selection(engine, rng)
+        query = urlencode([(col, str(v)) for col, values in selection.items() for v in values])
+        paths.append(f"/sections/{sections[rng.integers(len(sections))]}?{query}")
+    return paths
+
+
+def client(host, port, paths, conditional, stop, seed, results):
+    rng = np.random.default_rng(seed)
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    etags = {}
+    latencies, statuses = [], Counter()
+    while not stop.is_set():
+        path = paths[rng.integers(len(paths))]
+        headers = {"Accept-Encoding": "gzip"}
+        if conditional and path in etags:
+            headers["If-None-Match"] = etags[path]
+        start = time.perf_counter()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] += 1
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    connection.close()
+    results.append((latencies, statuses))
+
+
+def run_phase(name, host, port, paths, clients, duration, conditional=False):
+    stop, results = threading.Event(), []
+    threads = [
+        threading.Thread(target=client, args=(host, port, paths, conditional, stop, seed, results))
+        for seed in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies = np.concatenate([np.asarray(r[0]) for r in results]) * 1000
+    statuses = sum((r[1] for r in results), Counter())
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{name:<12} {len(latencies) / duration:>9.0f} req/s  p50 {p50:>6.2f}ms  p95 {p95:>6.2f}ms  "
+          f"p99 {p99:>6.2f}ms  {dict(sorted(statuses.items()))}")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    server = subprocess.Popen([sys.executable, API_PATH, "--port", str(port)], stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("api.py exited before it started listening")
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("api.py did not start listening")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="running api.py to test (default: start one)")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    parser.add_argument("--selections", type=int, default=2000, help="distinct requests in the cold phase")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = FilterEngine(load_cube())
+    rng = np.random.default_rng(args.seed)
+    cold = request_paths(engine, rng, args.selections)
+    warm = cold[:20]
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = start_server(port)
+    try:
+        print(f"{args.clients} clients, {args.duration:.0f}s per phase against http://{host}:{port}")
+        run_phase("cold", host, port, cold, args.clients, args.duration)
+        run_phase("warm", host, port, warm, args.clients, args.duration)
+        run_phase("conditional", host, port, warm, args.clients, args.duration, conditional=True)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
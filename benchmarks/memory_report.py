@@ -0,0 +1,160 @@
+"""Per-session memory of the dashboard, before and after the compact shared table.
+
+Before: every rerun read its own object-dtype copy of the workbook, copied it
+again into ``filtered_air`` and filtered that copy, so each rerun in flight
+held those copies. After: one compact table and cube per process, shared by
+all sessions. The "after" figures are measured: a fresh process renders
+mine.py in N headless AppTest sessions, each of which picks two countries
+(so it builds its KPI state), and reports the memory still allocated
+(tracemalloc) and resident (RSS) with every session alive, plus the pickled
+size of each session's st.session_state.
+
+    python benchmarks/memory_report.py [--sessions 1 10 50] [--scales 1 10]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_aggregations import scale_dataset  # noqa: E402
+from cold_start import BENCH_DIR, SETUP, copy_app  # noqa: E402
+from run_benchmarks import random_selection  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import INTEGER_COLUMNS, TEXT_COLUMNS, compact, load_air  # noqa: E402
+from filters import FILTER_COLUMNS, FilterEngine  # noqa: E402
+
+# Opens sessions one by one and reports the retained memory at each requested count
+SESSIONS = """
+import gc, json, os, pickle, sys, tracemalloc
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+# The app's own modules, so their import isn't counted as session memory
+import approximate, charts, precompute, refresher, report, startup, topk
+
+def resident():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+def session(i):
+    app = AppTest.from_file("mine.py", default_timeout=300).run()
+    for step in range(2):
+        country = [m for m in app.multiselect if m.label == "Country"][0]
+        country.select(country.options[(2 * i + step) % len(country.options)]).run()
+    if app.exception:
+        raise RuntimeError([e.message for e in app.exception])
+    return app
+
+def state_bytes(app):
+    state = app.session_state._state.filtered_state
+    return sum(len(pickle.dumps(v)) for v in state.values())
+
+counts = {counts!r}
+start_resident = resident()
+tracemalloc.start()
+apps = []
+for n in range(1, max(counts) + 1):
+    apps.append(session(n - 1))
+    if n in counts:
+        gc.collect()
+        print(json.dumps({{
+            "sessions": n,
+            "traced": tracemalloc.get_traced_memory()[0],
+            "resident": resident() - start_resident,
+            "state": max(state_bytes(app) for app in apps),
+        }}), flush=True)
+os._exit(0)
+"""
+
+
+def frame_bytes(frame):
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def legacy_table(air):
+    """The crash table with the dtypes read_excel produced: object text, int64 counts."""
+    return air.astype({
+        **{c: object for c in TEXT_COLUMNS if c in air},
+        **{c: "int64" for c in INTEGER_COLUMNS if c in air},
+    })
+
+
+def legacy_session_bytes(air, selection):
+    """What one rerun of the original mine.py kept alive: the table, its copy and the filtered rows."""
+    filtered_air = air.copy()
+    for key, selected_values in selection.items():
+        if selected_values:
+            filtered_air = filtered_air[filtered_air[key].isin(selected_values)]
+    return 2 * frame_bytes(air) + (frame_bytes(filtered_air) if len(filtered_air) < len(air) else 0)
+
+
+def rerun_peak(fn, *args):
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_sessions(factor, counts):
+    """Retained memory of the app with 1..N sessions open, from a fresh process on a scratch copy."""
+    with tempfile.TemporaryDirectory() as workdir:
+        app_dir = copy_app(workdir)
+        subprocess.run([sys.executable, "-c", SETUP.format(bench_dir=BENCH_DIR, factor=factor)],
+                       cwd=app_dir, capture_output=True, text=True, check=True)
+        child = subprocess.run([sys.executable, "-c", SESSIONS.format(counts=sorted(counts))],
+                               cwd=app_dir, capture_output=True, text=True, check=True)
+    return [json.loads(line) for line in child.stdout.splitlines() if line.startswith("{")]
+
+
+def report_scale(air, factor, sessions, rng):
+    legacy = legacy_table(air if factor == 1 else scale_dataset(air, factor))
+    shared_air = compact(legacy)
+    cube = build_cube(shared_air)
+    engine = FilterEngine(cube)
+    selection = random_selection(engine, rng)
+    legacy_selection = {c: selection.get(c, []) for c in FILTER_COLUMNS}
+    before_session = legacy_session_bytes(legacy, legacy_selection)
+    measured = measure_sessions(factor, set(sessions) | {1})
+    first = measured[0]
+
+    print(f"\n{factor}x: {len(legacy):,} rows")
+    print(f"  crash table          {frame_bytes(legacy) / 2**20:>9.2f}MB object dtype -> "
+          f"{frame_bytes(shared_air) / 2**20:.2f}MB compact")
+    print(f"  filter peak (traced) {rerun_peak(legacy_session_bytes, legacy, legacy_selection) / 2**20:>9.2f}MB before -> "
+          f"{rerun_peak(engine.apply, cube, selection) / 2**20:.2f}MB after")
+    print(f"  {'sessions':>8} {'before':>12} {'after traced':>13} {'after RSS':>10} "
+          f"{'per extra session':>18} {'session_state':>14}")
+    for m in measured:
+        if m["sessions"] not in sessions:
+            continue
+        n = m["sessions"]
+        extra = f"{(m['traced'] - first['traced']) / (n - 1) / 2**10:>14.1f}KB" if n > 1 else f"{'-':>16}"
+        print(f"  {n:>8} {n * before_session / 2**20:>10.2f}MB {m['traced'] / 2**20:>11.2f}MB "
+              f"{m['resident'] / 2**20:>8.2f}MB {extra:>18} {m['state'] / 2**10:>12.1f}KB")
+    print("  before: reruns in flight, each holding its copies; after: measured with every session open,\n"
+          "  including the shared cube, engines and result cache the first session builds")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    air = load_air()
+    rng = np.random.default_rng(args.seed)
+    for factor in args.scales:
+        report_scale(air, factor, args.sessions, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Headless benchmark of the dashboard's compute path, stage by stage.
+
+Replays what one mine.py rerun does (load the table, build the cube, apply a
+filter selection, compute each report section, serialize each chart spec),
+plus the decade-pruned row load for selections with a time filter,
+without Streamlit, against the bundled dataset and copies scaled 10x-1000x.
+Each copy brings its own countries and manufacturers, so the cube, the
+sections and the charts work on more groups at every scale, not just on
+more rows. Every iteration draws a random mix of filter selections. Reports p50/p95
+latency and tracemalloc peak per stage and writes the numbers as JSON.
+
+    python benchmarks/run_benchmarks.py [--scales 1 10 100 1000] [--iterations 50]
+                                        [--output results.json] [--compare baseline.json]
+
+With --compare, stages whose p95 grew by more than --tolerance (and by at
+least --min-delta-ms) over the baseline file are listed and the script exits
+with status 1.
+
+Peak memory only covers allocations Python can trace (numpy and pandas
+buffers, Python objects); memory held by Arrow's own pool while reading
+Parquet is not included.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_aggregations import scale_dataset  # noqa: E402
+from charts import CHARTS  # noqa: E402
+from cube import build_cube  # noqa: E402
+from data_loader import load_air, read_partitions, write_partitions  # noqa: E402
+from filters import FilterEngine  # noqa: E402
+from report import compute_report  # noqa: E402
+from result_cache import filter_key  # noqa: E402
+
+
+def random_selection(engine, rng, max_filters=3, max_values=3):
+    """A sidebar state: up to ``max_filters`` filters, each with up to ``max_values`` values."""
+    columns = list(engine.options)
+    selected = {col: [] for col in columns}
+    for col in rng.choice(columns, size=rng.integers(0, max_filters + 1), replace=False):
+        options = engine.options[col]
+        picks = rng.choice(len(options), size=min(rng.integers(1, max_values + 1), len(options)), replace=False)
+        selected[col] = [options[i] for i in picks]
+    return selected
+
+
+class StageTimer:
+    """Collects wall-clock samples, and optionally tracemalloc peaks, per stage name."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.samples = {}
+        self.peaks = {}
+
+    @contextmanager
+    def stage(self, stage):
+        """Times the block as ``stage``; the same interface as profiling.Profiler.stage."""
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            self.peaks[stage] = max(self.peaks.get(stage, 0), peak)
+        else:
+            self.samples.setdefault(stage, []).append(elapsed)
+
+    def run(self, stage, fn, *args):
+        with self.stage(stage):
+            return fn(*args)
+
+
+def rerun(timer, cube, engine, selection):
+    """One dashboard rerun for ``selection``, with no result cache in front of it."""
+    view = timer.run("filter", engine.apply, cube, selection)
+    results = compute_report(view, profiler=timer)
+    for name, chart in CHARTS.items():
+        timer.run(f"chart:{name}", lambda: chart(results[name]).to_dict())
+    return results
+
+
+def bench_scale(air, factor, iterations, seed, workdir):
+    scaled = air if factor == 1 else scale_dataset(air, factor, seed=seed, new_groups=True)
+    path = os.path.join(workdir, f"air_{factor}x.parquet")
+    scaled.to_parquet(path, index=False)
+    del scaled
+
+    rng = np.random.default_rng(seed)
+    timer = StageTimer()
+    loads = max(1, min(iterations, 5))
+    for _ in range(loads):
+        frame = timer.run("load", pd.read_parquet, path)
+        cube = timer.run("cube", build_cube, frame)
+    engine = timer.run("filter_engine", FilterEngine, cube)
+    partitions = os.path.join(workdir, f"partitions_{factor}x")
+    write_partitions(frame, partitions)
+
+    selections = [random_selection(engine, rng) for _ in range(iterations)]
+    for selection in selections:
+        if len(selection["Decade"]) or len(selection["Year"]):
+            timer.run("load_pruned", read_partitions, partitions, selection["Decade"], selection["Year"])
+        start = time.perf_counter()
+        rerun(timer, cube, engine, selection)
+        timer.samples.setdefault("rerun", []).append(time.perf_counter() - start)
+
+    # Memory pass: a separate, shorter run, since tracing slows everything down
+    del frame, cube
+    memory = StageTimer(trace_memory=True)
+    tracemalloc.start()
+    try:
+        frame = memory.run("load", pd.read_parquet, path)
+        cube = memory.run("cube", build_cube, frame)
+        engine = memory.run("filter_engine", FilterEngine, cube)
+        for selection in selections[:5]:
+            rerun(memory, cube, engine, selection)
+            # Whole rerun measured separately: the per-stage runs reset the peak
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            rerun(StageTimer(), cube, engine, selection)
+            peak = tracemalloc.get_traced_memory()[1] - base
+            memory.peaks["rerun"] = max(memory.peaks.get("rerun", 0), peak)
+    finally:
+        tracemalloc.stop()
+
+    stages = {}
+    for stage, samples in timer.samples.items():
+        ms = np.asarray(samples) * 1e3
+        stages[stage] = {
+            "runs": len(samples),
+            "p50_ms": float(np.percentile(ms, 50)),
+            "p95_ms": float(np.percentile(ms, 95)),
+            "peak_bytes": int(memory.peaks.get(stage, 0)),
+        }
+    return {
+        "scale": factor,
+        "rows": len(frame),
+        "cells": len(cube),
+        "distinct_selections": len({filter_key(s) for s in selections}),
+        "stages": stages,
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Stages whose p95 got more than ``tolerance`` (a fraction) slower than in ``baseline``.
+
+    Changes under ``min_delta_ms`` are ignored, so jitter on sub-millisecond stages isn't reported.
+    """
+    previous = {r["scale"]: r["stages"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        for stage, numbers in r["stages"].items():
+            before = previous.get(r["scale"], {}).get(stage)
+            if (before and numbers["p95_ms"] > before["p95_ms"] * (1 + tolerance)
+                    and numbers["p95_ms"] - before["p95_ms"] >= min_delta_ms):
+                regressions.append((r["scale"], stage, before["p95_ms"], numbers["p95_ms"]))
+    return regressions
+
+
+def print_table(result):
+    print(f"\n{result['scale']}x: {result['rows']:,} rows, {result['cells']:,} cube cells")
+    print(f"  {'stage':<38} {'p50':>10} {'p95':>10} {'peak':>10}")
+    for stage, n in result["stages"].items():
+        print(f"  {stage:<38} {n['p50_ms']:>8.2f}ms {n['p95_ms']:>8.2f}ms {n['peak_bytes'] / 2**20:>8.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50, help="filter selections replayed per scale")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="earlier --output file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown, as a fraction")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ignore p95 changes smaller than this")
+    args = parser.parse_args()
+
+    # Selections that match no crash give empty charts; Altair warns about each one
+    warnings.filterwarnings("ignore", message="I don't know how to infer vegalite type", category=UserWarning)
+
+    air = load_air()
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for factor in args.scales:
+            results.append(bench_scale(air, factor, args.iterations, args.seed, workdir))
+            print_table(results[-1])
+
+    report = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "settings": {"iterations": args.iterations, "seed": args.seed},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        for scale, stage, before, after in regressions:
+            print(f"REGRESSION {scale}x {stage}: p95 {before:.2f}ms -> {after:.2f}ms")
+        if regressions:
+            sys.exit(1)
+        print(f"No stage slower than {args.tolerance:.0%} over {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
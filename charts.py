@@ -0,0 +1,247 @@
+"""Altair specs for the ten dashboard questions, plus the data reduction applied before embedding.
+
+Altair inlines each chart's data into its Vega-Lite spec, so every chart here
+ships only the columns it encodes, folds wide tables inside the spec instead of
+melting them (one row per group rather than one per group and metric), caps
+long series with LTTB downsampling and rolls long category tails into "Other".
+"""
+import altair as alt
+import numpy as np
+import pandas as pd
+
+MAX_SERIES_POINTS = 200
+MAX_CATEGORIES = 10
+
+
+def lttb(frame, x, y, threshold=MAX_SERIES_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling of a series sorted by ``x``."""
+    n = len(frame)
+    if threshold >= n or threshold < 3:
+        return frame
+
+    xs = frame[x].to_numpy(dtype=float)
+    ys = frame[y].to_numpy(dtype=float)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        # Average of the next bucket (the last point for the final bucket)
+        avg_x = xs[end:next_end].mean() if end < next_end else xs[-1]
+        avg_y = ys[end:next_end].mean() if end < next_end else ys[-1]
+        areas = np.abs((xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+        a = start + int(np.nanargmax(areas)) if not np.isnan(areas).all() else start
+        selected.append(a)
+    selected.append(n - 1)
+    return frame.iloc[selected]
+
+
+def top_n_with_other(frame, label, value, n=MAX_CATEGORIES, other="Other"):
+    """Keep the ``n - 1`` largest rows of a ranking and sum the rest into one ``other`` row."""
+    if len(frame) <= n:
+        return frame
+    ranked = frame.sort_values(value, ascending=False)
+    head, tail = ranked.iloc[:n - 1], ranked.iloc[n - 1:]
+    other_row = tail.drop(columns=[label]).sum(numeric_only=True).to_frame().T.assign(**{label: other})
+    return pd.concat([head, other_row[frame.columns]], ignore_index=True)
+
+
+def interval_columns(frame, *columns):
+    """The ``_low``/``_high`` bounds that approximate sections carry; none for exact ones."""
+    return [f"{c}_{end}" for c in columns for end in ("low", "high") if f"{c}_{end}" in frame]
+
+
+def interval_tooltips(frame, column, format, field=None):
+    """Tooltips for the 95% interval of ``column``, if ``frame`` has one."""
+    field = field or column
+    if f"{column}_low" not in frame:
+        return []
+    return [
+        alt.Tooltip(f"{field}_low:Q", title="95% CI low", format=format),
+        alt.Tooltip(f"{field}_high:Q", title="95% CI high", format=format),
+    ]
+
+
+def fold_intervals(chart, frame, columns, value):
+    """After folding ``columns`` into ``value``, pick each row's own interval bounds."""
+    if not interval_columns(frame, *columns):
+        return chart
+    for end in ("low", "high"):
+        expr = f"datum.{columns[-1]}_{end}"
+        for column in columns[:-1]:
+            expr = f"datum.Metric == '{column}' ? datum.{column}_{end} : {expr}"
+        chart = chart.transform_calculate(**{f"{value}_{end}": expr})
+    return chart
+
+
+# 1.
+def quarter_cases_chart(quarter_cases):
+    return alt.Chart(quarter_cases).mark_bar().encode(
+        x=alt.X('Quarter:N', sort=['Q1', 'Q2', 'Q3', 'Q4'], title='Quarter'),
+        y=alt.Y('Crash_Count:Q', title='Number of Crashes'),
+        color=alt.Color('Quarter:N', legend=None)
+    ).properties(
+        width=600,
+        height=400,
+        title='Aircraft Crash Cases per Quarter'
+    )
+
+
+# 2.
+def top_countries_chart(top_countries):
+    return alt.Chart(data=top_countries).mark_bar().encode(
+        x=alt.X('Fatalities (air):Q', title='Fatalities (air)'),
+        y=alt.Y('Country:N', sort='-x', title='Country'),
+        color=alt.Color('Country:N', legend=None),
+        tooltip=['Country:N', 'Fatalities (air):Q']
+    ).properties(
+        width=700,
+        height=400,
+        title='Top 10 Countries by Air Fatalities'
+    )
+
+
+# 3.
+def continent_ground_fatalities_chart(continent_ground_fatalities):
+    return alt.Chart(continent_ground_fatalities).mark_bar().encode(
+        x=alt.X('Ground_Fatalities:Q', title='Ground Fatalities'),
+        y=alt.Y('Continent:N', sort='-x', title='Continent'),
+        color=alt.Color('Continent:N', legend=None),
+        tooltip=['Continent:N', 'Ground_Fatalities:Q']
+    ).properties(
+        width=600,
+        height=400,
+        title='Ground Fatalities by Continent'
+    )
+
+
+# 4.
+def survival_trend_chart(survival_trend):
+    rates = ['Survival_Rate', 'Death_Rate']
+    data = survival_trend[['Decade', *rates, *interval_columns(survival_trend, *rates)]]
+    folded = alt.Chart(data).transform_fold(rates, as_=['Metric', 'Rate'])
+    return fold_intervals(folded, data, rates, 'Rate').mark_line(point=True).encode(
+        x=alt.X('Decade:N', title='Decade', sort=None),
+        y=alt.Y('Rate:Q', title='Rate'),
+        color=alt.Color('Metric:N', title='Metric'),
+        tooltip=['Decade:N', 'Metric:N', alt.Tooltip('Rate:Q', format='.2%'), *interval_tooltips(data, 'Survival_Rate', '.2%', 'Rate')]
+    ).properties(
+        width=700,
+        height=400,
+        title='Survival vs Death Rates Over Decades'
+    )
+
+
+# 5.
+def avg_fatalities_by_year_chart(avg_fatalities_by_year):
+    data = lttb(avg_fatalities_by_year, 'Year', 'Avg_Fatalities')
+    return alt.Chart(data).mark_line(point=True).encode(
+        x=alt.X('Year:O', title='Year'),
+        y=alt.Y('Avg_Fatalities:Q', title='Average Fatalities per Crash'),
+        tooltip=['Year:O', alt.Tooltip('Avg_Fatalities:Q', format=',.2f'), *interval_tooltips(data, 'Avg_Fatalities', ',.2f')]
+    ).properties(
+        width=700,
+        height=400,
+        title='Yearly Trend of Average Fatalities per Crash'
+    )
+
+
+# 6.
+def ground_fatalities_decade_chart(ground_fatalities_decade):
+    return alt.Chart(ground_fatalities_decade).transform_fold(
+        ['Ground', 'Fatalities (air)', 'Aboard'], as_=['Metric', 'Count']
+    ).mark_line(point=True).encode(
+        x=alt.X('Decade:N', title='Decade'),
+        y=alt.Y('Count:Q', title='Count'),
+        color=alt.Color('Metric:N', title='Metric'),
+        tooltip=['Decade:N', 'Metric:N', 'Count:Q']
+    ).properties(
+        width=700,
+        height=400,
+        title='Trend of Ground, Fatalities, and Aboard per Decade'
+    )
+
+
+# 7.
+def category_deaths_chart(category_deaths):
+    data = top_n_with_other(category_deaths, 'Category', 'Total_Fatalities')
+    return alt.Chart(data).mark_arc(innerRadius=70).encode(
+        theta=alt.Theta(field='Total_Fatalities', type='quantitative'),
+        color=alt.Color(field='Category', type='nominal', legend=alt.Legend(title="Aircraft Category")),
+        tooltip=['Category:N', 'Total_Fatalities:Q', alt.Tooltip('Percentage:Q', format='.2f')]
+    ).properties(
+        width=500,
+        height=500,
+        title='Fatalities by Aircraft Category'
+    )
+
+
+# 8.
+def manufacturer_stats_chart(manufacturer_stats):
+    rates = ['Survival_Rate', 'Death_Rate']
+    top20_manufacturers = (
+        manufacturer_stats.sort_values(by='Total_Fatalities', ascending=False, kind='stable')
+        .head(20)[['Aircraft Manufacturer', *rates, *interval_columns(manufacturer_stats, *rates)]]
+    )
+    # Stacked bar of the two rates
+    folded = alt.Chart(top20_manufacturers).transform_fold(rates, as_=['Metric', 'Rate'])
+    return fold_intervals(folded, top20_manufacturers, rates, 'Rate').mark_bar().encode(
+        x=alt.X('Rate:Q', stack='normalize', title='Rate'),
+        y=alt.Y('Aircraft Manufacturer:N', sort='-x', title='Manufacturer'),
+        color=alt.Color('Metric:N', title='Metric', scale=alt.Scale(domain=['Survival_Rate', 'Death_Rate'], range=['#2ecc71', '#e74c3c'])),
+        tooltip=['Aircraft Manufacturer:N', 'Metric:N', alt.Tooltip('Rate:Q', format='.2%'),
+                 *interval_tooltips(top20_manufacturers, 'Survival_Rate', '.2%', 'Rate')]
+    ).properties(
+        width=700,
+        height=500,
+        title='Survival vs Death Rates for Top 20 Manufacturers'
+    )
+
+
+# 9.
+def manufacturer_severity_chart(manufacturer_severity):
+    return alt.Chart(manufacturer_severity).mark_bar().encode(
+        x=alt.X('Avg_Fatalities:Q', title='Average Fatalities per Crash'),
+        y=alt.Y('Manufacturer:N', sort='-x', title='Manufacturer'),
+        color=alt.Color('Manufacturer:N', legend=None),
+        tooltip=['Manufacturer:N', alt.Tooltip('Avg_Fatalities:Q', format=',.2f'),
+                 *interval_tooltips(manufacturer_severity, 'Avg_Fatalities', ',.2f')]
+    ).properties(
+        width=700,
+        height=500,
+        title='Top 20 Manufacturers by Average Fatalities per Crash'
+    )
+
+
+# 10.
+def improvement_chart(improvement):
+    # Top 20 manufacturers with the most improvement
+    top_improvers = improvement.head(20)
+    return alt.Chart(top_improvers).mark_bar().encode(
+        x=alt.X('Aircraft Manufacturer:N', sort='-y', title='Manufacturer'),
+        y=alt.Y('Improvement:Q', title='Improvement in Survival Rate'),
+        color=alt.Color('Improvement:Q', scale=alt.Scale(scheme='greens')),
+        tooltip=['Aircraft Manufacturer', 'First_Survival_Rate', 'Last_Survival_Rate', 'Improvement',
+                 *interval_tooltips(top_improvers, 'Improvement', '.4f')]
+    ).properties(
+        title='Top 20 Aircraft Manufacturers with Most Improvement in Survival Rate',
+        width=700,
+        height=400
+    )
+
+
+# Report entry -> chart builder
+CHARTS = {
+    "quarter_cases": quarter_cases_chart,
+    "top_countries": top_countries_chart,
+    "continent_ground_fatalities": continent_ground_fatalities_chart,
+    "survival_trend": survival_trend_chart,
+    "avg_fatalities_by_year": avg_fatalities_by_year_chart,
+    "ground_fatalities_decade": ground_fatalities_decade_chart,
+    "category_deaths": category_deaths_chart,
+    "manufacturer_stats": manufacturer_stats_chart,
+    "manufacturer_severity": manufacturer_severity_chart,
+    "improvement": improvement_chart,
+}
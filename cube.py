@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+# Finest grain any dashboard question or sidebar filter needs
+CUBE_DIMENSIONS = ["Quarter", "Country", "Continent", "Decade", "Aircraft Category", "Year", "Aircraft Manufacturer"]
+CUBE_MEASURES = ["Aboard", "Fatalities (air)", "Ground"]
+
+
+def stat_column(measure, stat):
+    return f"{measure}_{stat}"
+
+
+def build_cube(air):
+    """Pre-aggregate the crash table to one row per combination of CUBE_DIMENSIONS.
+
+    Each cell holds the crash count plus sum, count and sum of squares of every
+    measure. All of them are additive, so any coarser grouping is a plain sum
+    over cells.
+    """
+    # The crash table stores counts in the smallest integer type; sums need the full width
+    measures = {m: air[m].astype("int64") if air[m].dtype.kind in "iu" else air[m] for m in CUBE_MEASURES}
+    squares = {stat_column(m, "sq"): air[m].astype("float64") ** 2 for m in CUBE_MEASURES}
+    aggregations = {"Crashes": (CUBE_MEASURES[0], "size")}
+    for m in CUBE_MEASURES:
+        aggregations[stat_column(m, "sum")] = (m, "sum")
+        aggregations[stat_column(m, "count")] = (m, "count")
+        aggregations[stat_column(m, "sumsq")] = (stat_column(m, "sq"), "sum")
+
+    cube = (
+        air[CUBE_DIMENSIONS + CUBE_MEASURES]
+        .assign(**measures, **squares)
+        .groupby(CUBE_DIMENSIONS, sort=False, dropna=False, observed=True)
+        .agg(**aggregations)
+        .reset_index()
+    )
+    return encode_cube(cube)
+
+
+def encode_cube(cube):
+    """Sorted categorical dimensions, so roll-ups reduce over the codes in groupby key order.
+
+    Also restores the encoding after a Parquet round trip.
+    """
+    for d in CUBE_DIMENSIONS:
+        cube[d] = pd.Categorical(np.asarray(cube[d]))
+    return cube
+
+
+def _decode(cube):
+    return cube.assign(**{d: np.asarray(cube[d]) for d in CUBE_DIMENSIONS})
+
+
+def update_cube(cube, removed, added):
+    """Apply removed and added crash rows to an existing cube without going back to the raw table.
+
+    Cost depends on the number of cells, not crashes; cells whose last crash was
+    removed are dropped.
+    """
+    stats = [c for c in cube.columns if c not in CUBE_DIMENSIONS]
+    parts = [_decode(cube)]
+    if len(removed):
+        negated = _decode(build_cube(removed))
+        negated[stats] = -negated[stats]
+        parts.append(negated)
+    if len(added):
+        parts.append(_decode(build_cube(added)))
+    if len(parts) == 1:
+        return cube
+
+    updated = (
+        pd.concat(parts, ignore_index=True)
+        .groupby(CUBE_DIMENSIONS, sort=False, dropna=False)[stats]
+        .sum()
+        .reset_index()
+    )
+    return encode_cube(updated[updated["Crashes"] > 0].reset_index(drop=True))
+
+
+def _group_codes(cube, by):
+    """Dense group code per cell plus the key values of every possible group."""
+    codes = None
+    keys = []
+    for d in by:
+        categories = cube[d].cat.categories
+        d_codes = cube[d].cat.codes.to_numpy().astype(np.int64)
+        codes = d_codes if codes is None else codes * len(categories) + d_codes
+        keys.append(categories)
+    return codes, keys
+
+
+def rollup(cube, by, columns=None):
+    """Sum cube cells up to the ``by`` grouping, sorted by group key like a plain groupby.
+
+    Uses np.bincount over the categorical codes instead of hashing the keys on every call.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    stats = [c for c in cube.columns if c not in CUBE_DIMENSIONS] if columns is None else columns
+
+    codes, keys = _group_codes(cube, by)
+    shape = [len(k) for k in keys]
+    n_groups = int(np.prod(shape))
+    present = np.flatnonzero(np.bincount(codes, minlength=n_groups))
+
+    rolled = {}
+    for d, d_keys, positions in zip(by, keys, np.unravel_index(present, shape)):
+        rolled[d] = np.asarray(d_keys)[positions]
+    for c in stats:
+        sums = np.bincount(codes, weights=cube[c].to_numpy(), minlength=n_groups)[present]
+        rolled[c] = sums.astype(cube[c].dtype) if cube[c].dtype.kind in "iu" else sums
+    return pd.DataFrame(rolled, columns=by + stats)
+
+
+def measure_mean(rolled, measure):
+    return rolled[stat_column(measure, "sum")] / rolled[stat_column(measure, "count")]
@@ -0,0 +1,447 @@
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from cube import build_cube, encode_cube
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(BASE_DIR, "Cleaned_aircrashes_dataset.xlsx")
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+PARQUET_PATH = os.path.join(CACHE_DIR, "aircrashes.parquet")
+META_PATH = os.path.join(CACHE_DIR, "aircrashes.meta.json")
+CUBE_PATH = os.path.join(CACHE_DIR, "cube.parquet")
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, "snapshots")
+# Names the snapshot every worker process should map
+SNAPSHOT_POINTER = os.path.join(SNAPSHOT_DIR, "CURRENT.json")
+SNAPSHOTS_KEPT = 2
+# The store split into Decade=<decade>/ directories, for reads scoped to a time range
+DATASET_DIR = os.path.join(CACHE_DIR, "partitions")
+PARTITION_COLUMN = "Decade"
+# Names the current tree of a partitioned store; older trees stay for readers still scanning them
+TREE_POINTER = "CURRENT.json"
+TREES_KEPT = 2
+# Column types of the files in a partition tree (the partition column lives in the paths),
+# whichever writer produced them
+PARTITION_SCHEMA = pa.schema([
+    ("Quarter", pa.string()), ("Country", pa.string()), ("Aircraft Manufacturer", pa.string()),
+    ("Operator", pa.string()), ("Ground", pa.int32()), ("Fatalities (air)", pa.int32()),
+    ("Aboard", pa.int32()), ("Continent", pa.string()), ("Date", pa.timestamp("ns")),
+    ("Aircraft Category", pa.string()), ("Year", pa.int32()), ("Aircraft", pa.string()),
+])
+
+TEXT_COLUMNS = ["Quarter", "Country", "Aircraft Manufacturer", "Operator", "Continent", "Aircraft Category", "Decade", "Aircraft"]
+INTEGER_COLUMNS = ["Aboard", "Fatalities (air)", "Ground", "Year"]
+
+# One parsed copy of the dataset per process, shared by every Streamlit session
+_lock = threading.Lock()
+_loaded = {}
+_partition_lock = threading.Lock()
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_meta():
+    try:
+        with open(META_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(meta):
+    tmp_path = f"{META_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, META_PATH)
+
+
+def _prepare(air):
+    # Column fixes that mine.py used to apply on every rerun
+    air['Year'] = air['Date'].dt.year
+    return air.rename(columns={
+        "Country Only": "Country",
+        "decade": "Decade"
+    })
+
+
+def compact(air):
+    """Categorical text columns and the smallest integer type that fits each count column.
+
+    About a sixth of the object-dtype table. Parquet keeps the categories, so the
+    store only needs compacting once; running it again is cheap.
+    """
+    air = air.astype({c: "category" for c in TEXT_COLUMNS if c in air and air[c].dtype != "category"})
+    for c in INTEGER_COLUMNS:
+        if c in air and air[c].dtype.kind in "iu":
+            air[c] = pd.to_numeric(air[c], downcast="integer")
+    return air
+
+
+def _build_cache(source):
+    air = compact(_prepare(pd.read_excel(source)))
+    _write_parquet(air, PARQUET_PATH)
+    return air
+
+
+def _write_parquet(frame, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    frame.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _source_signature(source):
+    stat = os.stat(source)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _timestamp(seconds):
+    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).isoformat(timespec="seconds")
+
+
+def _store_mtime():
+    try:
+        return os.stat(PARQUET_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _pointer_mtime():
+    try:
+        return os.stat(SNAPSHOT_POINTER).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_pointer():
+    try:
+        with open(SNAPSHOT_POINTER, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def publish_snapshot(air, version):
+    """Write ``air`` as an uncompressed Arrow IPC file and atomically point every worker at it.
+
+    Snapshots are immutable and named after the dataset version. Readers that
+    still map an older one keep it until they reload; only the last
+    SNAPSHOTS_KEPT files stay on disk.
+    """
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    name = f"air-{version[:16]}.arrow"
+    path = os.path.join(SNAPSHOT_DIR, name)
+    if not os.path.exists(path):
+        # Per-process temporary names: several workers may publish the same version at once
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        table = pa.Table.from_pandas(air, preserve_index=False)
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    _write_pointer(SNAPSHOT_POINTER, {"file": name, "version": version})
+    _prune_snapshots(name)
+
+
+def _write_pointer(path, payload):
+    # Per-process temporary name, then one rename: readers see the old pointer or the new one
+    tmp_pointer = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_pointer, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_pointer, path)
+
+
+def _prune_snapshots(current):
+    snapshots = sorted(
+        (entry for entry in os.scandir(SNAPSHOT_DIR) if entry.name.endswith(".arrow") and entry.name != current),
+        key=lambda entry: entry.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in snapshots[SNAPSHOTS_KEPT - 1:]:
+        try:
+            # Processes that still map the file keep reading it after the unlink
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _map_snapshot(name):
+    """Memory-map a snapshot read-only; its number and date columns stay backed by the page cache."""
+    source = pa.memory_map(os.path.join(SNAPSHOT_DIR, name), "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def _signature(source):
+    return (_source_signature(source), _store_mtime(), _pointer_mtime())
+
+
+def needs_reload(source=SOURCE_PATH):
+    """True when the workbook, the store or the published snapshot changed since the last load_air()."""
+    try:
+        signature = _signature(source)
+    except OSError:
+        # The workbook is being replaced; check again later
+        return False
+    with _lock:
+        return _loaded.get("signature") != signature
+
+
+def load_air(source=SOURCE_PATH):
+    """Return the cleaned crash table, converting the workbook to Parquet only when it changes.
+
+    Records appended by ingest.py live in the Parquet store on top of the workbook;
+    replacing the workbook itself rebuilds the store from it. Every worker process
+    maps the same Arrow snapshot of the store, so the OS holds one physical copy,
+    and picks up a newly published snapshot on its next call. The returned frame
+    is shared between sessions and must not be modified in place.
+    """
+    signature = _signature(source)
+
+    with _lock:
+        if _loaded.get("signature") == signature:
+            return _loaded["air"]
+
+        source_signature = signature[0]
+        meta = _read_meta()
+        cache_exists = signature[1] is not None
+        air = None
+
+        if not cache_exists or {k: meta.get(k) for k in source_signature} != source_signature:
+            digest = _file_hash(source)
+            if not cache_exists or meta.get("sha256") != digest:
+                air = _build_cache(source)
+                meta = {"version": digest, "as_of": _timestamp(os.stat(source).st_mtime)}
+            meta.update(source_signature, sha256=digest)
+            _write_meta(meta)
+
+        version = meta.get("version", meta["sha256"])
+        if _read_pointer().get("version") != version:
+            if air is None:
+                air = compact(pd.read_parquet(PARQUET_PATH))
+            publish_snapshot(air, version)
+        air = _map_snapshot(_read_pointer()["file"])
+
+        signature = (source_signature, _store_mtime(), _pointer_mtime())
+        as_of = meta.get("as_of") or _timestamp(os.stat(PARQUET_PATH).st_mtime)
+        _loaded.update(signature=signature, version=version, as_of=as_of, air=air)
+        return air
+
+
+def dataset_version():
+    """Content hash of the dataset currently held in memory."""
+    with _lock:
+        return _loaded.get("version")
+
+
+def cached_version(source=SOURCE_PATH):
+    """Version of the converted store if it is up to date with the workbook, else None.
+
+    Only stats the workbook and reads the metadata file: no hashing and no
+    Parquet, so it is cheap enough for the first paint.
+    """
+    try:
+        source_signature = _source_signature(source)
+    except OSError:
+        return None
+    meta = _read_meta()
+    if not os.path.exists(PARQUET_PATH) or {k: meta.get(k) for k in source_signature} != source_signature:
+        return None
+    return meta.get("version")
+
+
+def dataset_as_of():
+    """When the dataset held in memory last changed: the workbook's mtime, or the last ingest."""
+    with _lock:
+        as_of = _loaded.get("as_of")
+    return datetime.datetime.fromisoformat(as_of) if as_of else None
+
+
+def save_air(air):
+    """Replace the Parquet store and the mapped snapshot with ``air``; returns the new dataset version."""
+    air = compact(air)
+    with _lock:
+        _write_parquet(air, PARQUET_PATH)
+        version = _file_hash(PARQUET_PATH)
+        meta = _read_meta()
+        meta.update(version=version, as_of=_timestamp(os.stat(PARQUET_PATH).st_mtime))
+        _write_meta(meta)
+        publish_snapshot(air, version)
+        return version
+
+
+def publish_tree(root, build, version=""):
+    """Build a new tree of a partitioned store under ``root`` and atomically point readers at it.
+
+    ``build(path)`` writes the whole tree into ``path``. Trees are immutable and
+    published under ``root/tree-<n>/`` by replacing the ``root/CURRENT.json``
+    pointer, like the Arrow snapshots, so a reader always finds a complete tree:
+    the current one, or the one it resolved before the swap. Only the last
+    TREES_KEPT trees stay on disk. Returns what ``build`` returns.
+    """
+    os.makedirs(root, exist_ok=True)
+    name = f"tree-{time.time_ns()}-{os.getpid()}"
+    # Built under a name pruning ignores, then renamed into place when complete
+    tmp_path = os.path.join(root, f"{name}.tmp")
+    try:
+        result = build(tmp_path)
+        os.replace(tmp_path, os.path.join(root, name))
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    _write_pointer(os.path.join(root, TREE_POINTER), {"tree": name, "version": version})
+    _prune_trees(root, name)
+    return result
+
+
+def _prune_trees(root, current):
+    trees = sorted(
+        (entry for entry in os.scandir(root)
+         if entry.is_dir() and entry.name.startswith("tree-") and not entry.name.endswith(".tmp")
+         and entry.name != current),
+        key=lambda entry: entry.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in trees[TREES_KEPT - 1:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _read_tree_pointer(root):
+    try:
+        with open(os.path.join(root, TREE_POINTER), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def current_tree(root):
+    """Directory of the tree ``root`` currently points at; ``root`` itself for an unversioned tree."""
+    tree = _read_tree_pointer(root).get("tree")
+    return os.path.join(root, tree) if tree else root
+
+
+def partition_table(frame):
+    """The columns of ``frame`` a partition file holds, as PARTITION_SCHEMA; missing ones are null."""
+    return pa.Table.from_pandas(frame.reindex(columns=PARTITION_SCHEMA.names), preserve_index=False).cast(PARTITION_SCHEMA)
+
+
+def write_partitions(air, root=DATASET_DIR, version=""):
+    """Publish ``air`` as a new tree of Parquet files partitioned by decade."""
+    table = partition_table(air).append_column(PARTITION_COLUMN, pa.array(air[PARTITION_COLUMN].astype(str)))
+    publish_tree(root, lambda path: ds.write_dataset(
+        table,
+        path,
+        format="parquet",
+        partitioning=[PARTITION_COLUMN],
+        partitioning_flavor="hive",
+    ), version)
+
+
+def store_from_partitions(root=DATASET_DIR, columns=None):
+    """Replace the Parquet store with the current tree under ``root``, one record batch at a time.
+
+    For trees too large to load at once, such as a streamed ingest: memory stays
+    bounded by the batch size. The tree is stamped with the store's new version,
+    so load_crashes keeps reading it rather than rewriting it from the store.
+    Returns the new dataset version.
+    """
+    tree = current_tree(root)
+    scanner = ds.dataset(tree, format="parquet", partitioning="hive").scanner(columns=columns)
+    with _lock:
+        tmp_path = f"{PARQUET_PATH}.{os.getpid()}.tmp"
+        with pq.ParquetWriter(tmp_path, scanner.projected_schema) as writer:
+            for batch in scanner.to_batches():
+                writer.write_batch(batch)
+        os.replace(tmp_path, PARQUET_PATH)
+        version = _file_hash(PARQUET_PATH)
+        meta = _read_meta()
+        meta.update(version=version, as_of=_timestamp(os.stat(PARQUET_PATH).st_mtime))
+        _write_meta(meta)
+        _write_pointer(os.path.join(root, TREE_POINTER), {"tree": os.path.basename(tree), "version": version})
+        return version
+
+
+def _partitions_version(root):
+    return _read_tree_pointer(root).get("version")
+
+
+def decade_label(year):
+    return f"{int(year) // 10 * 10}s"
+
+
+def read_partitions(root, decades=None, years=None):
+    """Rows of a decade-partitioned store matching the Decade and Year selections.
+
+    Only the directories of the selected decades (and of the decades the
+    selected years fall in) are opened; the Year filter is then applied while
+    scanning them.
+    """
+    wanted = set(decades) if decades else None
+    if years:
+        year_decades = {decade_label(y) for y in years}
+        wanted = year_decades if wanted is None else wanted & year_decades
+
+    dataset = ds.dataset(current_tree(root), format="parquet", partitioning="hive")
+    if wanted is not None and not wanted:
+        # The selected years lie outside the selected decades
+        return dataset.schema.empty_table().to_pandas()
+    expression = None
+    if wanted is not None:
+        expression = ds.field(PARTITION_COLUMN).isin(sorted(wanted))
+    if years:
+        year_filter = ds.field("Year").isin([int(y) for y in years])
+        expression = year_filter if expression is None else expression & year_filter
+    return dataset.to_table(filter=expression).to_pandas()
+
+
+def load_crashes(decades=None, years=None):
+    """Crash rows for the selected decades and/or years, reading only their partitions.
+
+    Without a time filter this is load_air() itself, the mapped full table. The
+    partitioned copy is rewritten from the store whenever the dataset version
+    changes.
+    """
+    air = load_air()
+    if not decades and not years:
+        return air
+
+    version = dataset_version()
+    with _partition_lock:
+        if _partitions_version(DATASET_DIR) != version:
+            write_partitions(air, DATASET_DIR, version)
+    rows = read_partitions(DATASET_DIR, decades, years)
+    return compact(rows[[c for c in air.columns if c in rows]])
+
+
+def load_cube():
+    """Pre-aggregated cube for the current dataset, rebuilt only when the version changes."""
+    air = load_air()
+    version = dataset_version()
+    if _read_meta().get("cube_version") == version and os.path.exists(CUBE_PATH):
+        return encode_cube(pd.read_parquet(CUBE_PATH))
+    cube = build_cube(air)
+    save_cube(cube, version)
+    return cube
+
+
+def save_cube(cube, version):
+    with _lock:
+        _write_parquet(cube, CUBE_PATH)
+        meta = _read_meta()
+        meta["cube_version"] = version
+        _write_meta(meta)
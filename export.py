@@ -0,0 +1,202 @@
+"""Static exports of the report for a list of filter combinations.
+
+    python export.py [--by Continent "Aircraft Category"] [--totals] [--formats html csv png]
+    python export.py --selections weekly.json [--output exports] [--workers 4]
+
+Renders the KPIs and the ten charts of the dashboard for each selection, one
+directory per selection plus an index.html linking them. By default the
+selections are every combination of one value of each --by column (--totals
+adds "all values" for each column too); --selections reads a JSON list of
+{column: [values]} objects instead.
+
+The cube is built once and handed to each pool worker once; the manufacturer
+tables come from the precomputed store whenever it covers a selection. PNG
+output needs vl-convert-python.
+"""
+import argparse
+import html
+import itertools
+import json
+import os
+import re
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import altair as alt
+import pandas as pd
+
+import data_loader
+from charts import CHARTS
+from filters import FilterEngine
+from precompute import PrecomputedTables
+from report import compute_report
+from result_cache import filter_key
+
+FORMATS = ["html", "csv", "png"]
+EXPORT_DIR = "exports"
+
+KPI_LABELS = {
+    "Total_People_aboard": "People aboard",
+    "Total_Air_Fatalities": "Air fatalities",
+    "Total_Ground_Cases": "Ground fatalities",
+    "Countries": "Countries",
+    "Aircraft_Manufacturers": "Aircraft manufacturers",
+    "Total_survivors": "Survivors",
+    "Total_deaths": "Total deaths",
+}
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="https://cdn.jsdelivr.net/npm/vega@{vega}"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@{vegalite}"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@{vegaembed}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #333333; }}
+h1 {{ color: #1f77b4; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+td, th {{ padding: 4px 12px; border-bottom: 1px solid #dddddd; text-align: left; }}
+.chart {{ margin-bottom: 2em; }}
+</style>
+</head>
+<body>
+<h1>✈ {title}</h1>
+<p>Data as of {as_of}</p>
+{body}
+</body>
+</html>
+"""
+
+
+def selection_label(selection):
+    parts = [f"{col}: {', '.join(str(v) for v in values)}" for col, values in selection.items() if len(values)]
+    return "; ".join(parts) or "All crashes"
+
+
+def selection_slug(selection):
+    # Column names included: the same value can appear in two columns (e.g. "Unknown")
+    parts = [f"{col}-{'-'.join(str(v) for v in values)}" for col, values in selection.items() if len(values)]
+    return "_".join(re.sub(r"[^0-9A-Za-z]+", "-", part).strip("-").lower() for part in parts) or "all"
+
+
+def grid_selections(engine, columns, totals=False):
+    """One value of each of ``columns`` at a time, plus "all values" with ``totals``."""
+    choices = [([None] if totals else []) + list(engine.options[col]) for col in columns]
+    for values in itertools.product(*choices):
+        yield {col: [] if value is None else [value] for col, value in zip(columns, values)}
+
+
+def _page(title, as_of, kpis, report):
+    rows = "\n".join(f"<tr><th>{label}</th><td>{kpis[k]:,}</td></tr>" for k, label in KPI_LABELS.items())
+    body = [f"<table>\n{rows}\n</table>"]
+    for i, name in enumerate(CHARTS, start=1):
+        spec = CHARTS[name](report[name]).to_json(indent=None)
+        body.append(f'<div class="chart" id="q{i}"></div>\n'
+                    f'<script>vegaEmbed("#q{i}", {spec}, {{"actions": false}});</script>')
+    return PAGE.format(
+        title=html.escape(title), as_of=as_of, body="\n".join(body),
+        vega=alt.VEGA_VERSION, vegalite=alt.VEGALITE_VERSION, vegaembed=alt.VEGAEMBED_VERSION,
+    )
+
+
+# Set in each pool worker by _init_worker, so the cube is pickled once per process
+_worker = {}
+
+
+def _init_worker(cube, version, as_of, output, formats):
+    # Selections that match no crash give empty charts; Altair warns about each one
+    warnings.filterwarnings("ignore", message="I don't know how to infer vegalite type", category=UserWarning)
+    _worker.update(
+        cube=cube, engine=FilterEngine(cube), precomputed=PrecomputedTables(version),
+        as_of=as_of, output=output, formats=formats,
+    )
+
+
+def export_selection(selection):
+    """Write one selection's files; returns (slug, label, kpis)."""
+    cube, engine, formats = _worker["cube"], _worker["engine"], _worker["formats"]
+    view = engine.apply(cube, selection)
+    report = compute_report(view, precomputed=_worker["precomputed"].lookup(filter_key(selection)))
+    kpis = {k: int(v) for k, v in report["kpis"].items()}
+
+    slug, label = selection_slug(selection), selection_label(selection)
+    directory = os.path.join(_worker["output"], slug)
+    os.makedirs(directory, exist_ok=True)
+    if "html" in formats:
+        with open(os.path.join(directory, "index.html"), "w", encoding="utf-8") as f:
+            f.write(_page(f"Aircraft Safety Insights Report: {label}", _worker["as_of"], kpis, report))
+    if "csv" in formats:
+        pd.DataFrame([kpis]).to_csv(os.path.join(directory, "kpis.csv"), index=False)
+        for name in CHARTS:
+            report[name].to_csv(os.path.join(directory, f"{name}.csv"), index=False)
+    if "png" in formats:
+        for i, name in enumerate(CHARTS, start=1):
+            CHARTS[name](report[name]).save(os.path.join(directory, f"q{i:02d}_{name}.png"))
+    return slug, label, kpis
+
+
+def export(cube, version, as_of, selections, output=EXPORT_DIR, formats=("html", "csv"), workers=None):
+    """Export every selection over a process pool and write the index; returns the number exported."""
+    # Selections differing only in filter or value order produce the same files
+    unique = list({filter_key(s): s for s in selections}.values())
+    os.makedirs(output, exist_ok=True)
+
+    initargs = (cube, version, as_of, output, tuple(formats))
+    chunksize = max(1, len(unique) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        exported = list(pool.map(export_selection, unique, chunksize=chunksize))
+
+    rows = "\n".join(
+        f'<tr><td><a href="{slug}/index.html">{html.escape(label)}</a></td>'
+        f"<td>{kpis['Total_Air_Fatalities']:,}</td><td>{kpis['Total_deaths']:,}</td></tr>"
+        for slug, label, kpis in exported
+    )
+    table = f"<table>\n<tr><th>Selection</th><th>Air fatalities</th><th>Total deaths</th></tr>\n{rows}\n</table>"
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(PAGE.format(title="Aircraft Safety Insights Report exports", as_of=as_of, body=table,
+                            vega=alt.VEGA_VERSION, vegalite=alt.VEGALITE_VERSION, vegaembed=alt.VEGAEMBED_VERSION))
+    return len(exported)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--by", nargs="+", default=["Continent", "Aircraft Category"],
+                        help="filter columns to export one value of at a time")
+    parser.add_argument("--totals", action="store_true", help='also export "all values" of each --by column')
+    parser.add_argument("--selections", help="JSON file with a list of {column: [values]} selections")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=["html", "csv"])
+    parser.add_argument("--output", default=EXPORT_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: one per CPU)")
+    args = parser.parse_args()
+
+    if "png" in args.formats:
+        try:
+            import vl_convert  # noqa: F401
+        except ImportError:
+            parser.error("PNG export needs vl-convert-python (pip install vl-convert-python)")
+
+    start = time.perf_counter()
+    cube = data_loader.load_cube()
+    version = data_loader.dataset_version()
+    as_of = f"{data_loader.dataset_as_of():%Y-%m-%d %H:%M} UTC"
+    engine = FilterEngine(cube)
+
+    if args.selections:
+        with open(args.selections, encoding="utf-8") as f:
+            selections = [{col: list(values) for col, values in s.items()} for s in json.load(f)]
+        unknown = {col for s in selections for col in s} - set(engine.options)
+    else:
+        unknown = set(args.by) - set(engine.options)
+        selections = list(grid_selections(engine, args.by, args.totals))
+    if unknown:
+        parser.error(f"unknown filter columns: {', '.join(sorted(unknown))}; choose from {', '.join(engine.options)}")
+
+    count = export(cube, version, as_of, selections, args.output, args.formats, args.workers)
+    print(f"Exported {count} selections to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
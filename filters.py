@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ["Quarter", "Country", "Continent", "Decade", "Aircraft Category", "Year"]
+
+
+class FilterEngine:
+    """Resolves sidebar selections to a single row mask over integer-encoded filter columns.
+
+    Every filter column is factorized once. A selection then becomes a boolean
+    lookup table per dimension that is gathered through the row codes: values
+    are OR-ed within a dimension and dimensions are AND-ed together, without
+    building any intermediate DataFrame.
+    """
+
+    def __init__(self, frame, columns=FILTER_COLUMNS):
+        self.n_rows = len(frame)
+        self.codes = {}
+        self.options = {}
+        self._positions = {}
+
+        for col in columns:
+            # Same value order as Series.unique(), so the multiselects look unchanged
+            codes, uniques = pd.factorize(frame[col], use_na_sentinel=False)
+            self.codes[col] = codes.astype(np.min_scalar_type(max(len(uniques) - 1, 0)))
+            self.options[col] = np.asarray(uniques)
+            self._positions[col] = {value: i for i, value in enumerate(uniques)}
+
+    def value_codes(self, col, values):
+        """Codes of ``values`` in one column, skipping values it doesn't have."""
+        positions = self._positions[col]
+        return [positions[value] for value in values if value in positions]
+
+    def value_table(self, col, values):
+        """Boolean table indexed by code, True for the selected values of one column."""
+        wanted = np.zeros(len(self.options[col]), dtype=bool)
+        wanted[self.value_codes(col, values)] = True
+        return wanted
+
+    def mask(self, selected_filters):
+        """Row mask for a {column: [values]} selection; empty selections match everything."""
+        mask = np.ones(self.n_rows, dtype=bool)
+        for col, values in selected_filters.items():
+            if len(values):
+                mask &= self.value_table(col, values)[self.codes[col]]
+        return mask
+
+    def apply(self, frame, selected_filters):
+        """Rows of ``frame`` (the frame the engine was built from) matching the selection."""
+        if not any(len(values) for values in selected_filters.values()):
+            return frame
+        return frame[self.mask(selected_filters)]
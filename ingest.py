@@ -0,0 +1,219 @@
+"""Cleaning pipeline for raw crash feeds, appending only new or changed records.
+
+    python ingest.py aircrahesFullDataUpdated_2024.csv
+    python ingest.py --stream merged_history.csv [--chunksize 100000]
+
+Performs the same steps as Project_data_cleaning.ipynb, then upserts the cleaned
+records into the Parquet store used by the dashboard and patches the
+pre-aggregated cube, instead of rewriting the whole workbook.
+
+With --stream, a full history too large for memory is read and cleaned in
+bounded batches, published as the decade-partitioned store data_loader reads
+time-scoped rows from, and then copied batch by batch into the Parquet store
+in place of its current contents, without the upsert.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+import data_loader
+from cube import update_cube
+from mappings import (
+    COUNTRY_FIXES,
+    COUNTRY_MAP,
+    COUNTRY_TO_CONTINENT,
+    MANUFACTURER_STANDARD,
+    MANUFACTURER_TO_CATEGORY,
+)
+from normalize import LookupTable, build_dates, decade_labels, map_values, transform_unique
+
+# A crash is identified by when it happened, who operated it and what aircraft it was
+RECORD_KEY = ["Date", "Operator", "Aircraft"]
+# Rows built from the workbook have no Aircraft column; match those on the manufacturer instead
+LEGACY_KEY = ["Date", "Operator", "Aircraft Manufacturer"]
+
+STORE_COLUMNS = [
+    "Quarter", "Country", "Aircraft Manufacturer", "Operator", "Ground", "Fatalities (air)",
+    "Aboard", "Continent", "Date", "Aircraft Category", "Decade", "Year", "Aircraft",
+]
+
+# Raw feed columns the cleaning steps use; text is read as text in every batch
+RAW_DTYPES = {
+    "Year": "int64", "Quarter": str, "Month": str, "Day": "int64", "Country/Region": str,
+    "Aircraft Manufacturer": str, "Aircraft": str, "Operator": str,
+    "Ground": "int64", "Fatalities (air)": "int64", "Aboard": "int64",
+}
+PARTITION_COLUMN = data_loader.PARTITION_COLUMN
+
+
+# Mapping dicts compiled once into code tables
+COUNTRY_FIX_TABLE = LookupTable(COUNTRY_FIXES)
+COUNTRY_TABLE = LookupTable(COUNTRY_MAP)
+CONTINENT_TABLE = LookupTable(COUNTRY_TO_CONTINENT, default="Unknown")
+MANUFACTURER_TABLE = LookupTable(MANUFACTURER_STANDARD)
+CATEGORY_TABLE = LookupTable(MANUFACTURER_TO_CATEGORY, default="Unknown")
+
+
+def _clean_country(uniques):
+    country = pd.Series(uniques, dtype=object).fillna("Unknown").replace("'-", 'Unknown').str.strip()
+    return COUNTRY_TABLE.lookup(COUNTRY_FIX_TABLE.lookup(country))
+
+
+def clean_crashes(raw):
+    """Clean a raw crash feed into the dashboard's schema (the notebook's steps).
+
+    Text rules run once per distinct value (see normalize.py), so the cost grows
+    with the number of distinct spellings rather than the number of rows.
+    """
+    air = pd.DataFrame(index=raw.index)
+    air['Quarter'] = raw['Quarter']
+    air['Country'] = transform_unique(raw['Country/Region'], _clean_country)
+    air['Aircraft Manufacturer'] = map_values(raw['Aircraft Manufacturer'], MANUFACTURER_TABLE)
+    air['Operator'] = transform_unique(raw['Operator'], lambda u: pd.Series(u, dtype=object).fillna("Unknown"))
+    for col in ['Ground', 'Fatalities (air)', 'Aboard']:
+        air[col] = raw[col]
+
+    air['Continent'] = map_values(air['Country'], CONTINENT_TABLE)
+    air['Date'] = build_dates(raw['Year'], raw['Month'], raw['Day'])
+    air['Aircraft Category'] = map_values(air['Aircraft Manufacturer'], CATEGORY_TABLE)
+
+    air['Decade'] = decade_labels(raw['Year'])
+    air['Year'] = air['Date'].dt.year
+    air['Aircraft'] = transform_unique(raw['Aircraft'], lambda u: pd.Series(u, dtype=object).str.replace('?', '', regex=False))
+    return air[STORE_COLUMNS]
+
+
+def _match(stored, new, key):
+    """Position in ``stored`` of the row sharing ``key`` with each new record (-1 when none)."""
+    positions = (
+        stored[key].reset_index(drop=True).reset_index()
+        .drop_duplicates(key)
+        .rename(columns={"index": "_stored"})
+    )
+    matched = new[key].merge(positions, on=key, how="left")["_stored"]
+    return matched.fillna(-1).astype(int).to_numpy()
+
+
+def merge_records(stored, new):
+    """Upsert cleaned records into the stored table.
+
+    Returns ``(updated, removed, added)``: the new table, the stored rows that were
+    replaced and the records that were inserted. Records identical to the stored
+    version are skipped.
+    """
+    if "Aircraft" not in stored:
+        stored = stored.assign(Aircraft=None)
+    stored = stored.reset_index(drop=True)
+    new = new.drop_duplicates(RECORD_KEY, keep="last").reset_index(drop=True)
+
+    matched = _match(stored, new, RECORD_KEY)
+    legacy = stored[stored["Aircraft"].isna()]
+    if len(legacy):
+        legacy_matched = _match(legacy, new, LEGACY_KEY)
+        unmatched = (matched < 0) & (legacy_matched >= 0)
+        matched[unmatched] = legacy.index.to_numpy()[legacy_matched[unmatched]]
+
+    # Two new records can't replace the same stored row
+    claimed = pd.Series(matched).duplicated() & (matched >= 0)
+    matched[claimed.to_numpy()] = -1
+
+    has_match = matched >= 0
+    previous = stored.iloc[matched[has_match]].reset_index(drop=True)
+    current = new[has_match].reset_index(drop=True)
+    unchanged = previous[STORE_COLUMNS].astype(object).eq(current[STORE_COLUMNS].astype(object)).all(axis=1).to_numpy()
+
+    changed = has_match.copy()
+    changed[has_match] = ~unchanged
+    insert = ~has_match | changed
+
+    removed = stored.iloc[matched[changed]]
+    added = new[insert]
+    # Store text as plain strings, like the rows loaded from the workbook
+    added_text = added.astype({c: object for c in added.select_dtypes("category").columns})
+    kept = stored.drop(index=removed.index)
+    updated = pd.concat([kept, added_text], ignore_index=True) if len(added_text) else kept
+    return updated, removed, added
+
+
+def iter_clean_batches(path, chunksize=100_000):
+    """Yield the raw feed at ``path`` cleaned ``chunksize`` rows at a time."""
+    with pd.read_csv(path, usecols=list(RAW_DTYPES), dtype=RAW_DTYPES, chunksize=chunksize) as reader:
+        for raw in reader:
+            yield clean_crashes(raw)
+
+
+def write_partitioned(batches, root=data_loader.DATASET_DIR):
+    """Write cleaned batches as ``Decade=<decade>/part-0.parquet`` files, one row group per batch.
+
+    Only one batch is held at a time, so memory stays flat however long the
+    feed is. The files, in data_loader.PARTITION_SCHEMA, form a new tree under
+    ``root`` published when complete (see data_loader.publish_tree), the same
+    layout write_partitions produces. Returns the number of rows written.
+    """
+    return data_loader.publish_tree(root, lambda path: _write_batches(batches, path))
+
+
+def _write_batches(batches, root):
+    writers = {}
+    rows = 0
+    try:
+        for batch in batches:
+            table = data_loader.partition_table(batch)
+            codes, decades = pd.factorize(batch[PARTITION_COLUMN])
+            for i, decade in enumerate(decades):
+                writer = writers.get(decade)
+                if writer is None:
+                    part_dir = os.path.join(root, f"{PARTITION_COLUMN}={decade}")
+                    os.makedirs(part_dir)
+                    writer = writers[decade] = pq.ParquetWriter(
+                        os.path.join(part_dir, "part-0.parquet"), data_loader.PARTITION_SCHEMA)
+                writer.write_table(table.take(np.flatnonzero(codes == i)))
+            rows += len(batch)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
+
+
+def stream_records(path, chunksize=100_000):
+    """Clean the full history at ``path`` in batches and make it the store. Returns (rows, version)."""
+    rows = write_partitioned(iter_clean_batches(path, chunksize))
+    return rows, data_loader.store_from_partitions(columns=STORE_COLUMNS)
+
+
+def append_records(raw):
+    """Clean ``raw``, upsert it into the store and patch the cube. Returns (n_added, n_replaced)."""
+    stored = data_loader.load_air()
+    cube = data_loader.load_cube()
+
+    updated, removed, added = merge_records(stored, clean_crashes(raw))
+    if not len(added):
+        return 0, 0
+
+    version = data_loader.save_air(updated[STORE_COLUMNS])
+    data_loader.save_cube(update_cube(cube, removed, added), version)
+    return len(added) - len(removed), len(removed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append new or changed crash records from a raw CSV feed.")
+    parser.add_argument("csv", help="raw crash feed, e.g. aircrahesFullDataUpdated_2024.csv")
+    parser.add_argument("--stream", action="store_true",
+                        help="replace the store with the feed, cleaned in batches through the decade partitions")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per batch with --stream")
+    args = parser.parse_args()
+
+    if args.stream:
+        rows, version = stream_records(args.csv, args.chunksize)
+        print(f"{rows} records written to {data_loader.DATASET_DIR}; store version {version[:16]}")
+        return
+
+    inserted, replaced = append_records(pd.read_csv(args.csv))
+    print(f"{inserted} new and {replaced} updated records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import numpy as np
+
+from cube import stat_column
+from report import AIR
+
+KPI_MEASURES = ["Aboard", AIR, "Ground"]
+DISTINCT_COLUMNS = ["Country", "Aircraft Manufacturer"]
+
+
+class KPIEngine:
+    """The seven headline KPIs, updated by deltas as filter values are toggled one at a time.
+
+    For the filter column a session is editing, the engine keeps one row of
+    partial sums per value of that column, over the cells that pass every other
+    filter, together with per-value cell counts for each distinct-count column.
+    The counts are kept sparse, as the nonzero (value, distinct value) pairs
+    grouped by value, so a session's state grows with the cells rather than
+    with values x distinct values. Adding or removing a value then adds or
+    subtracts one row of sums and that value's pairs rather than passing over
+    the cells. Changing another column rebuilds the partials for that column
+    once, with a single pass over the cells.
+
+    The engine is shared and immutable; each session keeps its own state dict.
+    """
+
+    def __init__(self, cube, filter_engine):
+        self.filter_engine = filter_engine
+        self.measures = np.column_stack([cube[stat_column(m, "sum")].to_numpy(np.float64) for m in KPI_MEASURES])
+        self.distinct_codes = {c: cube[c].cat.codes.to_numpy().astype(np.int64) for c in DISTINCT_COLUMNS}
+        self.distinct_sizes = {c: len(cube[c].cat.categories) for c in DISTINCT_COLUMNS}
+        self._token = object()
+
+    def _positions(self, selected_filters):
+        return {col: frozenset(self.filter_engine.value_codes(col, values)) for col, values in selected_filters.items()}
+
+    def _partials(self, positions, col):
+        """Per-value sums and distinct counts for ``col`` over the cells passing the other filters."""
+        mask = np.ones(self.filter_engine.n_rows, dtype=bool)
+        for c, selected in positions.items():
+            if c != col and selected:
+                table = np.zeros(len(self.filter_engine.options[c]), dtype=bool)
+                table[list(selected)] = True
+                mask &= table[self.filter_engine.codes[c]]
+        codes = self.filter_engine.codes[col][mask].astype(np.int64)
+        n_values = len(self.filter_engine.options[col])
+
+        sums = np.column_stack([
+            np.bincount(codes, weights=self.measures[mask, i], minlength=n_values)
+            for i in range(len(KPI_MEASURES))
+        ])
+        counts = {}
+        for c, distinct in self.distinct_codes.items():
+            size = self.distinct_sizes[c]
+            # Nonzero (value, distinct value) pairs only, grouped by value: offsets[v]:offsets[v + 1]
+            pairs, n_cells = np.unique(codes * size + distinct[mask], return_counts=True)
+            pair_values, pair_distinct = np.divmod(pairs, size)
+            counts[c] = {
+                "offsets": np.searchsorted(pair_values, np.arange(n_values + 1)),
+                "distinct": pair_distinct.astype(np.int32),
+                "cells": n_cells.astype(np.int32),
+            }
+        return {"column": col, "sums": sums, "counts": counts}
+
+    def _distinct_counts(self, partials, rows):
+        """Cell counts per distinct value, summed over the value positions ``rows`` of the partials."""
+        counts = {}
+        for c, pairs in partials["counts"].items():
+            starts, stops = pairs["offsets"][rows], pairs["offsets"][np.asarray(rows, dtype=np.int64) + 1]
+            taken = np.concatenate([np.arange(a, b) for a, b in zip(starts, stops)]) if len(rows) else []
+            counts[c] = np.bincount(pairs["distinct"][taken], weights=pairs["cells"][taken],
+                                    minlength=self.distinct_sizes[c]).astype(np.int64)
+        return counts
+
+    def _running(self, partials, selected):
+        """Totals for a set of value positions of the partials' column; empty means every value."""
+        if not selected:
+            return {
+                "sums": partials["sums"].sum(axis=0),
+                "counts": {
+                    c: np.bincount(pairs["distinct"], weights=pairs["cells"], minlength=self.distinct_sizes[c]).astype(np.int64)
+                    for c, pairs in partials["counts"].items()
+                },
+            }
+        rows = sorted(selected)
+        return {"sums": partials["sums"][rows].sum(axis=0), "counts": self._distinct_counts(partials, rows)}
+
+    def kpis(self, selected_filters, state=None):
+        """KPIs for a {column: [values]} selection; ``state`` is the dict returned by the previous call.
+
+        Returns ``(kpis, state)``.
+        """
+        positions = self._positions(selected_filters)
+        fresh = state is None or state["engine"] is not self._token
+        changed = [] if fresh else [c for c in positions if positions[c] != state["positions"].get(c)]
+
+        if not fresh and not changed:
+            return state["kpis"], state
+        if (not fresh and len(changed) == 1 and changed[0] == state["partials"]["column"]
+                and state["positions"][changed[0]] and positions[changed[0]]):
+            # One value added or removed in the column being edited: apply the difference
+            col = changed[0]
+            partials, running = state["partials"], state["running"]
+            added = sorted(positions[col] - state["positions"][col])
+            removed = sorted(state["positions"][col] - positions[col])
+            plus, minus = self._distinct_counts(partials, added), self._distinct_counts(partials, removed)
+            running = {
+                "sums": running["sums"] + partials["sums"][added].sum(axis=0) - partials["sums"][removed].sum(axis=0),
+                "counts": {c: counts + plus[c] - minus[c] for c, counts in running["counts"].items()},
+            }
+        else:
+            # Going from "all values" to a subset (or back) sums over every row instead: still O(values)
+            col = changed[0] if len(changed) == 1 else next((c for c in positions if positions[c]), next(iter(positions)))
+            partials = state["partials"] if (changed == [col] and state["partials"]["column"] == col) else self._partials(positions, col)
+            running = self._running(partials, positions[col])
+
+        aboard, air_fatalities, ground = (int(round(v)) for v in running["sums"])
+        kpis = {
+            "Total_People_aboard": aboard,
+            "Total_Air_Fatalities": air_fatalities,
+            "Total_Ground_Cases": ground,
+            "Countries": int(np.count_nonzero(running["counts"]["Country"])),
+            "Aircraft_Manufacturers": int(np.count_nonzero(running["counts"]["Aircraft Manufacturer"])),
+            "Total_survivors": aboard - air_fatalities,
+            "Total_deaths": air_fatalities + ground,
+        }
+        state = {"engine": self._token, "positions": positions, "partials": partials, "running": running, "kpis": kpis}
+        return kpis, state
+
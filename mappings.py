@@ -0,0 +1,1586 @@
+# Lookup tables from Project_data_cleaning.ipynb, used by the cleaning pipeline in ingest.py
+
+
+# First pass over Country/Region: typos, states/provinces and regions, non-country tokens
+COUNTRY_FIXES = {
+    # Typos / misspellings
+    'Alaksa': 'United States',
+    'Alakska': 'United States',
+    'Australila': 'Australia',
+    'Manatoba': 'Canada',
+    'Morroco': 'Morocco',
+    'Mexic': 'Mexico',
+    'Afghanstan': 'Afghanistan',
+    'Baangladesh': 'Bangladesh',
+    'Bulgeria': 'Bulgaria',
+    'Phillipines': 'Philippines',
+    'Philipines': 'Philippines',
+    'Hunary': 'Hungary',
+    'Argentinade': 'Argentina',
+    'Uzbekstan': 'Uzbekistan',
+    'Yugosalvia': 'Yugoslavia',
+    'Cailifornia': 'United States',
+    'Calilfornia': 'United States',
+    'Cailifornia': 'United States',
+    'Moldavia': 'Moldova',
+    'Democtratic': 'Democratic Republic of the Congo',
+    'Djibouti\r\n\tDjibouti': 'Djibouti',
+    'Inodnesia': 'Indonesia',
+
+    # States / provinces → country
+    'California': 'United States',
+    'Texas': 'United States',
+    'Florida': 'United States',
+    'Ontario': 'Canada',
+    'Quebec': 'Canada',
+    'Manitoba': 'Canada',
+    'Newfoundland': 'Canada',
+    'Nevada': 'United States',
+    'Arizona': 'United States',
+    'Alabama': 'United States',
+    'Oregon': 'United States',
+    'Hawaii': 'United States',
+    'Colorado': 'United States',
+    'Washington': 'United States',
+    'Wyoming': 'United States',
+    'Kentucky': 'United States',
+    'Kansas': 'United States',
+    'Ohio': 'United States',
+    'Pennsylvania': 'United States',
+    'Virginia': 'United States',
+    'Illinois': 'United States',
+    'Indiana': 'United States',
+    'Michigan': 'United States',
+    'Wisconsin': 'United States',
+    'Minnesota': 'United States',
+    'Mississippi': 'United States',
+    'Missouri': 'United States',
+    'Montana': 'United States',
+    'Nebraska': 'United States',
+    'Utah': 'United States',
+
+    # Regions → country
+    'Siberia': 'Russia',
+    'Tasmania': 'Australia',
+    'Bali': 'Indonesia',
+    'Sicily': 'Italy',
+    'Azores': 'Portugal',
+    'Lombardia': 'Italy',
+    'Catalina': 'United States',
+    'Corsica': 'France',
+    'Queensland': 'Australia',
+    'Sardinia': 'Italy',
+
+    # Non-country → Unknown
+    'Cargo': 'Unknown',
+    'Airlines': 'Unknown',
+    'miles': 'Unknown',
+    '110': 'Unknown',
+    '100': 'Unknown',
+    '325': 'Unknown',
+    '570': 'Unknown',
+    '18': 'Unknown',
+    '10': 'Unknown',
+}
+
+
+# Second pass: every remaining Country/Region token to a country name
+COUNTRY_MAP = {
+    # Typos / misspellings
+    "Unknown": "Unknown",
+    "Alaska": "United States",
+    "Afghanistan": "Afghanistan",
+    "Aichi": "Japan",
+    "Algeria": "Algeria",
+    "Angola": "Angola",
+    "Argentina": "Argentina",
+    "Australia": "Australia",
+    "Azerbaijan": "Azerbaijan",
+    "Bahamas": "Bahamas",
+    "Indonesia": "Indonesia",
+    "Belgian": "Belgium",
+    "Black": "Unknown",  # Ambiguous, could be 'Black Sea'
+    "Bolivia": "Bolivia",
+    "Botswana": "Botswana",
+    "Brazil": "Brazil",
+    "Brazil\tAmazonaves": "Brazil",
+    "British": "United Kingdom",  # Could be a UK reference
+    "Calabria": "Italy",
+    "United States": "United States",
+    "Cameroon": "Cameroon",
+    "Cameroons": "Cameroon",
+    "Canada": "Canada",
+    "Canary": "Spain",  # Canary Islands
+    "Channel": "United Kingdom",  # Channel Islands
+    "Chechnya": "Russia",
+    "Chile": "Chile",
+    "China": "China",
+    "China?": "China",
+    "Colombia": "Colombia",
+    "Congo": "Republic of the Congo",  # Could also be DRC
+    "Croatia": "Croatia",
+    "Cyprus": "Cyprus",
+    "Democratic": "Democratic Republic of the Congo",
+    "East": "Unknown",  # Needs clarification
+    "Ecuador": "Ecuador",
+    "England": "United Kingdom",
+    "Equatorial": "Equatorial Guinea",
+    "Estonia": "Estonia",
+    "Ethiopia": "Ethiopia",
+    "Finland": "Finland",
+    "France": "France",
+    "French": "France",
+    "Gambia": "Gambia",
+    "Georgia": "Georgia",  # Could be country or US state
+    "Germany": "Germany",
+    "Ghana": "Ghana",
+    "Greece": "Greece",
+    "Greenland": "Denmark",
+    "Guangxi": "China",
+    "Guatemala": "Guatemala",
+    "Guyana": "Guyana",
+    "Honduras": "Honduras",
+    "Hong": "China",  # Likely Hong Kong
+    "Idaho": "United States",
+    "India": "India",
+    'India\tPawan': "India",
+    'Iowa': 'United States',
+    'Iran': 'Iran',
+    'Iraq': 'Iraq',
+    'Ireland': 'Ireland',
+    'Isle': 'United Kingdom',  # Likely Isle of Man
+    'Italy': 'Italy',
+    'Jamaica': 'Jamaica',
+    'Japan': 'Japan',
+    'Jordan': 'Jordan',
+    'Kenya': 'Kenya',
+    'Laos': 'Laos',
+    'Libya': 'Libya',
+    'London': 'United Kingdom',
+    'Madagascar': 'Madagascar',
+    'Malta': 'Malta',
+    'Mexico': 'Mexico',
+    'Moldova': 'Moldova',
+    'Mongolia': 'Mongolia',
+    'Morocco': 'Morocco',
+    'near': 'Unknown',  # Vague location
+    'Netherlands': 'Netherlands',
+    'New': 'Unknown',  # Incomplete, could be New Zealand or New Caledonia
+    'Nicaragua': 'Nicaragua',
+    'Niger': 'Niger',
+    'Nigeria': 'Nigeria',
+    'North': 'Unknown',  # Incomplete, could be North Korea or North Macedonia
+    'Northern': 'Unknown',  # Incomplete, could be Northern Ireland
+    'Norway': 'Norway',
+    'Norway\tCHC': 'Norway',
+    'NYUS': 'United States',  # New York, US
+    'Oklahoma': 'United States',
+    'ON': 'Canada',  # Ontario
+    'Pakistan': 'Pakistan',
+    'Panama': 'Panama',
+    'Papua': 'Papua New Guinea',
+    'Peru': 'Peru',
+    'Philippines': 'Philippines',
+    'Poland': 'Poland',
+    'Puerto': 'Puerto Rico',
+    'Russia': 'Russia',
+    'Rwanda': 'Rwanda',
+    'Sarawak': 'Malaysia',
+    'Saudi': 'Saudi Arabia',
+    'Scotland': 'United Kingdom',
+    'Senegal': 'Senegal',
+    'SK': 'South Korea',
+    'Somalia': 'Somalia',
+    'South': 'Unknown',  # Incomplete, could be South Sudan or South Africa
+    'South-West': 'Unknown',  # Region name
+    'Spain': 'Spain',
+    'Sri': 'Sri Lanka',
+    'Sudan': 'Sudan',
+    'Suriname': 'Suriname',
+    'Switzerland': 'Switzerland',
+    'Syria': 'Syria',
+    'Taiwan': 'Taiwan',
+    'Tennesee': 'United States',
+    'Tennessee': 'United States',
+    'Thailand': 'Thailand',
+    'Trinidad': 'Trinidad and Tobago',
+    'Turkey': 'Turkey',
+    'Ukraine': 'Ukraine',
+    'USSRAeroflot': 'Unknown',  # Likely USSR airline
+    'Venezuela': 'Venezuela',
+    'Vietnam': 'Vietnam',
+    'Virgin': 'United Kingdom',  # Likely Virgin Islands or Virgin Atlantic
+    'West': 'Germany',  # Likely West Germany (historical)
+    'Yugoslavia': 'Yugoslavia',  # Historical country
+    'Zaire': 'Democratic Republic of the Congo',  # Historical name for DRC
+    'Arkansas': 'United States',
+    'Portugal': 'Portugal',
+    'Bahrain': 'Bahrain',
+    'Bangladesh': 'Bangladesh',
+    'BC': 'Canada',  # Likely British Columbia
+    'Belgium': 'Belgium',
+    'Bias': 'Unknown',  # Not clear from context
+    'Brazil\tLoide': 'Brazil',
+    'Bulgaria': 'Bulgaria',
+    'Burma': 'Myanmar',  # Historical name for Myanmar
+    'Cape': 'South Africa',  # Likely Cape Town/Cape Province
+    'Connecticut': 'United States',
+    'Cook': 'Cook Islands',
+    'Costa': 'Costa Rica',
+    'Cuba': 'Cuba',
+    'Czechoslovakia': 'Czechoslovakia',  # Historical country
+    'Denmark': 'Denmark',
+    'Egypt': 'Egypt',
+    'Guam': 'United States',  # US territory
+    'Guantanamo': 'Cuba',  # Guantanamo Bay in Cuba
+    'Haiti': 'Haiti',
+    'Hungary': 'Hungary',
+    'Iceland': 'Iceland',
+    'Kazakastan': 'Kazakhstan',  # Corrected spelling
+    'Kent': 'United Kingdom',
+    'Kyrgyzstan': 'Kyrgyzstan',
+    'Lebanon': 'Lebanon',
+    'Leeward': 'Antigua and Barbuda',  # Leeward Islands region
+    'Louisiana': 'United States',
+    'Maine': 'United States',
+    'Malaysia': 'Malaysia',
+    'Martinique': 'France',  # Overseas territory
+    'Maryland': 'United States',
+    'Massachusetts': 'United States',
+    'Mauretania': 'Mauritania',  # Corrected spelling
+    'Miao-li': 'Taiwan',  # County in Taiwan
+    'Myanmar': 'Myanmar',
+    'Nepal': 'Nepal',
+    'Nunavut': 'Canada',
+    'Oman': 'Oman',
+    'Paraguay': 'Paraguay',
+    'Persian': 'Iran',  # Likely Persian Gulf region
+    'PQ': 'Canada',  # Province of Quebec
+    'Romania': 'Romania',
+    'San': 'United States',  # Likely San Francisco or San Diego
+    'Spain\r\n\t\r\nMoron': 'Spain',  # Likely Morón Air Base
+    'Sweden': 'Sweden',
+    'Tajikistan': 'Tajikistan',
+    'Tanzania': 'Tanzania',
+    'Terceira': 'Portugal',  # Island in the Azores
+    'United': 'Unknown',  # Too vague (could be United States, United Kingdom, etc.)
+    'Upper': 'Unknown',
+    'Uzbekistan': 'Uzbekistan',
+    'Västergötland': 'Sweden',
+    'Vera': 'Unknown',
+    'Vermont': 'United States',
+    'Yemen': 'Yemen',
+    'Algarve': 'Portugal',
+    'Armenia': 'Armenia',
+    'Atlantic': 'Unknown',
+    'Austria': 'Austria',
+    'Ayrshire': 'United Kingdom',  # Region in Scotland
+    'Beni': 'Bolivia',  # Could also be Beni in DRC, assuming Bolivia unless clarified
+    'Benin': 'Benin',
+    'Bermuda': 'Bermuda',
+    'Brunei': 'Brunei',
+    'Bugaria': 'Bulgaria',  # Typo corrected
+    'Chicago': 'United States',
+    'Coloado': 'United States',  # Typo for Colorado
+    'Comoros': 'Comoros',
+    'Condor': 'Unknown',
+    'Curacao': 'Curaçao',
+    'D.C.Capital': 'United States',  # Washington, D.C.
+    'Da': 'Unknown',
+    'Fiji': 'Fiji',
+    'Florida?': 'United States',
+    'Huanuco': 'Peru',
+    'Jiangsu': 'China',
+    'Kazakhstan': 'Kazakhstan',
+    'Kodiak': 'United States',  # Kodiak, Alaska
+    'Kuwait': 'Kuwait',
+    'Labrador': 'Canada',
+    'Latvia': 'Latvia',
+    'Mariana': 'United States',  # Northern Mariana Islands (US territory)
+    'Mauritania': 'Mauritania',
+    'Northwest': 'Unknown',  # Could be Northwest Territories in Canada, but unclear
+    'NWT': 'Canada',  # Northwest Territories
+    'off': 'Unknown',
+    'Okinawa': 'Japan',
+    'Qatar': 'Qatar',
+    'Saskatchewan': 'Canada',
+    'Slovakia': 'Slovakia',
+    'Surrey': 'United Kingdom',
+    'The': 'Unknown',
+    'Valle': 'Unknown',
+    'WA': 'United States',  # Washington state
+    'WYUS': 'United States',  # Wyoming, US
+    'Zimbabwe': 'Zimbabwe',
+    'Alberta': 'Canada',
+    'Belarus': 'Belarus',
+    'Bosnia-Herzegovina': 'Bosnia and Herzegovina',
+    'Brisbane': 'Australia',
+    'Buea': 'Cameroon',
+    'Californiia': 'United States',  # Typo corrected
+    'Columbia': 'United States',  # Could be District of Columbia or Columbia, South Carolina
+    'Crete': 'Greece',
+    'Delaware': 'United States',
+    'Djbouti': 'Djibouti',  # Typo corrected
+    'Domincan': 'Dominican Republic',  # Typo corrected
+    'Dominican': 'Dominican Republic',
+    'El': 'Unknown',
+    'Hati': 'Haiti',  # Typo corrected
+    'HIPan': 'Unknown',
+    'Indonesia\r\n\t\r\nSarmi': 'Indonesia',  # Sarmi is a region in Indonesia
+    'Lancs': 'United Kingdom',  # Lancashire
+    'Liberia': 'Liberia',
+    'Los': 'Unknown',
+    'Mali': 'Mali',
+    'Margarita': 'Venezuela',  # Isla Margarita
+    'Minnisota': 'United States',  # Typo corrected
+    'Mozambique': 'Mozambique',
+    'NSW': 'Australia',  # New South Wales
+    'Pacific': 'Unknown',
+    'PE': 'Canada',  # Prince Edward Island
+    'Rhode': 'United States',  # Rhode Island
+    'Rhodesia': 'Zimbabwe',  # Former name
+    'Rio': 'Brazil',  # Rio de Janeiro
+    'Trento': 'Italy',
+    'Tunisia': 'Tunisia',
+    'UARMisrair': 'Egypt',  # Misr Air is EgyptAir
+    'Uruguay': 'Uruguay',
+    'Victoria': 'Australia',  # Could also be Canada — assumed Australia
+    'Vizcaya': 'Spain',  # Basque Country
+    'Wantagh': 'United States',
+    'Warks': 'United Kingdom',  # Warwickshire
+    'Wisconson': 'United States',  # Wisconsin
+    'Zambia': 'Zambia',
+    'NWT Canada': 'Canada',
+    'Air': 'Unknown',
+    'American': 'Unknown',
+    'Ariège': 'France',
+    'Barbados': 'Barbados',
+    'Besar': 'Malaysia',  # Pulau Besar
+    'Boliva': 'Bolivia',
+    'Boliviano': 'Bolivia',
+    'California?': 'United States',
+    'Comoro': 'Comoros',
+    'Covington': 'United States',
+    'Cundinamarca': 'Colombia',
+    'Czech': 'Czech Republic',
+    'D.C.Air': 'United States',
+    'Dutch': 'Netherlands',
+    'Gabon': 'Gabon',
+    'Horley': 'United Kingdom',
+    'Ilinois': 'United States',  # Illinois
+    'Ivory': 'Ivory Coast',
+    'Jamacia': 'Jamaica',
+    'Lochgoilhead': 'United Kingdom',
+    'Lombok': 'Indonesia',
+    'Macedonia': 'North Macedonia',
+    'Maharashtra': 'India',
+    'Marine': 'Unknown',
+    'Minnesota46826/109': 'United States',  # Minnesota
+    'NE': 'United States',  # Nebraska
+    'Norrbotten': 'Sweden',
+    'Qld': 'Australia',  # Queensland
+    'Samoa': 'Samoa',
+    'Sichuan': 'China',
+    'Suiyang': 'China',
+    'Sumatra': 'Indonesia',
+    'Timor': 'East Timor',  # Could also be West Timor (Indonesia)
+    'U.S.': 'United States',
+    'Uganda': 'Uganda',
+    'Veracruz': 'Mexico',
+    'Western': 'Unknown',
+    'Yukon': 'Canada',
+    'Azuay': 'Ecuador',
+    'Boston': 'United States',
+    'Central': 'Unknown',
+    'Eritrea': 'Eritrea',
+    'Germany?': 'Germany',
+    'Gerona': 'Spain',  # Girona
+    'Gilbert': 'Kiribati',  # Gilbert Islands
+    'Guinea': 'Guinea',
+    'Gujarat': 'India',
+    'HIAir': 'Unknown',
+    'Indian': 'Unknown',  # Too vague
+    'Irian': 'Indonesia',  # Irian Jaya (Papua)
+    'Jersey': 'United Kingdom',  # Channel Islands
+    'Lorraine': 'France',
+    'Malagasy': 'Madagascar',
+    'Manmar': 'Myanmar',
+    'Middlesex': 'United Kingdom',
+    'Mississipi': 'United States',  # Mississippi
+    'Norfork': 'United States',  # Norfolk
+    'Orly': 'France',  # Paris-Orly Airport
+    'Para': 'Brazil',  # Pará
+    'Shetlands': 'United Kingdom',  # Shetland Islands
+    'Sulu': 'Philippines',
+    'Tahiti': 'French Polynesia',
+    'UKBritish': 'United Kingdom',
+    'Vanuatu': 'Vanuatu',
+    '116': 'Unknown',
+    'Amsterdam': 'Netherlands',
+    'Bavaria': 'Germany',
+    'Cambodia': 'Cambodia',
+    'Chad': 'Chad',
+    'Cheshire': 'United Kingdom',
+    'Covington/Hebron': 'United States',
+    'England?': 'United Kingdom',
+    'Great': 'Unknown',
+    'Guadaloupe': 'Guadeloupe',
+    'Gulf': 'Unknown',  # Could be Persian Gulf or Gulf of Mexico
+    'Islay': 'United Kingdom',  # Scotland
+    'Khmer': 'Cambodia',
+    'Mount': 'Unknown',
+    'Namibia': 'Namibia',
+    'Napal': 'Nepal',
+    'Nuevo': 'Mexico',  # Nuevo León
+    'OLD': 'Unknown',
+    'QC': 'Canada',  # Quebec
+    'Qld.': 'Australia',
+    'Ryukyu': 'Japan',  # Ryukyu Islands
+    'Saudia': 'Saudi Arabia',
+    'Sierra': 'Unknown',  # Possibly Sierra Leone
+    'Slovenia': 'Slovenia',
+    'Surinam': 'Suriname',
+    'Tokyo': 'Japan',
+    'Val-de-Marne': 'France',
+    'Albania': 'Albania',
+    'Azerbaijan\r\n\t\r\nBakou': 'Azerbaijan',  # Baku
+    'CADuncan': 'Canada',
+    'Cardiff': 'United Kingdom',
+    'Cocos': 'Australia',  # Cocos (Keeling) Islands
+    'Guadeloupe': 'Guadeloupe',
+    'Kauai': 'United States',  # Hawaii
+    'Massachutes': 'United States',  # Massachusetts
+    'Mt.': 'Unknown',
+    'N': 'Unknown',
+    'Newfoundlandu.s.': 'Canada',  # Newfoundland
+    'Nova': 'Canada',  # Nova Scotia
+    'Philippine': 'Philippines',
+    'Providencia': 'Colombia',  # Providencia Island
+    'Republic': 'Unknown',  # Too vague
+    'Reunion': 'Réunion',  # French territory
+    'Sierre': 'Switzerland',
+    'Singapore': 'Singapore',
+    'Soviet': 'Unknown',
+    'St.': 'Unknown',
+    'Tanganyika': 'Tanzania',
+    'Turkmenistan': 'Turkmenistan',
+    'USSRBalkan': 'Unknown',
+    'Volcano': 'Unknown',
+    'Zulia': 'Venezuela',
+    'Airzona': 'United States',  # Arizona
+    'Aregntina': 'Argentina',
+    'Brazil\r\nFlorianopolis': 'Brazil',
+    'Chile\tAerolineas': 'Chile',
+    'Djibouti': 'Djibouti',
+    'Dorset': 'United Kingdom',
+    'FL': 'United States',  # Florida
+    'Guanacaste': 'Costa Rica',
+    'Hants': 'United Kingdom',  # Hampshire
+    'Honduras?': 'Honduras',
+    'Madrid': 'Spain',
+    'Miami': 'United States',
+    'Picrdie': 'France',  # Picardie
+    'Prov.': 'Unknown',  # Could be Province of ...
+    'Queens': 'United States',  # New York
+    'US': 'United States',
+    'Aaland': 'Finland',  # Åland Islands
+    'Bhutan': 'Bhutan',
+    'CAMilitary': 'Unknown',
+    'de': 'Unknown',
+    'Glens': 'Unknown',
+    'Guernsey': 'United Kingdom',
+    'Huila': 'Colombia',
+    'Inner': 'Unknown',
+    'Island': 'Unknown',
+    'Jeddah': 'Saudi Arabia',
+    'Kosovo': 'Kosovo',
+    'Lesotho': 'Lesotho',
+    'Luxembourg': 'Luxembourg',
+    'Malawi': 'Malawi',
+    'Malinau': 'Indonesia',
+    'Molokai': 'United States',  # Hawaii
+    'Nambia': 'Namibia',
+    'Ross': 'Unknown',
+    'Saint': 'Unknown',
+    'Sussex': 'United Kingdom',
+    'USSRMilitary': 'Unknown',
+    'Washingon': 'United States',  # Washington
+    'Yunan': 'China',  # Yunnan
+    '800': 'Unknown',
+    'DR': 'Dominican Republic',
+    'Ellesmere': 'Canada',  # Ellesmere Island
+    'Granada': 'Spain',  # Granada
+    'Italyde': 'Italy',
+    'Jawa': 'Indonesia',  # Java
+    'Kirghizia': 'Kyrgyzstan',
+    'Loire': 'France',
+    'Malaya': 'Malaysia',
+    'Placentia': 'Canada',  # Newfoundland
+    'Solomon': 'Solomon Islands',
+    'Tajikistan\tMilitary': 'Tajikistan',
+    'USSRAerflot': 'Unknown',
+    'Aargau': 'Switzerland',
+    'Africa': 'Unknown',  # Too broad
+    'AKAlaska': 'United States',
+    'Argyll': 'United Kingdom',
+    'Biafra': 'Nigeria',
+    'Buckinghamshire': 'United Kingdom',
+    'Deleware': 'United States',  # Delaware
+    'Democratic Republic of the Congo': 'Democratic Republic of the Congo',
+    'Faeroe': 'Faroe Islands',
+    'France?': 'France',
+    'Hrvatska': 'Croatia',
+    'Marshall': 'Marshall Islands',
+    'Micronesia': 'Micronesia',
+    'Montserrat': 'Montserrat',  # UK territory
+    'Oltenia': 'Romania',
+    'Russian': 'Russia',
+    'Sao': 'Unknown',  # Likely São Paulo or São Tomé
+    'SC': 'United States',  # South Carolina
+    'Stirlingshire': 'United Kingdom',
+    'Tusayan': 'United States',  # Arizona
+    'UAEGulf': 'United Arab Emirates',
+    'Virginia.American': 'United States',
+    'Zabul': 'Afghanistan'
+
+}
+
+
+# Country -> continent; countries missing here become "Unknown"
+COUNTRY_TO_CONTINENT = {
+    'Unknown': 'Unknown',
+    'United States': 'North America',
+    'Afghanistan': 'Asia',
+    'Japan': 'Asia',
+    'Algeria': 'Africa',
+    'Angola': 'Africa',
+    'Argentina': 'South America',
+    'Australia': 'Oceania',
+    'Azerbaijan': 'Asia',
+    'Bahamas': 'North America',
+    'Indonesia': 'Asia',
+    'Belgium': 'Europe',
+    'Bolivia': 'South America',
+    'Botswana': 'Africa',
+    'Brazil': 'South America',
+    'United Kingdom': 'Europe',
+    'Italy': 'Europe',
+    'Cameroon': 'Africa',
+    'Canada': 'North America',
+    'Spain': 'Europe',
+    'Russia': 'Europe/Asia',
+    'Chile': 'South America',
+    'China': 'Asia',
+    'Colombia': 'South America',
+    'Republic of the Congo': 'Africa',
+    'Croatia': 'Europe',
+    'Cyprus': 'Asia',
+    'Democratic Republic of the Congo': 'Africa',
+    'Ecuador': 'South America',
+    'Equatorial Guinea': 'Africa',
+    'Estonia': 'Europe',
+    'Ethiopia': 'Africa',
+    'Finland': 'Europe',
+    'France': 'Europe',
+    'Gambia': 'Africa',
+    'Georgia': 'Asia',
+    'Germany': 'Europe',
+    'Ghana': 'Africa',
+    'Greece': 'Europe',
+    'Denmark': 'Europe',
+    'Guatemala': 'North America',
+    'Guyana': 'South America',
+    'Honduras': 'North America',
+    'India': 'Asia',
+    'Iran': 'Asia',
+    'Iraq': 'Asia',
+    'Ireland': 'Europe',
+    'Jamaica': 'North America',
+    'Jordan': 'Asia',
+    'Kenya': 'Africa',
+    'Laos': 'Asia',
+    'Libya': 'Africa',
+    'Madagascar': 'Africa',
+    'Malta': 'Europe',
+    'Mexico': 'North America',
+    'Moldova': 'Europe',
+    'Mongolia': 'Asia',
+    'Morocco': 'Africa',
+    'Netherlands': 'Europe',
+    'Nicaragua': 'North America',
+    'Niger': 'Africa',
+    'Nigeria': 'Africa',
+    'Norway': 'Europe',
+    'Pakistan': 'Asia',
+    'Panama': 'North America',
+    'Papua New Guinea': 'Oceania',
+    'Peru': 'South America',
+    'Philippines': 'Asia',
+    'Poland': 'Europe',
+    'Puerto Rico': 'North America',
+    'Rwanda': 'Africa',
+    'Malaysia': 'Asia',
+    'Saudi Arabia': 'Asia',
+    'Senegal': 'Africa',
+    'South Korea': 'Asia',
+    'Somalia': 'Africa',
+    'Sri Lanka': 'Asia',
+    'Sudan': 'Africa',
+    'Suriname': 'South America',
+    'Switzerland': 'Europe',
+    'Syria': 'Asia',
+    'Taiwan': 'Asia',
+    'Thailand': 'Asia',
+    'Trinidad and Tobago': 'North America',
+    'Turkey': 'Europe/Asia',
+    'Ukraine': 'Europe',
+    'Venezuela': 'South America',
+    'Vietnam': 'Asia',
+    'Yugoslavia': 'Europe',
+    'Portugal': 'Europe',
+    'Bahrain': 'Asia',
+    'Bangladesh': 'Asia',
+    'Bulgaria': 'Europe',
+    'Myanmar': 'Asia',
+    'South Africa': 'Africa',
+    'Cook Islands': 'Oceania',
+    'Costa Rica': 'North America',
+    'Cuba': 'North America',
+    'Czechoslovakia': 'Europe',
+    'Egypt': 'Africa',
+    'Haiti': 'North America',
+    'Hungary': 'Europe',
+    'Iceland': 'Europe',
+    'Kazakhstan': 'Asia',
+    'Kyrgyzstan': 'Asia',
+    'Lebanon': 'Asia',
+    'Antigua and Barbuda': 'North America',
+    'Mauritania': 'Africa',
+    'Nepal': 'Asia',
+    'Oman': 'Asia',
+    'Paraguay': 'South America',
+    'Romania': 'Europe',
+    'Sweden': 'Europe',
+    'Tajikistan': 'Asia',
+    'Tanzania': 'Africa',
+    'Uzbekistan': 'Asia',
+    'Yemen': 'Asia',
+    'Armenia': 'Asia',
+    'Austria': 'Europe',
+    'Benin': 'Africa',
+    'Bermuda': 'North America',
+    'Brunei': 'Asia',
+    'Comoros': 'Africa',
+    'Curaçao': 'North America',
+    'Fiji': 'Oceania',
+    'Kuwait': 'Asia',
+    'Latvia': 'Europe',
+    'Qatar': 'Asia',
+    'Slovakia': 'Europe',
+    'Zimbabwe': 'Africa',
+    'Belarus': 'Europe',
+    'Bosnia and Herzegovina': 'Europe',
+    'Djibouti': 'Africa',
+    'Dominican Republic': 'North America',
+    'Liberia': 'Africa',
+    'Mali': 'Africa',
+    'Mozambique': 'Africa',
+    'Tunisia': 'Africa',
+    'Uruguay': 'South America',
+    'Zambia': 'Africa',
+    'Barbados': 'North America',
+    'Czech Republic': 'Europe',
+    'Gabon': 'Africa',
+    'Ivory Coast': 'Africa',
+    'North Macedonia': 'Europe',
+    'Samoa': 'Oceania',
+    'East Timor': 'Asia',
+    'Uganda': 'Africa',
+    'Eritrea': 'Africa',
+    'Kiribati': 'Oceania',
+    'Guinea': 'Africa',
+    'French Polynesia': 'Oceania',
+    'Vanuatu': 'Oceania',
+    'Cambodia': 'Asia',
+    'Chad': 'Africa',
+    'Guadeloupe': 'North America',
+    'Namibia': 'Africa',
+    'Slovenia': 'Europe',
+    'Albania': 'Europe',
+    'Réunion': 'Africa',
+    'Singapore': 'Asia',
+    'Turkmenistan': 'Asia',
+    'Bhutan': 'Asia',
+    'Kosovo': 'Europe',
+    'Lesotho': 'Africa',
+    'Luxembourg': 'Europe',
+    'Malawi': 'Africa',
+    'Solomon Islands': 'Oceania',
+    'Faroe Islands': 'Europe',
+    'Marshall Islands': 'Oceania',
+    'Micronesia': 'Oceania',
+    'Montserrat': 'North America',
+    'United Arab Emirates': 'Asia'
+}
+
+
+# Raw "Aircraft Manufacturer" strings -> standardized manufacturer name
+MANUFACTURER_STANDARD = {
+    'de Havilland Canada': 'De Havilland Canada',
+    'Douglas': 'Douglas',
+    'Vickers Vanguard': 'Vickers',
+    'Antonov': 'Antonov',
+    'Boeing': 'Boeing',
+    'Airbus': 'Airbus',
+    'Aero Commander': 'Aero Commander',
+    'Britten': 'Britten-Norman',
+    'Cessna': 'Cessna',
+    'Cessna 208B Caravan': 'Cessna',
+    'Hughes': 'Hughes',
+    'McDonnell Douglas': 'McDonnell Douglas',
+    'Pilgrim': 'Pilgrim Aircraft',
+    'Ilyushin': 'Ilyushin',
+    'Cessna  208B Grand': 'Cessna',
+    'Hawker Siddeley': 'Hawker Siddeley',
+    'HS': 'Hawker Siddeley',
+    'Avro': 'Avro',
+    'Lockheed 14': 'Lockheed',
+    'Swearingen SA227AC Metroliner': 'Swearingen',
+    'Yakovlev': 'Yakovlev',
+    'Curtiss': 'Curtiss-Wright',
+    'Mil': 'Mil',
+    'Convair': 'Convair',
+    'Consolidated': 'Consolidated Aircraft',
+    'Doublas': 'Douglas',
+    'Embraer 110EJ Band./Embraer 110P': 'Embraer',
+    'Learjet': 'Learjet',
+    'NAMC': 'NAMC',
+    'Embraer/Piper': 'Embraer',
+    'Lockheed 18': 'Lockheed',
+    'Cams': 'CAMS (Canadair Argus Modification Support?)',
+    'Ford': 'Ford',
+    'Grumman': 'Grumman',
+    'Lockheed': 'Lockheed',
+    'De Havilland': 'De Havilland',
+    'Mi': 'Mil',
+    'Pilatus': 'Pilatus',
+    'Sikorsky': 'Sikorsky',
+    '??': 'Unknown',
+    'Aérospatiale': 'Aérospatiale',
+    'Bell 212FAC': 'Bell',
+    'Hadley Page 137Jetstream I / Cessna 206N11360 /': 'Handley Page',
+    'Canadair': 'Canadair',
+    'Bristol Britannia': 'Bristol',
+    'Fokker': 'Fokker',
+    'Junkers': 'Junkers',
+    'Sud Aviation': 'Sud Aviation',
+    'Vickers Viscount': 'Vickers',
+    'Avro 685 York': 'Avro',
+    'Avro Shackleton': 'Avro',
+    'Vickers 610 Viking': 'Vickers',
+    'BAC Super': 'British Aircraft Corporation (BAC)',
+    'Aerocomp Comp Air': 'Aerocomp',
+    'Fairchild': 'Fairchild',
+    'Farman': 'Farman',
+    'Dornier': 'Dornier',
+    'de Havilland  Canada': 'De Havilland Canada',
+    'Aviation Traders': 'Aviation Traders',
+    'Embraer': 'Embraer',
+    'Focke': 'Focke-Wulf',
+    'Fokker FG': 'Fokker',
+    'Messerschmitt': 'Messerschmitt',
+    'Vickers Viking 1B & Soviet': 'Vickers',
+    'Hawker Siddeley Trident': 'Hawker Siddeley',
+    'Pilatus Britten Norman': 'Pilatus',
+    'Beechcraft': 'Beechcraft',
+    'C': 'Unknown',
+    'Swallow\r\nSwallow?': 'Swallow',
+    'Stearman': 'Stearman',
+    'British Aerospace': 'British Aerospace',
+    'Britten Norman': 'Britten-Norman',
+    'Mitsubishi': 'Mitsubishi',
+    'Lockheed Super': 'Lockheed',
+    'B17G Flying': 'Boeing (B-17)',
+    'de Havilland DH106 Comet': 'De Havilland',
+    'OFM': 'Unknown',
+    'Kawasaki': 'Kawasaki',
+    'Martin': 'Martin (Glenn L. Martin Company)',
+    'Shin Meiwa': 'Shin Meiwa',
+    'Vickers Wellington': 'Vickers',
+    'British Aerospace BAe': 'British Aerospace',
+    'Aerospatiale Caravelle': 'Aérospatiale',
+    'Caudron C.635': 'Caudron',
+    'Bell 205': 'Bell Helicopter',
+    'Lisnov': 'Lisunov',
+    'Lockheed Hudson': 'Lockheed',
+    'Zeppelin': 'Luftschiffbau Zeppelin',
+    'Saab': 'Saab AB',
+    'Bell': 'Bell Helicopter',
+    'Goodyear': 'Goodyear Aerospace Corporation',
+    'Short': 'Short Brothers',
+    'Stinson Model': 'Stinson Aircraft Company',
+    'Lockheed 14 Super': 'Lockheed',
+    'Swearingen': 'Fairchild Swearingen',
+    'de Hvilland 89A Dragon': 'De Havilland',
+    'Eurocopter EC225LP Super Puma M2+': 'Eurocopter',
+    'Lockheed 188C': 'Lockheed',
+    'Embraer 110P1': 'Embraer',
+    'Piper Aerostar 601 / Bell 412SPN3645D /': 'Piper',
+    'Let': 'Let Kunovice',
+    'Lockheed 749A': 'Lockheed',
+    'Vickers 757': 'Vickers',
+    'ATR': 'ATR Aircraft',
+    'Lisunov': 'Lisunov',
+    'Tupolev': 'Tupolev',
+    'Dassault Falcon': 'Dassault Aviation',
+    'Sud Aviation Caravelle': 'Sud Aviation',
+    'Eurocopter AS 332L2 Super Puma': 'Eurocopter',
+    'Boeing Vertol CH47C': 'Boeing Vertol',
+    'Breguet': 'Breguet Aviation',
+    'Rohrbach': 'Rohrbach Metall-Flugzeugbau',
+    'Swearingen SA.227AC Metro': 'Fairchild Swearingen',
+    'General Aviation': 'General Aviation Manufacturers',
+    'Handley Page Dart Herald': 'Handley Page',
+    'Avro 688 Super': 'Avro',
+    'Let 410UVP': 'Let Kunovice',
+    'Boeing 377 Stratocruiser': 'Boeing',
+    'Lockheed Martin': 'Lockheed Martin',
+    'Lockheed 1049H Super': 'Lockheed',
+    'Cessna 208 Grand': 'Cessna',
+    'Reims Aviation': 'Reims Aviation',
+    'Liore et Olivier': 'Lioré et Olivier',
+    'Avro 691 Lancastrian': 'Avro',
+    'Aerospatiale AS350 Eurocopter': 'Aérospatiale',
+    'Piper': 'Piper Aircraft',
+    'Howard': 'Howard Aircraft Corporation',
+    '?VH': 'Unknown',
+    'de Havilland DH.80 Puss': 'De Havilland',
+    'Vickers 804': 'Vickers',
+    'Embraer 120ER': 'Embraer',
+    'Latecoere': 'Latécoère',
+    'Sikorsky S43 (flying': 'Sikorsky Aircraft',
+    'Supermarine Stranraer (flying': 'Supermarine',
+    'Beechcraft C99 / Rockwell': 'Beechcraft',
+    'Bell 206B': 'Bell Helicopter',
+    'MD Douglas': 'McDonnell Douglas',
+    'CASA': 'Construcciones Aeronáuticas SA',
+    'Gates Learjet': 'Learjet',
+    'Lockheed 10': 'Lockheed',
+    'Bristol 170 Freighter': 'Bristol Aeroplane Company',
+    'Savoia': 'Savoia-Marchetti',
+    'Armstrong': 'Armstrong Whitworth Aircraft',
+    'Royal Airship Works': 'Royal Airship Works',
+    'Wibault': 'Société des Avions Michel Wibault',
+    'Let 410UVP Turbojet / Tupolev': 'Let Kunovice',
+    'Shorts': 'Short Brothers',
+    'Vickers 634 Viking': 'Vickers',
+    'Catalina Flying': 'Consolidated Aircraft',
+    'Norman': 'Britten-Norman',
+    'Hindustan Aeronautics 748': 'Hindustan Aeronautics Limited',
+    'Pacific': 'Pacific Aerospace',
+    'HESA': 'Iran Aircraft Manufacturing Industrial Company',
+    'UH': 'Unknown',
+    'Caproni': 'Caproni',
+    'Handley Page': 'Handley Page',
+    'Macchi': 'Aeronautica Macchi',
+    'Unknown /': 'Unknown',
+    'Bleriot': 'Blériot Aéronautique',
+    'Consolidated Canso': 'Consolidated Aircraft',
+    'Latecoere 631 (flying': 'Latécoère',
+    'Eurocopter': 'Eurocopter',
+    'Lockheed 10B': 'Lockheed',
+    'Stinson': 'Stinson Aircraft Company',
+    'Aerospatiale': 'Aérospatiale',
+    'Avro Lancaster': 'Avro',
+    'Lockheed 10 Electra': 'Lockheed',
+    'Lockheed 9': 'Lockheed',
+    'Siebel': 'Siebel Flugzeugwerke',
+    'Lockheed Orion 9E Explorer float': 'Lockheed',
+    'BAC': 'British Aircraft Corporation',
+    'Lockheed 5': 'Lockheed',
+    'Piper Navajo': 'Piper Aircraft',
+    'Arava': 'IAI (Israel Aerospace Industries)',
+    'Short Sandringham (flying': 'Short Brothers',
+    'Vickers Viking': 'Vickers',
+    'Cessna  501': 'Cessna',
+    'North American': 'North American Aviation',
+    'Avro 691 Lancastrian (flying': 'Avro',
+    'Vickers 815': 'Vickers',
+    'Short Sandringham 5 (flying': 'Short Brothers',
+    'Lockheed 188A': 'Lockheed',
+    'PA': 'Piper Aircraft',
+    'Blériot Spad': 'Blériot-SPAD',
+    'AeroflotL5057': 'Aeroflot',
+    'Kalinin': 'Kalinin Aircraft Design Bureau',
+    'Lockheed 1049G Super': 'Lockheed',
+    'Boeing Vertol CH47B': 'Boeing Vertol',
+    'Chance Vought': 'Chance Vought Aircraft',
+    'DC': 'Douglas Aircraft Company',
+    'Sud': 'Sud Aviation',
+    'Yunshuji': 'Harbin Aircraft Manufacturing Corporation',
+    'Bell Huey': 'Bell Helicopter',
+    'Farman F.60': 'Farman Aviation Works',
+    'LET 410M': 'Let Kunovice',
+    'Cessna 208B Grand': 'Cessna',
+    'Lockheed 10E': 'Lockheed',
+    'Embraer 110': 'Embraer',
+    'Sud Aviation SE 210 Caravelle': 'Sud Aviation',
+    'Boeing Vertol': 'Boeing Vertol',
+    'Bristol 170': 'Bristol Aeroplane Company',
+    'Fairchild C119G / Fairchild': 'Fairchild Aircraft',
+    'Waco, model': 'Waco Aircraft Company',
+    'Latécoère 23 (flying': 'Latécoère',
+    'Curtiss C': 'Curtiss Aeroplane and Motor Company',
+    'Eurocopter Deutschland': 'Eurocopter Deutschland',
+    'Nord': 'Nord Aviation',
+    'Bristol 28': 'Bristol Aeroplane Company',
+    'Short S23 ‘C’ Class flying': 'Short Brothers',
+    'Martin PBM': 'Glenn L. Martin Company',
+    'Avro  685 York': 'Avro',
+    'Vickers Viscount 827 / Fokker': 'Vickers',
+    'Loening': 'Loening Aeronautical Engineering',
+    'Curtis': 'Curtiss Aeroplane and Motor Company',
+    'Vickers Viscount 764': 'Vickers',
+    'VC': 'Vickers',
+    'Bristol 175 Britannia': 'Bristol Aeroplane Company',
+    '?NC21V': 'Unknown',
+    'Grumman G73T Turbo': 'Grumman',
+    'Caudron': 'Caudron',
+    'Embraer 120': 'Embraer',
+    'Potez': 'Potez',
+    'Vickers 708': 'Vickers',
+    'Latécoère 300 (float': 'Latécoère',
+    'Mil Mi 8T': 'Mil Moscow Helicopter Plant',
+    'Arado': 'Arado Flugzeugwerke',
+    'Beech': 'Beechcraft',
+    'Cessna 208B Caravan I Super': 'Cessna',
+    'Lockheed Vega': 'Lockheed',
+    'HAL': 'Hindustan Aeronautics Limited',
+    'Hindustan Aeronautics': 'Hindustan Aeronautics Limited',
+    'CASA 212 Aviocar': 'Construcciones Aeronáuticas SA',
+    'IPTN 332C Super': 'IPTN (Indonesian Aerospace)',
+    'M28': 'PZL Mielec',
+    'SNCASE': 'Société Nationale de Constructions Aéronautiques du Sud-Est',
+    'Lockheed 049': 'Lockheed',
+    'Cessna 421 Golden': 'Cessna',
+    'Short Empire flying': 'Short Brothers',
+    'Vickers 785D': 'Vickers',
+    'SNIAS': 'Société Nationale Industrielle Aérospatiale',
+    'British Aerospace Jetstream': 'British Aerospace',
+    'Avro 683': 'Avro',
+    'Cessna 207 / Cessna': 'Cessna',
+    'Five Grumman TBM': 'Grumman',
+    'UC': 'Unknown',
+    'Zeppelin Dixmunde': 'Luftschiffbau Zeppelin',
+    'Curtiss Wright': 'Curtiss-Wright Corporation',
+    'MD': 'McDonnell Douglas',
+    'McDonnell': 'McDonnell Aircraft Corporation',
+    'Fairchild Pilgrim': 'Fairchild Aircraft',
+    'KB': 'Unknown',
+    'Nakajima': 'Nakajima Aircraft Company',
+    'Ryan': 'Ryan Aeronautical',
+    'GAF Nomad': 'Government Aircraft Factories',
+    'Heinkel': 'Heinkel Flugzeugwerke',
+    'Rockwell International': 'Rockwell International',
+    'Ilyushin 14M': 'Ilyushin',
+    'Li': 'Lisunov',
+    'Tupolev A.N.T.': 'Tupolev',
+    'Cessna 404': 'Cessna',
+    'ATR42': 'ATR Aircraft',
+    'DHC': 'De Havilland Canada',
+    'Mc Donnell Douglas': 'McDonnell Douglas',
+    'Aérospatiale/Aeritalia': 'Aérospatiale',
+    'Lockheed Orion': 'Lockheed',
+    'Travel Air': 'Travel Air Manufacturing Company',
+    'Channel Air': 'Channel Air',
+    'de Havilland Comet': 'De Havilland',
+    'LET 410': 'Let Kunovice',
+    'PZL': 'PZL (Państwowe Zakłady Lotnicze)',
+    'British Aerospace 3101 Jetstream': 'British Aerospace',
+    'Beech Queen Air': 'Beechcraft',
+    'Twin': 'Unknown',
+    'de Havilland DH.104 Dove': 'De Havilland',
+    'ConvairCV': 'Convair',
+    'Eurocopter EC': 'Eurocopter',
+    'Beechcraft Super King Air': 'Beechcraft',
+    'Bandeirante': 'Embraer',
+    'Embraer 110C': 'Embraer',
+    'Embraer 110P': 'Embraer',
+    'Fokker 27 Friendship': 'Fokker',
+    'deHavilland': 'De Havilland',
+    'Boeing 40': 'Boeing',
+    'Consolidated  32 Liberator': 'Consolidated Aircraft',
+    'Cessna 208A Caravan I': 'Cessna',
+    'Cessna 560 Citation': 'Cessna',
+    'Pitcairn': 'Pitcairn Aircraft Company',
+    'Transall': 'Transall',
+    'Vickers 628 Viking': 'Vickers',
+    'Nord 2501': 'Nord Aviation',
+    'Vickers 813': 'Vickers',
+    'Fairchild?': 'Fairchild Aircraft',
+    'Lioré': 'Lioré et Olivier',
+    'Vickers 952F': 'Vickers',
+    'Airspeed Ambassador': 'Airspeed Limited',
+    'IAI 1124': 'Israel Aerospace Industries',
+    'Casa 212': 'Construcciones Aeronáuticas SA',
+    'Beechcraft Bonanza': 'Beechcraft',
+    'Vickers 614 Viking': 'Vickers',
+    'Fokker Universal': 'Fokker',
+    'Mc Donnell Dougals': 'McDonnell Douglas',
+    'Swearingen SA.227AT Merlin': 'Fairchild Swearingen',
+    'Latécoère': 'Latécoère',
+    'Cant': 'Cantieri Aeronautici e Navali Triestini',
+    'Dormier': 'Dornier',
+    'Latecoere 301 (flying': 'Latécoère',
+    'Sikorsky CH53D / Sikorsky CH53D357 /': 'Sikorsky Aircraft',
+    'PAC': 'Pacific Aerospace',
+    'Bombardier': 'Bombardier Aerospace',
+    'Desoutter': 'Desoutter Aircraft Company',
+    'Embraer 110P2': 'Embraer',
+    'Vickers Valetta': 'Vickers',
+    'Harbin Yunshuji': 'Harbin Aircraft Manufacturing Company',
+    
+    'Lockheed  188A': 'Lockheed',
+    'Curtiss Carrier': 'Curtiss',
+    'MH': 'Unknown',
+    'Junkers 52/3m': 'Junkers',
+    'de Havilland DHC': 'De Havilland Canada',
+    'Eurocopter  AS332L2 Super': 'Eurocopter',
+    'V6': 'Unknown',
+    'Avia': 'Avia',
+    'Swearingen SA.226TC Metro': 'Swearingen',
+    'Grummand': 'Grumman',
+    'Vickers Viscount 754D / Douglas': 'Vickers',
+    'Beechcraft B200 Super King': 'Beechcraft',
+    'Dirigible Roma': 'Italian Airship Works (Roma)',
+    'Helicopter?': 'Unknown',
+    'BAe': 'British Aerospace',
+    'Lear Jet': 'Learjet',
+    'Sabca': 'SABCA',
+    'Vickers 615 Viking': 'Vickers',
+    'Breguet 14': 'Breguet',
+    'Lockheed L 1049G Super': 'Lockheed',
+    'de Hav Can.': 'De Havilland Canada',
+    'F': 'Unknown',
+    'Shaanxi Yunshuji': 'Shaanxi Aircraft Corporation',
+    'Black Hawk': 'Sikorsky',
+    'Hawker Siddeley HS': 'Hawker Siddeley',
+    'Beech King Air 200': 'Beechcraft',
+    'Swearingen SA.227AC': 'Swearingen',
+    'Martin 202A /': 'Martin',
+    'DC3(C47)FAC': 'Douglas',
+    'Vickers': 'Vickers',
+    'Dewoitine': 'Dewoitine',
+    'SNCASE SE.2010': 'SNCASE',
+    'CMASA': 'CMASA',
+    'Lockheed P2V': 'Lockheed',
+    'Lockheed 1329 Jetstar': 'Lockheed',
+    'CH53E Sea': 'Sikorsky',
+    'Lockheed Hercules': 'Lockheed',
+    'Savoia Marchetti': 'Savoia-Marchetti',
+    'Vickers Valetta Mk1 / Avero LancasterVX562 /': 'Vickers / Avro',
+    'AirbusA310': 'Airbus',
+    'Lockheed 1049E Super': 'Lockheed',
+    'Embraer 120RT': 'Embraer',
+    'Lockheed 14H Super': 'Lockheed',
+    'Britten Norman BN': 'Britten-Norman',
+    'Cessna 441': 'Cessna',
+    'Avro 688 Tudor': 'Avro',
+    'Bell 206': 'Bell',
+    'Curtiss Condor': 'Curtiss',
+    'Embraer 110P1A': 'Embraer',
+    'Stinson Reliant': 'Stinson',
+    'Wapiti?': 'Westland',
+    'Fokker 28 Fellowship': 'Fokker',
+    'GAF N22B': 'GAF',
+    'Military': 'Unknown',
+    'Vickers 802': 'Vickers',
+    'de Havilland Dove': 'De Havilland',
+    'Boeing B52 Stratofortress/Boeing KC': 'Boeing',
+    'Casa 352': 'CASA',
+    'Shaanxi': 'Shaanxi Aircraft Corporation',
+    'Short Sunderland 9 (flying': 'Short Brothers',
+    'Vultee': 'Vultee',
+    'BAE Avro': 'British Aerospace',
+    'LET  410M': 'LET',
+    'Tupolev TU': 'Tupolev',
+    'Ilyushin76TD4K': 'Ilyushin',
+    'Helicopter, Hughes': 'Hughes',
+    'Rockwell Sabreliner': 'Rockwell International',
+    'Short Sandringham 2 (flying': 'Short Brothers',
+    'Lasco': 'LASCO',
+    'Fiat': 'Fiat Aviazione',
+    'Boeing 377': 'Boeing',
+    'Schutte': 'Schütte-Lanz',
+    'Spartan': 'Spartan Aircraft',
+    'Airspeed AS.57 Ambassador': 'Airspeed',
+    'Handley Page Hastings C Mark': 'Handley Page',
+    'Vickers 74': 'Vickers',
+    'Aerospatiale BAe Concorde': 'Aérospatiale',
+    'Beechcraft 1900D / Cessna': 'Beechcraft',
+    'LVG C': 'LVG',
+    'Consolidated Catalina': 'Consolidated',
+    'Hawker': 'Hawker Aircraft',
+    'Volpar': 'Volpar',
+    'FD Type': 'Unknown',
+    'Beechcraft B300 King': 'Beechcraft',
+    'Lockheed 1049C Super': 'Lockheed',
+    'Avro 685': 'Avro',
+    'Saro': 'Saunders-Roe',
+    'EC': 'Eurocopter',
+    'British Aerospace  BAe Jetstream': 'British Aerospace',
+    'Vickers 798D': 'Vickers',
+    'General': 'General Aircraft Limited',
+    'CMASA Wal (flying': 'CMASA',
+    'Consolidated Liberator B24': 'Consolidated',
+    'Fairchild packet (C119 flying': 'Fairchild',
+    'Fokker (KLM)': 'Fokker',
+    'Dirigible?': 'Unknown',
+    'R4D': 'Douglas',
+    'Mitsubishi MU 2B': 'Mitsubishi',
+    'Beech King Air': 'Beechcraft',
+    'Sikorsky  S 76': 'Sikorsky',
+    'Sikorsky S': 'Sikorsky',
+    'Antonov An': 'Antonov',
+    'Ilushin': 'Ilyushin',
+    'Iluyshin': 'Ilyushin',
+    'Junkers JU86': 'Junkers',
+    'Vickers 837': 'Vickers',
+    'Caravelle': 'Sud Aviation',
+    'Kubicek BB85Z Hot Air': 'Kubicek Balloons',
+    'Sukhoi': 'Sukhoi',
+    'EMB 721C': 'Embraer',
+    'Fairchild Hiller': 'Fairchild Hiller',
+    'Bell 407 / Bell 407N407GA /': 'Bell',
+    'de Havilland Can.': 'De Havilland Canada',
+    'Domier Delphin III (flying': 'Dornier',
+    'Avro 691': 'Avro',
+    'Embraer 820C': 'Embraer',
+    'Lockheed 10C': 'Lockheed',
+    'Beechcraft A100 King': 'Beechcraft',
+    'KJ': 'Unknown',
+    'PBY': 'Consolidated',
+    'Xian Yunshuji': 'Xian Aircraft Industrial Corporation',
+    'Airspeed': 'Airspeed',
+    'Zepplin': 'Zeppelin',
+    'AEGKD': 'AEG',
+    'VEB': 'VEB Flugzeugbau',
+    'Bleriot Spad': 'Blériot-SPAD',
+    'Lockheed 1649A': 'Lockheed',
+    'Sikorsly': 'Sikorsky',
+    'de Havilland DH.89 Dragon': 'De Havilland',
+    'Sirkorsky': 'Sikorsky',
+    'MI 172 V5': 'Mil',
+    'Swearingen 226TC Metro': 'Swearingen',
+    'Aerospeciale': 'Aérospatiale',
+    'B': 'Unknown',
+    'Noorduyn': 'Noorduyn',
+    'BAC One Eleven': 'British Aircraft Corporation',
+    'L': 'Unknown',
+    'Boeing Vertol Chinook': 'Boeing Vertol',
+    'Socata': 'SOCATA',
+    'Piaggio': 'Piaggio Aerospace',
+    'Ilysushin': 'Ilyushin',
+    'Cessna 404 Titan Courier': 'Cessna',
+    'Koolhoven': 'Koolhoven',
+    'Pitcairns': 'Pitcairn',
+    'Cessna 550 Citation': 'Cessna',
+    'Both Eurocopter': 'Eurocopter',
+    'Airship?': 'Unknown',
+    'Armstrong Whitworth Argosy': 'Armstrong Whitworth',
+    'Rockwell 500S Shrike': 'Rockwell International',
+    'Aerospatiale Nord': 'Aérospatiale',
+    'Avro 689 Tudor': 'Avro',
+    'Sepecat Jaguar': 'SEPECAT',
+    '?139': 'Unknown',
+    'Grummand Gulfstream': 'Grumman',
+    'Dassault': 'Dassault Aviation',
+    'Vickers 604 Viking': 'Vickers',
+    'IAI Attava': 'Israel Aerospace Industries',
+    'de Havilland Dragon': 'De Havilland',
+    'Blackburn Beverley C Mark': 'Blackburn',
+    'Boeing 737 Max': 'Boeing',
+    'Latecoere 631 (sea': 'Latécoère',
+    'Rochrbach': 'Rohrbach',
+    'Aerospatiale AS350BA': 'Aérospatiale',
+    'MiG': 'Mikoyan-Gurevich',
+    'Savoia Marchetti SM': 'Savoia-Marchetti',
+    'H': 'Unknown',
+    'Fokker F10A': 'Fokker',
+    'Mc Donnell Douglas 369FF': 'McDonnell Douglas',
+    'Aeromarine Model 85 (flying': 'Aeromarine',
+    'IAI Arava': 'Israel Aerospace Industries',
+    'Eurocopter AS': 'Eurocopter',
+    'Northrop Alpha': 'Northrop',
+    'Fairchild R4Q / Dougas': 'Fairchild / Douglas',
+    'AT L98': 'Unknown',
+    'IAI 1124A Westwind': 'Israel Aerospace Industries',
+    'Tuolev': 'Tupolev',
+    'Avro York': 'Avro',
+    'Handley Page Jetstream': 'Handley Page',
+    'Saab340BB': 'Saab',
+    'Vickers 616 Viking': 'Vickers',
+    'Aerospatiale Caravelle Super': 'Aérospatiale',
+    'British Aerospace 748': 'British Aerospace',
+    'Cessna 500 Citation': 'Cessna',
+    'Boeing 307': 'Boeing',
+    'Urocopter AS350': 'Eurocopter',
+    'Antonv': 'Antonov',
+    'SPCA Meteore': 'SPCA',
+    'Eurocopter AS350D': 'Eurocopter',
+    'Swearingen SA227AC Metro': 'Swearingen',
+    'Illyushin': 'Ilyushin',
+    'Dassault Breguet': 'Dassault-Breguet',
+    'Bristol 170 Freighter 31 Mark': 'Bristol',
+    'Grumman Gulfstream': 'Grumman',
+    'McDonnel': 'McDonnell Aircraft',
+    'Embraer 110 P1': 'Embraer',
+    'Liore': 'Lioré et Olivier',
+    'PBY4': 'Consolidated',
+    'Vickers 639 Viking': 'Vickers',
+    'Stinson SM6000B': 'Stinson',
+    'Aerospatiale 330G': 'Aérospatiale',
+    'Sukhoi Superjet': 'Sukhoi',
+    'Xian': 'Xian Aircraft Industrial Corporation',
+    'CH': 'Unknown',
+    'Vickers Viscount 745D /': 'Vickers',
+    'Rockwell Gulfstream Jetprop 840': 'Rockwell International',
+    'Ford model': 'Ford Motor Company',
+    'Handley Page Hastings': 'Handley Page',
+    'Westland Sea King': 'Westland',
+    'Beechcraft B300 King Air': 'Beechcraft',
+    'CF': 'Unknown',
+    'Swear.': 'Swearingen',
+    'BAe Jetstream': 'British Aerospace',
+    'Boeing CH47A': 'Boeing',
+    'Boeing Vertol CH47A': 'Boeing Vertol',
+    'Handley Page Halifax': 'Handley Page',
+    'Cessna 404 Titan': 'Cessna',
+    'Lockheed L188A': 'Lockheed',
+    'Vickers 620 Viking': 'Vickers',
+    'Travel Air 6000': 'Travel Air',
+    'Robertson R44': 'Robinson',
+    'Saab Scandia / Cessna': 'Saab',
+    'Douglas DC': 'Douglas',
+    'Stinson?': 'Stinson',
+    'Short Solent 3 (flying': 'Short Brothers',
+    'AAC': 'AAC',
+    'Cessna 421C Golden': 'Cessna',
+    'Lockheed 749': 'Lockheed',
+    'Super Zeppelin': 'Zeppelin',
+    'Tempest?': 'Hawker',
+'Aerospatiale 330J': 'Aérospatiale',
+'Vickers 828': 'Vickers-Armstrongs',
+'Aerospatiale Alenia': 'Aérospatiale',
+'Bell 412': 'Bell Helicopter',
+'Burgess': 'Burgess Company',
+'Aerospatiale AS 332L1 Super': 'Aérospatiale',
+'Eurocopter EC135': 'Eurocopter',
+'Short Sunderland': 'Short Brothers',
+'Budd': 'Budd Company',
+'IAI 1124A': 'Israel Aircraft Industries',
+'Northrop': 'Northrop Corporation',
+'?42': 'Unknown',
+'Hamilton': 'Hamilton Metalplane Company',
+'Fokker F27 Friendship': 'Fokker',
+'Lockhed 10': 'Lockheed',
+'Grazhdansky Vozdushnyi Flot': 'Aeroflot',
+'Aerospatiale AS 350B2': 'Aérospatiale',
+'BAe 3101 Jetstream': 'British Aerospace',
+'Swearingen SA227AT Merlin': 'Swearingen Aircraft',
+'?VP': 'Unknown',
+'Boeing 314A': 'Boeing',
+'Cessna 208': 'Cessna',
+'Short S.23 Empire Flying': 'Short Brothers',
+'Vickers 720': 'Vickers-Armstrongs',
+'Beechcraft 100 King': 'Beechcraft',
+'Vickers 610': 'Vickers-Armstrongs',
+'Salmson': 'Salmson',
+'Short Stirling': 'Short Brothers',
+'Dornier DO.18 (float': 'Dornier',
+'Savbia': 'Unknown',
+'A': 'Unknown',
+'Short Calcutta (flying': 'Short Brothers',
+'Bell 204B': 'Bell Helicopter',
+'Canadair CRJ200LR': 'Canadair',
+'BAC One': 'British Aircraft Corporation',
+'Boeing  377': 'Boeing',
+'de havilland 89 Dragon': 'De Havilland',
+'Rutan Long EZ (experimental': 'Rutan Aircraft Factory',
+'Agusta A109A MK': 'Agusta',
+'Boeing Vetrol 107 II': 'Boeing Vertol',
+'Enstrom': 'Enstrom Helicopter Corporation',
+'Lockheed 10A': 'Lockheed',
+'Sirkorsky 44A (flying': 'Sikorsky',
+'Blackburn': 'Blackburn Aircraft',
+'Shorts SC.7 Skyvan': 'Short Brothers',
+'Short Sandringham 6 (flying': 'Short Brothers',
+'Cessna 402C': 'Cessna',
+'Faucett': 'Faucett Perú',
+'Sikorksky': 'Sikorsky',
+'de Havilland DH114 Heron': 'De Havilland',
+'GVF': 'Aeroflot',
+'Ilyushin IL': 'Ilyushin',
+'Bell 214ST': 'Bell Helicopter',
+'Aero Commander AC': 'Aero Commander',
+'Cessna 208 Caravan': 'Cessna',
+'Fairey Firefly': 'Fairey Aviation',
+'LET 410MT': 'Let Kunovice',
+'Bell 214': 'Bell Helicopter',
+'Boeing 307 Stratoliner': 'Boeing',
+'Beech 200 Super King': 'Beechcraft',
+'British Aerospace Nimrod': 'British Aerospace',
+'de Havilland Canada DHC 3T Turbine': 'De Havilland Canada',
+'Soloy': 'Soloy Aviation Solutions',
+'Beechcraft SKA': 'Beechcraft',
+'de havilland Canada Twin Otter': 'De Havilland Canada',
+'Saab Scandia': 'Saab',
+'Cessna 501': 'Cessna',
+'Hawker Siddeley Trident 2E /': 'Hawker Siddeley',
+'Lockheed  5': 'Lockheed',
+'Fokker UniversalNC52': 'Fokker',
+'Transportes Aéreos': 'Unknown',
+'Vickers 634': 'Vickers-Armstrongs',
+'Vickers 621 Viking': 'Vickers-Armstrongs',
+'Bloch': 'SNCASO (Bloch)',
+'Spad': 'SPAD',
+'Wright': 'Wright Company',
+'Cessna 441 Conquest': 'Cessna',
+'Fokker Super': 'Fokker',
+'CRDA CANT': 'CANT (Cantieri Aeronautici e Navali Triestini)',
+'Let Aero': 'Let Kunovice',
+'Rockwell': 'Rockwell International',
+'Boulton and Paul': 'Boulton & Paul Ltd',
+'Fletcher': 'Fletcher Aviation',
+'Cessna 402 / Piper': 'Cessna',
+'Dirigible': 'Various',
+'Stinson SM': 'Stinson Aircraft Company',
+'AeroflotCCCP': 'Aeroflot',
+'de Havilland 89A Dragon': 'De Havilland',
+'Avro Ninteen': 'Avro',
+'Antonov An26SH76': 'Antonov',
+'Wright Flyer': 'Wright Company'
+}
+
+
+# Standardized manufacturer -> aircraft category; missing ones become "Unknown"
+MANUFACTURER_TO_CATEGORY = {
+    'De Havilland Canada': 'Regional Aircraft',
+    'Douglas': 'Commercial Jet',
+    'Vickers': 'Commercial Jet',
+    'Antonov': 'Military Aircraft',
+    'Boeing': 'Commercial Jet',
+    'Airbus': 'Commercial Jet',
+    'Aero Commander': 'General Aviation',
+    'Britten-Norman': 'Regional Aircraft',
+    'Cessna': 'General Aviation',
+    'Hughes': 'Helicopter',
+    'McDonnell Douglas': 'Commercial Jet',
+    'Pilgrim Aircraft': 'General Aviation',
+    'Ilyushin': 'Military Aircraft',
+    'Hawker Siddeley': 'Military Aircraft',
+    'Avro': 'Military Aircraft',
+    'Lockheed': 'Military Aircraft',
+    'Swearingen': 'Regional Aircraft',
+    'Yakovlev': 'Military Aircraft',
+    'Curtiss-Wright': 'Military Aircraft',
+    'Mil': 'Helicopter',
+    'Convair': 'Commercial Jet',
+    'Consolidated Aircraft': 'Military Aircraft',
+    'Embraer': 'Regional Aircraft',
+    'Learjet': 'General Aviation',
+    'NAMC': 'Commercial Jet',
+    'CAMS (Canadair Argus Modification Support?)': 'Unknown',
+    'Ford': 'General Aviation',
+    'Grumman': 'Military Aircraft',
+    'De Havilland': 'Regional Aircraft',
+    'Pilatus': 'General Aviation',
+    'Sikorsky': 'Helicopter',
+    'Unknown': 'Unknown',
+    'Aérospatiale': 'Helicopter',
+    'Bell': 'Helicopter',
+    'Handley Page': 'Military Aircraft',
+    'Canadair': 'Regional Aircraft',
+    'Bristol': 'Military Aircraft',
+    'Fokker': 'Regional Aircraft',
+    'Junkers': 'Military Aircraft',
+    'Sud Aviation': 'Helicopter',
+    'British Aircraft Corporation (BAC)': 'Commercial Jet',
+    'Aerocomp': 'General Aviation',
+    'Fairchild': 'Regional Aircraft',
+    'Farman': 'Military Aircraft',
+    'Dornier': 'Military Aircraft',
+    'Aviation Traders': 'Commercial Jet',
+    'Focke-Wulf': 'Military Aircraft',
+    'Messerschmitt': 'Military Aircraft',
+    'Beechcraft': 'General Aviation',
+    'Swallow': 'General Aviation',
+    'Stearman': 'General Aviation',
+    'British Aerospace': 'Commercial Jet',
+    'Mitsubishi': 'Regional Aircraft',
+    'Boeing (B-17)': 'Military Aircraft',
+    'Kawasaki': 'Military Aircraft',
+    'Martin (Glenn L. Martin Company)': 'Military Aircraft',
+    'Shin Meiwa': 'Amphibious / Flying Boat',
+    'Harbin Aircraft Manufacturing Company': 'Military Aircraft',
+    'Caudron': 'Military Aircraft',
+    'Bell Helicopter': 'Helicopter',
+    'Lisunov': 'Military Aircraft',
+    'Luftschiffbau Zeppelin': 'Airship',
+    'Saab AB': 'Military Aircraft',
+    'Goodyear Aerospace Corporation': 'Airship',
+    'Short Brothers': 'Amphibious / Flying Boat',
+    'Stinson Aircraft Company': 'General Aviation',
+    'Fairchild Swearingen': 'Regional Aircraft',
+    'Eurocopter': 'Helicopter',
+    'Piper': 'General Aviation',
+    'Let Kunovice': 'Regional Aircraft',
+    'ATR Aircraft': 'Regional Aircraft',
+    'Tupolev': 'Military Aircraft',
+    'Dassault Aviation': 'Military Aircraft',
+    'Boeing Vertol': 'Helicopter',
+    'Breguet Aviation': 'Military Aircraft',
+    'Rohrbach Metall-Flugzeugbau': 'Military Aircraft',
+    'General Aviation Manufacturers': 'General Aviation',
+    'Lockheed Martin': 'Military Aircraft',
+    'Reims Aviation': 'General Aviation',
+    'Lioré et Olivier': 'Military Aircraft',
+    'Piper Aircraft': 'General Aviation',
+    'Howard Aircraft Corporation': 'General Aviation',
+    'Latécoère': 'Military Aircraft',
+    'Sikorsky Aircraft': 'Helicopter',
+    'Supermarine': 'Military Aircraft',
+    'Construcciones Aeronáuticas SA': 'Military Aircraft',
+    'Bristol Aeroplane Company': 'Military Aircraft',
+    'Savoia-Marchetti': 'Military Aircraft',
+    'Armstrong Whitworth Aircraft': 'Military Aircraft',
+    'Royal Airship Works': 'Airship',
+    'Société des Avions Michel Wibault': 'Military Aircraft',
+    'Hindustan Aeronautics Limited': 'Military Aircraft',
+    'Pacific Aerospace': 'General Aviation',
+    'Iran Aircraft Manufacturing Industrial Company': 'Military Aircraft',
+    'Caproni': 'Military Aircraft',
+    'Aeronautica Macchi': 'Military Aircraft',
+    'Blériot Aéronautique': 'Military Aircraft',
+    'Siebel Flugzeugwerke': 'Military Aircraft',
+    'British Aircraft Corporation': 'Commercial Jet',
+    'IAI (Israel Aerospace Industries)': 'Military Aircraft',
+    'North American Aviation': 'Military Aircraft',
+    'Blériot-SPAD': 'Military Aircraft',
+    'Aeroflot': 'Unknown',
+    'Kalinin Aircraft Design Bureau': 'Military Aircraft',
+    'Chance Vought Aircraft': 'Military Aircraft',
+    'Douglas Aircraft Company': 'Commercial Jet',
+    'Harbin Aircraft Manufacturing Corporation': 'Military Aircraft',
+    'Farman Aviation Works': 'Military Aircraft',
+    'Fairchild Aircraft': 'General Aviation',
+    'Waco Aircraft Company': 'General Aviation',
+    'Curtiss Aeroplane and Motor Company': 'Military Aircraft',
+    'Eurocopter Deutschland': 'Helicopter',
+    'Nord Aviation': 'Military Aircraft',
+    'Glenn L. Martin Company': 'Military Aircraft',
+    'Loening Aeronautical Engineering': 'Amphibious / Flying Boat',
+    'Potez': 'Military Aircraft',
+    'Mil Moscow Helicopter Plant': 'Helicopter',
+    'Arado Flugzeugwerke': 'Military Aircraft',
+    'IPTN (Indonesian Aerospace)': 'Military Aircraft',
+    'PZL Mielec': 'Military Aircraft',
+    'Société Nationale de Constructions Aéronautiques du Sud-Est': 'Military Aircraft',
+    'Société Nationale Industrielle Aérospatiale': 'Helicopter',
+    'Curtiss-Wright Corporation': 'Military Aircraft',
+    'McDonnell Aircraft Corporation': 'Military Aircraft',
+    'Nakajima Aircraft Company': 'Military Aircraft',
+    'Ryan Aeronautical': 'Military Aircraft',
+    'Government Aircraft Factories': 'Military Aircraft',
+    'Heinkel Flugzeugwerke': 'Military Aircraft',
+    'Rockwell International': 'Military Aircraft',
+    'Travel Air Manufacturing Company': 'General Aviation',
+    'Channel Air': 'Unknown',
+    'PZL (Państwowe Zakłady Lotnicze)': 'Military Aircraft',
+    'Pitcairn Aircraft Company': 'General Aviation',
+    'Transall': 'Military Aircraft',
+    'Airspeed Limited': 'Military Aircraft',
+    'Israel Aerospace Industries': 'Military Aircraft',
+    'Cantieri Aeronautici e Navali Triestini': 'Military Aircraft',
+    'Bombardier Aerospace': 'Regional Aircraft',
+    'Desoutter Aircraft Company': 'General Aviation',
+    'Curtiss': 'Military Aircraft',
+    'Avia': 'Military Aircraft',
+    'Italian Airship Works (Roma)': 'Airship',
+    'SABCA': 'Military Aircraft',
+    'Breguet': 'Military Aircraft',
+    'Shaanxi Aircraft Corporation': 'Military Aircraft',
+    'Martin': 'Military Aircraft',
+    'Dewoitine': 'Military Aircraft',
+    'SNCASE': 'Military Aircraft',
+    'CMASA': 'Military Aircraft',
+    'Vickers / Avro': 'Military Aircraft',
+    'Stinson': 'General Aviation',
+    'Westland': 'Military Aircraft',
+    'GAF': 'Military Aircraft',
+    'CASA': 'Military Aircraft',
+    'Vultee': 'Military Aircraft',
+    'LET': 'Regional Aircraft',
+    'LASCO': 'Military Aircraft',
+    'Fiat Aviazione': 'Military Aircraft',
+    'Schütte-Lanz': 'Airship',
+    'Spartan Aircraft': 'General Aviation',
+    'Airspeed': 'Military Aircraft',
+    'LVG': 'Military Aircraft',
+    'Consolidated': 'Military Aircraft',
+    'Hawker Aircraft': 'Military Aircraft',
+    'Volpar': 'General Aviation',
+    'Saunders-Roe': 'Amphibious / Flying Boat',
+    'General Aircraft Limited': 'Military Aircraft',
+    'Kubicek Balloons': 'Glider',
+    'Sukhoi': 'Military Aircraft',
+    'Fairchild Hiller': 'Helicopter',
+    'Xian Aircraft Industrial Corporation': 'Military Aircraft',
+    'Zeppelin': 'Airship',
+    'AEG': 'Military Aircraft',
+    'VEB Flugzeugbau': 'Military Aircraft',
+    'Noorduyn': 'Military Aircraft',
+    'SOCATA': 'General Aviation',
+    'Piaggio Aerospace': 'General Aviation',
+    'Koolhoven': 'Military Aircraft',
+    'Pitcairn': 'General Aviation',
+    'Armstrong Whitworth': 'Military Aircraft',
+    'SEPECAT': 'Military Aircraft',
+    'Blackburn': 'Military Aircraft',
+    'Rohrbach': 'Military Aircraft',
+    'Mikoyan-Gurevich': 'Military Aircraft',
+    'Aeromarine': 'Amphibious / Flying Boat',
+    'Northrop': 'Military Aircraft',
+    'Fairchild / Douglas': 'Commercial Jet',
+    'Saab': 'Military Aircraft',
+    'SPCA': 'Military Aircraft',
+    'Dassault-Breguet': 'Military Aircraft',
+    'McDonnell Aircraft': 'Military Aircraft',
+    'Ford Motor Company': 'General Aviation',
+    'Travel Air': 'General Aviation',
+    'Robinson': 'Helicopter',
+    'AAC': 'Military Aircraft',
+    'Hawker': 'Military Aircraft',
+    'Vickers-Armstrongs': 'Military Aircraft',
+    'Burgess Company': 'General Aviation',
+    'Budd Company': 'General Aviation',
+    'Israel Aircraft Industries': 'Military Aircraft',
+    'Northrop Corporation': 'Military Aircraft',
+    'Hamilton Metalplane Company': 'General Aviation',
+    'Swearingen Aircraft': 'Regional Aircraft',
+    'Salmson': 'Military Aircraft',
+    'Rutan Aircraft Factory': 'Experimental / Homebuilt',
+    'Agusta': 'Helicopter',
+    'Enstrom Helicopter Corporation': 'Helicopter',
+    'Blackburn Aircraft': 'Military Aircraft',
+    'Faucett Perú': 'Commercial Jet',
+    'Fairey Aviation': 'Military Aircraft',
+    'Soloy Aviation Solutions': 'General Aviation',
+    'SNCASO (Bloch)': 'Military Aircraft',
+    'SPAD': 'Military Aircraft',
+    'Wright Company': 'Military Aircraft',
+    'CANT (Cantieri Aeronautici e Navali Triestini)': 'Military Aircraft',
+    'Boulton & Paul Ltd': 'Military Aircraft',
+    'Fletcher Aviation': 'General Aviation',
+    'Various': 'Unknown'
+}
@@ -1,50 +1,77 @@
+from concurrent.futures import wait
+
 import pandas as pd 
-import altair as alt 
 import streamlit as st 
 
+from approximate import APPROXIMATE_SECTIONS, EXACT_WAIT_SECONDS, ExactJobs, StratifiedSample, estimate, time_scope
+from data_loader import load_air, load_crashes
+from precompute import PrecomputedTables, precompute_in_background
+from profiling import Profiler, profiling_enabled
+from refresher import Refresher
+from startup import build_dataset, read_startup
+from topk import RANKED_CHARTS, Rankings
+from report import SECTIONS
+from result_cache import ResultCache, filter_key
+
 # st.title("AirCrashes Report Analysis (1908 - 2024)")
 
-air = pd.read_excel("Cleaned_aircrashes_dataset.xlsx")
+# Stage timings with AIRCRASH_PROFILE=1 or ?profile=1; allocation peaks only with AIRCRASH_PROFILE=1
+profile = profiling_enabled(st.query_params)
+page_profiler = Profiler(profile, "page")
 
 # st.dataframe(air)
 
-air['Year'] = air['Date'].dt.year
-air = air.rename(columns={
-    "Country Only": "Country",
-    "decade": "Decade"
-})
-
-filters = {
-"Quarter": air['Quarter'].unique(),
-"Country" : air["Country"].unique(),
-"Continent" : air['Continent'].unique(),
-"Decade" : air["Decade"].unique(),
-"Aircraft Category" : air['Aircraft Category'].unique(),
-"Year": air['Year'].unique()
-
-}
-
-selected_filters = {}
-
-for key, options in filters.items():
-    selected_filters[key] = st.sidebar.multiselect(key, options)
-
-filtered_air = air.copy()
-
-for key, selected_values in selected_filters.items():
-    if selected_values:
-        filtered_air = filtered_air[filtered_air[key].isin(selected_values)]
-
-# st.dataframe(filtered_air)
-
-
-Total_People_aboard = filtered_air['Aboard'].sum()
-Total_Air_Fatalities = filtered_air['Fatalities (air)'].sum()
-Total_Ground_Cases = filtered_air['Ground'].sum()
-Countries = filtered_air['Country'].nunique()
-Aircraft_Manufacturers = filtered_air['Aircraft Manufacturer'].nunique()
-Total_survivors = (filtered_air['Aboard'] - filtered_air['Fatalities (air)']).sum()
-Total_deaths = filtered_air['Fatalities (air)'].sum() + filtered_air['Ground'].sum()
+@st.cache_resource
+def get_refresher():
+    # Pre-aggregated cube, its filter engine and the KPI engine, shared by all sessions.
+    # A background thread rebuilds them when the workbook or the store changes and swaps
+    # them in when done; until then everyone keeps getting the previous data.
+    return Refresher(build=build_dataset).start()
+
+@st.cache_resource(max_entries=1)
+def get_precomputed(version):
+    # Manufacturer tables (questions 8-10) for the coarse filters, filled in by a background
+    # job on first use; until it finishes every selection is computed on the fly
+    precompute_in_background(version)
+    return PrecomputedTables(version)
+
+@st.cache_resource(max_entries=1)
+def get_sample(version):
+    # Stratified sample behind the approximate rate charts, drawn once per dataset version
+    return StratifiedSample(load_air())
+
+@st.cache_resource(max_entries=16)
+def get_time_sample(version, decades, years):
+    # Sample of a time-scoped selection, drawn from the selected decades' partitions only
+    return StratifiedSample(load_crashes(list(decades), list(years)))
+
+@st.cache_resource
+def get_exact_jobs():
+    # Exact sections still computing for a session that was shown estimates meanwhile
+    return ExactJobs()
+
+@st.cache_resource(max_entries=1)
+def get_rankings(version, _cube):
+    # Per-partition sorted lists behind the top-N charts (questions 2, 8 and 9)
+    return Rankings(_cube)
+
+@st.cache_resource
+def get_result_cache():
+    # KPIs, chart data and chart specs per filter state and section, shared by all sessions:
+    # room for 64 states of every section, its chart and the top-N charts' ranked data
+    return ResultCache(max_entries=64 * (2 * len(SECTIONS) + len(RANKED_CHARTS)))
+
+refresher = get_refresher()
+with page_profiler.stage("load"):
+    # While a fresh process is still loading the cube, the unfiltered report is drawn from the
+    # startup file written by the previous build: same cost at any data size, no Altair import
+    dataset = refresher.current(wait=False)
+    first_paint = None if dataset else read_startup()
+    if dataset is None and first_paint is None:
+        dataset = refresher.current()
+version, data_as_of = (dataset.version, dataset.as_of) if dataset else (first_paint.version, first_paint.as_of)
+get_precomputed(version)
+result_cache = get_result_cache()
 
 # Inject custom CSS for styling and fade-in animation
 st.markdown("""
@@ -90,370 +117,274 @@ Welcome to the <strong>Aircraft Safety and Risk Analysis Dashboard</strong>. Thi
 """, unsafe_allow_html=True)
 
 
-st.write("### AirCrashes Analysis Overview")
-
-col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
-
-with col1:
-    st.metric("Total People Aboard: ", f"{Total_People_aboard:,.0f}")
-with col2:
-    st.metric("Total Air Fatalities: ", f"{Total_Air_Fatalities:,.0f}")
-with col3:
-    st.metric("Total Ground Cases: ", f"{Total_Ground_Cases:,.0f}")
-with col4:
-    st.metric("Countries: ", Countries)
-with col5:
-    st.metric("Aircraft Manufacturers", Aircraft_Manufacturers)
-with col6:
-    st.metric("Total Survivors: ", f"{Total_survivors:,.0f}")
-with col7:
-    st.metric("Total Deaths: ", f"{Total_deaths:,.0f}")
-
-st.write("### Insights and Analysis Findings")
-
-# Section 1
-st.markdown("""
-<div class='section'>
-<h2>1️⃣ Understanding Seasonal Risk Patterns</h2>
-I began by examining <strong>which quarter of the year experiences the highest number of aircraft incidents</strong>. Seasonal trends help us anticipate peak-risk periods and allocate safety resources effectively.
-</div>
-""", unsafe_allow_html=True)
-
-st.write("#### 1. Which quarter of the year experiences the highest number of aircraft incidents?")
-
-quarter_cases = filtered_air['Quarter'].value_counts().reset_index()
-quarter_cases.columns = ['Quarter', 'Crash_Count']
-
-# st.dataframe(quarter_cases)
-
-chart1 = alt.Chart(quarter_cases).mark_bar().encode(
-    x=alt.X('Quarter:N', sort=['Q1', 'Q2', 'Q3', 'Q4'], title='Quarter'),
-    y=alt.Y('Crash_Count:Q', title='Number of Crashes'),
-    color=alt.Color('Quarter:N', legend=None)
-).properties(
-    width=600,
-    height=400,
-    title='Aircraft Crash Cases per Quarter'
-)
-
-st.altair_chart(chart1, use_container_width=True)
-
-# Section 2
-st.markdown("""
-<div class='section'>
-<h2>2️⃣ Identifying High-Risk Regions</h2>
-Next, I explored <strong>the top 10 countries with the highest passenger fatalities</strong> and <strong>continents with the most ground fatalities</strong>. These insights guide HR in assessing regional safety concerns, managing crew assignments, and designing location-specific safety programs.
-</div>
-""", unsafe_allow_html=True)
-
-st.write("#### 2. Which 10 countries have recorded the highest number of passenger fatalities over time?")
-
-exclude_list = ['Unknown', 'N/A']
-
-# First, filter
-air = air[air['Country'].isin(filtered_air['Country'])]
-
-# Then, do the groupby logic
-top_countries = (
-    air.loc[~air['Country'].isin(exclude_list)]  # Exclude 'Unknown' and 'N/A'
-       .groupby('Country')['Fatalities (air)']
-       .sum()
-       .sort_values(ascending=False)
-       .head(10)
-       .reset_index()
-)
-
-# Show in Streamlit
-# st.dataframe(top_countries)
-
-chart = alt.Chart(data=top_countries).mark_bar().encode(
-    x=alt.X('Fatalities (air):Q', title='Fatalities (air)'),
-    y=alt.Y('Country:N', sort='-x', title='Country'),
-    color=alt.Color('Country:N', legend=None),
-    tooltip=['Country:N', 'Fatalities (air):Q']
-).properties(
-    width=700,
-    height=400,
-    title='Top 10 Countries by Air Fatalities'
-)
-
-# Display chart in Streamlit
-st.altair_chart(chart, use_container_width=True)
-
-st.write("#### 3. Which continents have recorded the most ground fatalities during crashes?")
-
-continent_ground_fatalities = (
-    filtered_air[filtered_air['Continent'] != 'Unknown']
-    .groupby('Continent')['Ground']
-    .sum()
-    .sort_values(ascending=False)
-    .reset_index()
-)
-continent_ground_fatalities.columns = ['Continent', 'Ground_Fatalities']
-
-# st.dataframe(continent_ground_fatalities)
-
-chart = alt.Chart(continent_ground_fatalities).mark_bar().encode(
-    x=alt.X('Ground_Fatalities:Q', title='Ground Fatalities'),
-    y=alt.Y('Continent:N', sort='-x', title='Continent'),
-    color=alt.Color('Continent:N', legend=None),
-    tooltip=['Continent:N', 'Ground_Fatalities:Q']
-).properties(
-    width=600,
-    height=400,
-    title='Ground Fatalities by Continent'
-)
-
-# Display chart
-st.altair_chart(chart, use_container_width=True)
-
-# Section 3
-st.markdown("""
-<div class='section'>
-<h2>3️⃣ Historical Safety Improvements</h2>
-I analyzed <strong>how survival rates versus death rates have changed across decades</strong>, alongside <strong>the trend of average fatalities per year</strong>. This historical perspective shows whether safety measures have improved industry outcomes over time.
-</div>
-""", unsafe_allow_html=True)
-
-st.write("#### 4. How has the survival rate compared to the death rate changed across different decades?")
-
-survival_trend = filtered_air.groupby('Decade').apply(
-    lambda x: pd.Series({
-        'Total_Aboard': x['Aboard'].sum(),
-        'Total_Fatalities': x['Fatalities (air)'].sum()
-    }),
-    include_groups=False
-).reset_index()
-
+# Everything that depends on the filters re-executes on its own when a filter changes;
+# the static CSS, introduction, takeaways and downloads only run on a full page load
+@st.fragment
+def filtered_report():
+    profiler = Profiler(profile, "filters")
+    selected_filters = {}
+    loaded = {"dataset": refresher.current(wait=first_paint is None)}
+
+    def data():
+        # Anything beyond the unfiltered first paint waits for the cube
+        if loaded["dataset"] is None:
+            with profiler.stage("wait_for_cube"):
+                loaded["dataset"] = refresher.current()
+        return loaded["dataset"]
+
+    # Filters live inside the fragment: Streamlit can't put fragment widgets in the sidebar
+    filter_options = loaded["dataset"].filter_engine.options if loaded["dataset"] else first_paint.options
+    with st.expander("🔎 Filters", expanded=True):
+        filter_columns = st.columns(3)
+        for i, (key, options) in enumerate(filter_options.items()):
+            with filter_columns[i % 3]:
+                selected_filters[key] = st.multiselect(key, options)
+        approximate = st.toggle(
+            "≈ Approximate rates while exact results compute", key="approximate",
+            help="Questions 4, 5 and 8-10 are estimated from a stratified sample, with 95% intervals in the "
+                 "tooltips, whenever the exact numbers take longer than a moment; they replace the estimates when ready.",
+        )
+    if any(selected_filters.values()):
+        data()
+
+    # One combined mask (OR within a filter, AND across filters) over the cube cells;
+    # every KPI and chart below is a roll-up of these cells rather than a scan of raw crashes.
+    # Each section is computed the first time it is shown for a filter state and memoized,
+    # so flipping back to a recent selection is free (a cache hit shows no stages in the profile).
+    key = filter_key(selected_filters)
+    views = {}
+
+    def view():
+        if "view" not in views:
+            with profiler.stage("filter", filters=key):
+                views["view"] = data().filter_engine.apply(data().cube, selected_filters)
+        return views["view"]
+
+    def section(name):
+        def compute():
+            found = get_precomputed(data().version).lookup(key)
+            if found is not None and name in found:
+                return found[name]
+            with profiler.stage(f"section:{name}"):
+                return SECTIONS[name](view())
+        return result_cache.get_or_compute(data().version, f"{key}:{name}", compute)
+
+    def ranked(name):
+        # None when the filters cut through the index's partitions; cached like the sections
+        def compute():
+            with profiler.stage(f"rank:{name}"):
+                return get_rankings(data().version, data().cube).chart_data(name, selected_filters)
+        return result_cache.get_or_compute(data().version, f"{key}:{name}:ranked", compute)
+
+    def chart_data(name):
+        # Top-N charts merge the partitions' sorted lists when the filters allow, instead of ranking every group
+        if name in RANKED_CHARTS:
+            found = ranked(name)
+            if found is not None:
+                return found
+        return section(name)
+
+    def sample(version):
+        scope = time_scope(selected_filters)
+        return get_sample(version) if scope is None else get_time_sample(version, *scope)
+
+    def render(name, always=False):
+        # Below the fold, a question's data and chart are only built once the reader asks for them
+        if always or st.toggle("Show chart", key=f"show_{name}"):
+            if loaded["dataset"] is None and name in first_paint.charts:
+                with profiler.stage(f"chart:{name}"):
+                    st.vega_lite_chart(first_paint.charts[name], use_container_width=True)
+                return
+            import charts  # Altair is only imported once a chart has to be built
+            version = data().version
+            if approximate and name in APPROXIMATE_SECTIONS and result_cache.get(version, f"{key}:{name}:chart") is None:
+                # The same path as the exact chart below, which finds the job's data in the shared cache
+                exact = get_exact_jobs().submit((version, key, name), lambda: chart_data(name))
+                if not wait([exact], timeout=EXACT_WAIT_SECONDS).done:
+                    @st.fragment(run_every=1.0)
+                    def approximate_chart():
+                        if exact.done():
+                            # The exact section is in the shared cache now: redraw with it
+                            st.rerun()
+                        chart = result_cache.get_or_compute(
+                            version, f"{key}:{name}:approximate:chart",
+                            lambda: charts.CHARTS[name](estimate(sample(version), name, selected_filters)),
+                        )
+                        st.altair_chart(chart, use_container_width=True)
+                        st.caption("≈ Estimated from a sample (95% intervals in the tooltips); the exact chart replaces it when ready.")
+                    approximate_chart()
+                    return
+            chart = result_cache.get_or_compute(data().version, f"{key}:{name}:chart", lambda: charts.CHARTS[name](chart_data(name)))
+            with profiler.stage(f"chart:{name}"):
+                st.altair_chart(chart, use_container_width=True)
+
+    # Headline numbers are patched by deltas when a single filter value is added or removed
+    with profiler.stage("kpis"):
+        if loaded["dataset"] is None:
+            kpis = first_paint.kpis
+        else:
+            kpis, st.session_state["kpi_state"] = data().kpi_engine.kpis(selected_filters, st.session_state.get("kpi_state"))
+    Total_People_aboard = kpis["Total_People_aboard"]
+    Total_Air_Fatalities = kpis["Total_Air_Fatalities"]
+    Total_Ground_Cases = kpis["Total_Ground_Cases"]
+    Countries = kpis["Countries"]
+    Aircraft_Manufacturers = kpis["Aircraft_Manufacturers"]
+    Total_survivors = kpis["Total_survivors"]
+    Total_deaths = kpis["Total_deaths"]
+
+    st.write("### AirCrashes Analysis Overview")
+
+    col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
+
+    with col1:
+        st.metric("Total People Aboard: ", f"{Total_People_aboard:,.0f}")
+    with col2:
+        st.metric("Total Air Fatalities: ", f"{Total_Air_Fatalities:,.0f}")
+    with col3:
+        st.metric("Total Ground Cases: ", f"{Total_Ground_Cases:,.0f}")
+    with col4:
+        st.metric("Countries: ", Countries)
+    with col5:
+        st.metric("Aircraft Manufacturers", Aircraft_Manufacturers)
+    with col6:
+        st.metric("Total Survivors: ", f"{Total_survivors:,.0f}")
+    with col7:
+        st.metric("Total Deaths: ", f"{Total_deaths:,.0f}")
+
+    st.write("### Insights and Analysis Findings")
+
+    # Section 1
+    st.markdown("""
+    <div class='section'>
+    <h2>1️⃣ Understanding Seasonal Risk Patterns</h2>
+    I began by examining <strong>which quarter of the year experiences the highest number of aircraft incidents</strong>. Seasonal trends help us anticipate peak-risk periods and allocate safety resources effectively.
+    </div>
+    """, unsafe_allow_html=True)
 
-survival_trend['Survival_Rate'] = (survival_trend['Total_Aboard'] - survival_trend['Total_Fatalities']) / survival_trend['Total_Aboard']
-survival_trend['Death_Rate'] = survival_trend['Total_Fatalities'] / survival_trend['Total_Aboard']
+    st.write("#### 1. Which quarter of the year experiences the highest number of aircraft incidents?")
 
-trend_long = survival_trend.melt(id_vars='Decade', value_vars=['Survival_Rate', 'Death_Rate'],
-                                 var_name='Metric', value_name='Rate')
+    # st.dataframe(quarter_cases)
 
-# st.dataframe(survival_trend)
+    render("quarter_cases", always=True)
 
-chart = alt.Chart(trend_long).mark_line(point=True).encode(
-    x=alt.X('Decade:N', title='Decade', sort=None),
-    y=alt.Y('Rate:Q', title='Rate'),
-    color=alt.Color('Metric:N', title='Metric'),
-    tooltip=['Decade:N', 'Metric:N', alt.Tooltip('Rate:Q', format='.2%')]
-).properties(
-    width=700,
-    height=400,
-    title='Survival vs Death Rates Over Decades'
-)
+    # Section 2
+    st.markdown("""
+    <div class='section'>
+    <h2>2️⃣ Identifying High-Risk Regions</h2>
+    Next, I explored <strong>the top 10 countries with the highest passenger fatalities</strong> and <strong>continents with the most ground fatalities</strong>. These insights guide HR in assessing regional safety concerns, managing crew assignments, and designing location-specific safety programs.
+    </div>
+    """, unsafe_allow_html=True)
 
-# Display chart
-st.altair_chart(chart, use_container_width=True)
+    st.write("#### 2. Which 10 countries have recorded the highest number of passenger fatalities over time?")
 
-st.write("#### 5. What is the trend of average fatalities per year in the aviation industry?")
+    # Show in Streamlit
+    # st.dataframe(top_countries)
 
-avg_fatalities_by_year = filtered_air.groupby(air['Date'].dt.year)['Fatalities (air)'].mean().reset_index()
-avg_fatalities_by_year.columns = ['Year', 'Avg_Fatalities']
+    # Display chart in Streamlit
+    render("top_countries", always=True)
 
-# st.dataframe(avg_fatalities_by_year)
+    st.write("#### 3. Which continents have recorded the most ground fatalities during crashes?")
 
-chart = alt.Chart(avg_fatalities_by_year).mark_line(point=True).encode(
-    x=alt.X('Year:O', title='Year'),
-    y=alt.Y('Avg_Fatalities:Q', title='Average Fatalities per Crash'),
-    tooltip=['Year:O', alt.Tooltip('Avg_Fatalities:Q', format=',.2f')]
-).properties(
-    width=700,
-    height=400,
-    title='Yearly Trend of Average Fatalities per Crash'
-)
+    # st.dataframe(continent_ground_fatalities)
 
-# Display chart
-st.altair_chart(chart, use_container_width=True)
+    # Display chart
+    render("continent_ground_fatalities")
 
-# Section 4
-st.markdown("""
-<div class='section'>
-<h2>4️⃣ Multi-Dimensional Impact Across Decades</h2>
-I compared <strong>ground fatalities, in-air fatalities, and people aboard across decades</strong>. This gives us a holistic view of how different aspects of crash severity have evolved, informing HR on whether current operational practices are reducing overall impact.
-</div>
-""", unsafe_allow_html=True)
+    # Section 3
+    st.markdown("""
+    <div class='section'>
+    <h2>3️⃣ Historical Safety Improvements</h2>
+    I analyzed <strong>how survival rates versus death rates have changed across decades</strong>, alongside <strong>the trend of average fatalities per year</strong>. This historical perspective shows whether safety measures have improved industry outcomes over time.
+    </div>
+    """, unsafe_allow_html=True)
 
-st.write("#### 6. How do ground fatalities, in-air fatalities, and people aboard compare across decades?")
-
-ground_fatalities_decade = filtered_air.groupby('Decade').agg({
-    'Ground': 'sum',
-    'Fatalities (air)': 'sum',
-    'Aboard': 'sum'
-}).reset_index()
-
-# st.dataframe(ground_fatalities_decade)
-
-# Melt the dataframe for Altair
-air_melted = ground_fatalities_decade.melt(id_vars='Decade', value_vars=['Ground', 'Fatalities (air)', 'Aboard'],
-                                          var_name='Metric', value_name='Count')
-
-line_chart = alt.Chart(air_melted).mark_line(point=True).encode(
-    x=alt.X('Decade:N', title='Decade'),
-    y=alt.Y('Count:Q', title='Count'),
-    color=alt.Color('Metric:N', title='Metric'),
-    tooltip=['Decade:N', 'Metric:N', 'Count:Q']
-).properties(
-    width=700,
-    height=400,
-    title='Trend of Ground, Fatalities, and Aboard per Decade'
-)
+    st.write("#### 4. How has the survival rate compared to the death rate changed across different decades?")
 
-st.altair_chart(line_chart, use_container_width=True)
+    # st.dataframe(survival_trend)
 
-# Section 5
-st.markdown("""
-<div class='section'>
-<h2>5️⃣ Operational Risk by Aircraft Category</h2>
-Not all flights are equal. I investigated <strong>which aircraft categories—commercial, cargo, or private—record the highest fatalities</strong>, enabling HR to identify which operational types require enhanced training and emergency preparedness.
-</div>
-""", unsafe_allow_html=True)
+    # Display chart
+    render("survival_trend")
 
-st.write("#### 7. Which aircraft categories record the highest number of fatalities?")
+    st.write("#### 5. What is the trend of average fatalities per year in the aviation industry?")
 
-category_deaths = (
-    filtered_air.groupby('Aircraft Category')['Fatalities (air)']
-       .sum()
-       .sort_values(ascending=False)
-       .reset_index()
-)
-category_deaths.columns = ['Category', 'Total_Fatalities']
-category_deaths['Percentage'] = (category_deaths['Total_Fatalities'] / category_deaths['Total_Fatalities'].sum()) * 100
-
-# st.dataframe(category_deaths)
-
-chart = alt.Chart(category_deaths).mark_arc(innerRadius=70).encode(
-    theta=alt.Theta(field='Total_Fatalities', type='quantitative'),
-    color=alt.Color(field='Category', type='nominal', legend=alt.Legend(title="Aircraft Category")),
-    tooltip=['Category:N', 'Total_Fatalities:Q', alt.Tooltip('Percentage:Q', format='.2f')]
-).properties(
-    width=500,
-    height=500,
-    title='Fatalities by Aircraft Category'
-)
+    # st.dataframe(avg_fatalities_by_year)
 
-# Display chart
-st.altair_chart(chart, use_container_width=True)
+    # Display chart
+    render("avg_fatalities_by_year")
 
-# Section 6
-st.markdown("""
-<div class='section'>
-<h2>6️⃣ Manufacturer-Level Risk Analysis</h2>
-I revealed <strong>which aircraft manufacturers have the highest total fatalities and how their survival and death rates compare</strong>, followed by <strong>which manufacturers tend to have the most severe crashes on average</strong>.
-</div>
-""", unsafe_allow_html=True)
+    # Section 4
+    st.markdown("""
+    <div class='section'>
+    <h2>4️⃣ Multi-Dimensional Impact Across Decades</h2>
+    I compared <strong>ground fatalities, in-air fatalities, and people aboard across decades</strong>. This gives us a holistic view of how different aspects of crash severity have evolved, informing HR on whether current operational practices are reducing overall impact.
+    </div>
+    """, unsafe_allow_html=True)
 
-st.write("#### 8. Which aircraft manufacturers have the highest total fatalities, and how do their survival and death rates compare?")
+    st.write("#### 6. How do ground fatalities, in-air fatalities, and people aboard compare across decades?")
 
-manufacturer_stats = filtered_air.groupby('Aircraft Manufacturer').agg(
-    Total_Aboard=('Aboard', 'sum'),
-    Total_Fatalities=('Fatalities (air)', 'sum')
-).reset_index()
+    # st.dataframe(ground_fatalities_decade)
 
-manufacturer_stats['Survival_Rate'] = (manufacturer_stats['Total_Aboard'] - manufacturer_stats['Total_Fatalities']) / manufacturer_stats['Total_Aboard']
-manufacturer_stats['Death_Rate'] = manufacturer_stats['Total_Fatalities'] / manufacturer_stats['Total_Aboard']
+    render("ground_fatalities_decade")
 
-top20_manufacturers = manufacturer_stats.sort_values(by='Total_Fatalities', ascending=False).head(20)
-top20_long = top20_manufacturers.melt(id_vars='Aircraft Manufacturer', value_vars=['Survival_Rate', 'Death_Rate'],
-                                      var_name='Metric', value_name='Rate')
+    # Section 5
+    st.markdown("""
+    <div class='section'>
+    <h2>5️⃣ Operational Risk by Aircraft Category</h2>
+    Not all flights are equal. I investigated <strong>which aircraft categories—commercial, cargo, or private—record the highest fatalities</strong>, enabling HR to identify which operational types require enhanced training and emergency preparedness.
+    </div>
+    """, unsafe_allow_html=True)
 
-# st.dataframe(manufacturer_stats)
+    st.write("#### 7. Which aircraft categories record the highest number of fatalities?")
 
-# Streamlit title
-# st.subheader("Top 20 Aircraft Manufacturers: Survival vs Death Rates")
+    # st.dataframe(category_deaths)
 
-# Altair stacked bar chart
-chart = alt.Chart(top20_long).mark_bar().encode(
-    x=alt.X('Rate:Q', stack='normalize', title='Rate'),
-    y=alt.Y('Aircraft Manufacturer:N', sort='-x', title='Manufacturer'),
-    color=alt.Color('Metric:N', title='Metric', scale=alt.Scale(domain=['Survival_Rate', 'Death_Rate'], range=['#2ecc71', '#e74c3c'])),
-    tooltip=['Aircraft Manufacturer:N', 'Metric:N', alt.Tooltip('Rate:Q', format='.2%')]
-).properties(
-    width=700,
-    height=500,
-    title='Survival vs Death Rates for Top 20 Manufacturers'
-)
+    # Display chart
+    render("category_deaths")
 
-# Display chart
-st.altair_chart(chart, use_container_width=True)
+    # Section 6
+    st.markdown("""
+    <div class='section'>
+    <h2>6️⃣ Manufacturer-Level Risk Analysis</h2>
+    I revealed <strong>which aircraft manufacturers have the highest total fatalities and how their survival and death rates compare</strong>, followed by <strong>which manufacturers tend to have the most severe crashes on average</strong>.
+    </div>
+    """, unsafe_allow_html=True)
 
-st.write("#### 9. Which aircraft manufacturers have the most severe crashes on average (in terms of fatalities per crash)?")
+    st.write("#### 8. Which aircraft manufacturers have the highest total fatalities, and how do their survival and death rates compare?")
 
-manufacturer_severity = filtered_air.groupby('Aircraft Manufacturer')['Fatalities (air)'].mean().sort_values(ascending=False).head(20).reset_index()
-manufacturer_severity.columns = ['Manufacturer', 'Avg_Fatalities']
+    # st.dataframe(manufacturer_stats)
 
-# st.dataframe(manufacturer_severity)
+    # Display chart
+    render("manufacturer_stats")
 
-chart = alt.Chart(manufacturer_severity).mark_bar().encode(
-    x=alt.X('Avg_Fatalities:Q', title='Average Fatalities per Crash'),
-    y=alt.Y('Manufacturer:N', sort='-x', title='Manufacturer'),
-    color=alt.Color('Manufacturer:N', legend=None),
-    tooltip=['Manufacturer:N', alt.Tooltip('Avg_Fatalities:Q', format=',.2f')]
-).properties(
-    width=700,
-    height=500,
-    title='Top 20 Manufacturers by Average Fatalities per Crash'
-)
+    st.write("#### 9. Which aircraft manufacturers have the most severe crashes on average (in terms of fatalities per crash)?")
 
-# Display chart
-st.altair_chart(chart, use_container_width=True)
+    # st.dataframe(manufacturer_severity)
 
-# Section 7
-st.markdown("""
-<div class='section'>
-<h2>7️⃣ Improvement Over Time</h2>
-Finally, I highlighted <strong>which manufacturers have shown the most improvement in survival rates over time</strong>, showcasing progress in aviation safety and potential preferred partners for future operations.
-</div>
-""", unsafe_allow_html=True)
+    # Display chart
+    render("manufacturer_severity")
 
-st.write("#### 10. Which aircraft manufacturers have shown the most improvement in survival rates over time?")
+    # Section 7
+    st.markdown("""
+    <div class='section'>
+    <h2>7️⃣ Improvement Over Time</h2>
+    Finally, I highlighted <strong>which manufacturers have shown the most improvement in survival rates over time</strong>, showcasing progress in aviation safety and potential preferred partners for future operations.
+    </div>
+    """, unsafe_allow_html=True)
 
-# Calculate survival rate by manufacturer and decade
-manufacturer_trend = filtered_air.groupby(['Aircraft Manufacturer', 'Decade']).apply(
-    lambda x: pd.Series({
-        'Total_Aboard': x['Aboard'].sum(),
-        'Total_Fatalities': x['Fatalities (air)'].sum()
-    }),
-    include_groups=False
-).reset_index()
+    st.write("#### 10. Which aircraft manufacturers have shown the most improvement in survival rates over time?")
 
-manufacturer_trend['Survival_Rate'] = (
-    (manufacturer_trend['Total_Aboard'] - manufacturer_trend['Total_Fatalities']) /
-    manufacturer_trend['Total_Aboard']
-)
+    # Survival rate by manufacturer and decade, then latest decade minus earliest decade
+    # st.dataframe(improvement)
 
-# Compute improvement: latest decade survival rate - earliest decade survival rate
-improvement = (
-    manufacturer_trend.groupby('Aircraft Manufacturer')
-    .agg(
-        First_Survival_Rate=('Survival_Rate', 'first'),
-        Last_Survival_Rate=('Survival_Rate', 'last')
-    )
-    .assign(Improvement=lambda df: df['Last_Survival_Rate'] - df['First_Survival_Rate'])
-    .sort_values(by='Improvement', ascending=False)
-    .reset_index()
-)
+    render("improvement")
 
-# Get top 10 manufacturers with the most improvement
-top_improvers = improvement.head(20)
-# st.dataframe(top_improvers)
-
-chart = alt.Chart(top_improvers).mark_bar().encode(
-    x=alt.X('Aircraft Manufacturer:N', sort='-y', title='Manufacturer'),
-    y=alt.Y('Improvement:Q', title='Improvement in Survival Rate'),
-    color=alt.Color('Improvement:Q', scale=alt.Scale(scheme='greens')),
-    tooltip=['Aircraft Manufacturer', 'First_Survival_Rate', 'Last_Survival_Rate', 'Improvement']
-).properties(
-    title='Top 20 Aircraft Manufacturers with Most Improvement in Survival Rate',
-    width=700,
-    height=400
-)
+    if profiler.enabled:
+        with st.expander("⏱ Profile: filters, questions and charts"):
+            st.dataframe(profiler.table(), hide_index=True)
+        profiler.write_log()
 
-st.altair_chart(chart, use_container_width=True)
 
-from datetime import datetime
+filtered_report()
 
 # =========================
 # STYLES (clean + animated)
@@ -487,7 +418,8 @@ st.markdown("""
 st.markdown("## 📌 Executive Takeaways")
 st.markdown(
     f"<div class='subtle'>Concise findings, likely causes, and actionable recommendations for HR & Safety leadership. "
-    f"Last updated: <strong>{datetime.now().strftime('%Y-%m-%d %H:%M')}</strong></div>",
+    f"Data as of: <strong>{data_as_of:%Y-%m-%d %H:%M} UTC</strong>"
+    f"{' (refreshing…)' if refresher.refreshing else ''}</div>",
     unsafe_allow_html=True
 )
 st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
@@ -626,8 +558,8 @@ findings_md = """# Executive Takeaways
 4. Fleet & Partner Due Diligence.
 5. Continuous Monitoring Dashboard.
 
-_Last updated: {ts}_
-""".format(ts=datetime.now().strftime("%Y-%m-%d %H:%M"))
+_Data as of: {ts} UTC_
+""".format(ts=f"{data_as_of:%Y-%m-%d %H:%M}")
 
 # CSV: two-column summary to share quickly
 csv_rows = [
@@ -669,8 +601,7 @@ with st.expander("Notes & Assumptions"):
 - Recommendations should complement regulator/ICAO/IATA directives and operator SOPs.
     """)
 
-
-
-
-
-
+if page_profiler.enabled:
+    with st.expander("⏱ Profile: data loading"):
+        st.dataframe(page_profiler.table(), hide_index=True)
+    page_profiler.write_log()
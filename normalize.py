@@ -0,0 +1,74 @@
+"""Lookup-table normalization for the cleaning pipeline.
+
+Every cleaning rule is applied to the distinct values of a column only, then
+broadcast back to the rows through integer codes, so the cost grows with the
+number of distinct spellings rather than the number of crashes.
+"""
+import calendar
+
+import numpy as np
+import pandas as pd
+
+MONTHS = {name: number for number, name in enumerate(calendar.month_name) if name}
+
+
+class LookupTable:
+    """A mapping dict compiled to a key index and a categorical code per key."""
+
+    def __init__(self, mapping, default=None):
+        self.keys = pd.Index(list(mapping.keys()))
+        self.value_codes, self.values = pd.factorize(pd.Series(list(mapping.values()), dtype=object))
+        self.default = default
+
+    def lookup(self, uniques):
+        """Mapped value for each entry of ``uniques``; misses keep their value, or ``default`` if given."""
+        uniques = pd.Index(uniques)
+        positions = self.keys.get_indexer(uniques)
+        mapped = np.asarray(self.values, dtype=object)[self.value_codes[positions]]
+        missing = positions < 0
+        mapped[missing] = self.default if self.default is not None else np.asarray(uniques, dtype=object)[missing]
+        return mapped
+
+
+def transform_unique(series, transform):
+    """Apply ``transform`` (array of distinct values -> array) once per distinct value.
+
+    Returns a categorical Series; missing values are passed to ``transform`` too.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = np.asarray(transform(np.asarray(uniques, dtype=object)), dtype=object)
+    new_codes, categories = pd.factorize(pd.Series(mapped, dtype=object))
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes[codes], categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def map_values(series, *tables):
+    """Run a column through one or more LookupTables in turn, on its distinct values only."""
+    def transform(uniques):
+        for table in tables:
+            uniques = table.lookup(uniques)
+        return uniques
+    return transform_unique(series, transform)
+
+
+def build_dates(year, month, day):
+    """Timestamps from integer year/day and month-name columns, without formatting strings."""
+    month_codes, month_names = pd.factorize(month)
+    unknown = [name for name in month_names if name not in MONTHS]
+    if unknown:
+        raise ValueError(f"Unknown month names: {unknown}")
+    month_numbers = np.array([MONTHS[name] for name in month_names], dtype=np.int64)[month_codes]
+    return pd.to_datetime(pd.DataFrame({
+        "year": np.asarray(year, dtype=np.int64),
+        "month": month_numbers,
+        "day": np.asarray(day, dtype=np.int64),
+    })).set_axis(year.index)
+
+
+def decade_labels(year):
+    """'1970s'-style labels, formatted once per distinct decade."""
+    decades = pd.Series(np.asarray(year) // 10 * 10, index=year.index)
+    return transform_unique(decades, lambda uniques: np.array([f"{d}s" for d in uniques], dtype=object))
@@ -0,0 +1,184 @@
+"""Manufacturer tables (questions 8-10) precomputed for every coarse filter combination.
+
+    python precompute.py [--workers 4]
+
+Computes the three manufacturer sections for each combination of at most one
+Continent, one Decade and one Aircraft Category (including "no filter"),
+spread over a process pool, and stores them next to the cube for the current
+dataset version. The dashboard looks selections up here and computes anything
+else on the fly.
+"""
+import argparse
+import datetime
+import glob
+import itertools
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+from filters import FilterEngine
+from report import SECTIONS
+from result_cache import filter_key
+
+logger = logging.getLogger(__name__)
+
+# Output of the background job, so a crash leaves a traceback behind
+LOG_PATH = os.path.join(data_loader.CACHE_DIR, "precompute.log")
+
+PRECOMPUTED_SECTIONS = ["manufacturer_stats", "manufacturer_severity", "improvement"]
+PRECOMPUTED_DIMENSIONS = ["Continent", "Decade", "Aircraft Category"]
+KEY_COLUMN = "_filter_key"
+
+
+def _store_dir(version):
+    return os.path.join(data_loader.CACHE_DIR, f"precomputed-{version[:16]}")
+
+
+def selections(engine):
+    """Every selection with zero or one value for each of PRECOMPUTED_DIMENSIONS."""
+    choices = [[None] + list(engine.options[col]) for col in PRECOMPUTED_DIMENSIONS]
+    for values in itertools.product(*choices):
+        yield {col: [] if value is None else [value] for col, value in zip(PRECOMPUTED_DIMENSIONS, values)}
+
+
+# Set in each pool worker by _init_worker, so the cube is pickled once per process
+_worker = {}
+
+
+def _init_worker(cube):
+    _worker["cube"] = cube
+    _worker["engine"] = FilterEngine(cube)
+
+
+def _compute_chunk(chunk):
+    cube, engine = _worker["cube"], _worker["engine"]
+    results = []
+    for selection in chunk:
+        view = engine.apply(cube, selection)
+        results.append((filter_key(selection), {name: SECTIONS[name](view) for name in PRECOMPUTED_SECTIONS}))
+    return results
+
+
+def precompute(cube, version, workers=None, chunk_size=64):
+    """Compute and store the manufacturer sections for every coarse selection of ``cube``."""
+    todo = list(selections(FilterEngine(cube)))
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    tables = {name: [] for name in PRECOMPUTED_SECTIONS}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cube,)) as pool:
+        for results in pool.map(_compute_chunk, chunks):
+            for key, sections in results:
+                for name, frame in sections.items():
+                    tables[name].append(frame.assign(**{KEY_COLUMN: key}))
+
+    # Written to a scratch directory and renamed into place, so readers never see half a store
+    store_dir = _store_dir(version)
+    tmp_dir = f"{store_dir}.{os.getpid()}.tmp"
+    os.makedirs(tmp_dir, exist_ok=True)
+    for name, frames in tables.items():
+        pd.concat(frames, ignore_index=True).to_parquet(os.path.join(tmp_dir, f"{name}.parquet"), index=False)
+    try:
+        os.replace(tmp_dir, store_dir)
+    except OSError:
+        # Another process published the same version first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    for old_dir in glob.glob(os.path.join(data_loader.CACHE_DIR, "precomputed-*")):
+        if old_dir != store_dir and not old_dir.endswith(".tmp"):
+            shutil.rmtree(old_dir, ignore_errors=True)
+    return len(todo)
+
+
+class PrecomputedTables:
+    """Read side of the precomputed store for one dataset version.
+
+    Loads the store once it exists; until then every lookup misses.
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self._tables = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        store_dir = _store_dir(self.version)
+        if not os.path.isdir(store_dir):
+            return None
+        tables = {}
+        for name in PRECOMPUTED_SECTIONS:
+            frame = pd.read_parquet(os.path.join(store_dir, f"{name}.parquet"))
+            keys = frame.pop(KEY_COLUMN).to_numpy()
+            # Rows of one key are contiguous: remember each key's slice
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            stops = np.r_[starts[1:], len(keys)]
+            tables[name] = (frame, {keys[s]: (s, e) for s, e in zip(starts, stops)})
+        return tables
+
+    def lookup(self, key):
+        """{section: frame} for a precomputed selection, or None."""
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._load()
+            tables = self._tables
+        if tables is None:
+            return None
+        found = {}
+        for name, (frame, slices) in tables.items():
+            if key not in slices:
+                return None
+            start, stop = slices[key]
+            found[name] = frame.iloc[start:stop].reset_index(drop=True)
+        return found
+
+
+def precompute_in_background(version):
+    """Run this module as a separate job unless the store for ``version`` already exists.
+
+    A process of its own rather than a pool started from the server: the
+    Streamlit server is multi-threaded, and forking it is unsafe.
+    """
+    if os.path.isdir(_store_dir(version)):
+        return None
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    with open(LOG_PATH, "a", encoding="utf-8") as log:
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        log.write(f"{timestamp} precomputing version {version[:16]}\n")
+        log.flush()
+        # The child keeps its own copy of the handle
+        process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    threading.Thread(target=_report_exit, args=(process, version), daemon=True, name="precompute-wait").start()
+    return process
+
+
+def _report_exit(process, version):
+    status = process.wait()
+    if status:
+        logger.error("Precomputing version %s exited with status %s; see %s. "
+                     "Manufacturer tables are computed on the fly meanwhile.", version[:16], status, LOG_PATH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: one per CPU)")
+    args = parser.parse_args()
+
+    cube = data_loader.load_cube()
+    version = data_loader.dataset_version()
+    count = precompute(cube, version, args.workers)
+    print(f"Precomputed {count} selections for dataset version {version[:16]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Opt-in stage timing for the dashboard.
+
+Switched on with ``AIRCRASH_PROFILE=1`` in the environment or ``?profile=1`` in
+the page URL. Each stage records wall time; the stages of one run are shown as
+a table in the app and appended to a JSON-lines log (``AIRCRASH_PROFILE_LOG``,
+by default .cache/profile.jsonl).
+
+Allocation peaks need tracemalloc, which slows every session of the process
+down once started, so only the server-side ``AIRCRASH_PROFILE=1`` turns it on;
+``?profile=1`` records timings alone. tracemalloc is process-wide, so peaks
+measured while several sessions rerun at the same time include each other's
+allocations.
+"""
+import datetime
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+
+PROFILE_ENV = "AIRCRASH_PROFILE"
+LOG_PATH = os.environ.get(
+    "AIRCRASH_PROFILE_LOG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "profile.jsonl"),
+)
+
+_log_lock = threading.Lock()
+
+
+def _env_enabled():
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def profiling_enabled(query_params=None):
+    """True when the env var or the ``profile`` query parameter asks for profiling."""
+    if _env_enabled():
+        return True
+    return query_params is not None and query_params.get("profile") in ("1", "true")
+
+
+class Profiler:
+    """Times named stages of one script or fragment run; does nothing when disabled."""
+
+    def __init__(self, enabled, scope):
+        self.enabled = enabled
+        self.scope = scope
+        self.run_id = uuid.uuid4().hex[:12]
+        self.records = []
+        # Allocation tracing is the server's choice: a page visitor only gets timings
+        self.trace_memory = enabled and _env_enabled()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name, **context):
+        """Context manager timing ``name``; extra keyword arguments go into its log record."""
+        if not self.enabled:
+            return nullcontext()
+        return self._stage(name, context)
+
+    @contextmanager
+    def _stage(self, name, context):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.records.append({
+                "stage": name,
+                "ms": round(elapsed * 1e3, 3),
+                "peak_bytes": max(tracemalloc.get_traced_memory()[1] - base, 0) if self.trace_memory else None,
+                **context,
+            })
+
+    def table(self):
+        table = pd.DataFrame(self.records, columns=["stage", "ms", "peak_bytes"])
+        table["peak_MB"] = pd.to_numeric(table.pop("peak_bytes")) / 2**20
+        return table
+
+    def write_log(self, path=LOG_PATH):
+        """Append one JSON line per recorded stage."""
+        if not self.enabled or not self.records:
+            return
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds")
+        lines = [
+            json.dumps({"ts": timestamp, "run": self.run_id, "scope": self.scope, **record}, default=str)
+            for record in self.records
+        ]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _log_lock, open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
@@ -0,0 +1,97 @@
+"""Stale-while-revalidate loading of the dashboard's shared data.
+
+A daemon thread polls the workbook, the Parquet store and the snapshot
+pointer. When one of them changes, it reloads the dataset, rebuilds the cube
+and the engines built on it, and swaps the finished Dataset in with a single
+assignment. Sessions keep getting the previous Dataset until then. The first
+Dataset is built by the same thread as soon as it starts; callers that can do
+without it meanwhile pass ``wait=False``.
+"""
+import logging
+import threading
+from typing import NamedTuple
+
+import data_loader
+from filters import FilterEngine
+from kpis import KPIEngine
+
+logger = logging.getLogger(__name__)
+
+
+class Dataset(NamedTuple):
+    version: str
+    as_of: object
+    cube: object
+    filter_engine: FilterEngine
+    kpi_engine: KPIEngine
+
+
+def build_dataset():
+    cube = data_loader.load_cube()
+    filter_engine = FilterEngine(cube)
+    return Dataset(
+        version=data_loader.dataset_version(),
+        as_of=data_loader.dataset_as_of(),
+        cube=cube,
+        filter_engine=filter_engine,
+        kpi_engine=KPIEngine(cube, filter_engine),
+    )
+
+
+class Refresher:
+    def __init__(self, build=build_dataset, interval=2.0):
+        self.build = build
+        self.interval = interval
+        self.refreshing = False
+        self.last_error = None
+        self._current = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self, wait=True):
+        """The latest finished Dataset; with no Dataset yet, wait for the first build or return None."""
+        dataset = self._current
+        if dataset is None and wait:
+            with self._lock:
+                if self._current is None:
+                    self._current = self.build()
+                dataset = self._current
+        return dataset
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="dataset-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        """Rebuild now and swap the result in; on failure keep serving the previous Dataset."""
+        self.refreshing = True
+        try:
+            dataset = self.build()
+        except Exception as error:
+            # Typically a workbook caught half-written; the next poll tries again
+            self.last_error = error
+            logger.exception("Dataset refresh failed; still serving version %s",
+                             self._current.version if self._current else None)
+            return False
+        finally:
+            self.refreshing = False
+        self.last_error = None
+        with self._lock:
+            self._current = dataset
+        return True
+
+    def _watch(self):
+        try:
+            self.current()
+        except Exception:
+            # Left to the first caller that waits, which then sees the error itself
+            logger.exception("Initial dataset build failed")
+        while not self._stop.wait(self.interval):
+            if self._current is not None and data_loader.needs_reload():
+                self.refresh()
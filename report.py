@@ -0,0 +1,181 @@
+from contextlib import nullcontext
+
+from cube import measure_mean, rollup, stat_column
+
+AIR = "Fatalities (air)"
+EXCLUDED_COUNTRIES = ['Unknown', 'N/A']
+
+
+def _sum(measure):
+    return stat_column(measure, "sum")
+
+
+def compute_kpis(view):
+    aboard = view[_sum('Aboard')].sum()
+    air_fatalities = view[_sum(AIR)].sum()
+    ground = view[_sum('Ground')].sum()
+    return {
+        "Total_People_aboard": aboard,
+        "Total_Air_Fatalities": air_fatalities,
+        "Total_Ground_Cases": ground,
+        "Countries": view['Country'].nunique(),
+        "Aircraft_Manufacturers": view['Aircraft Manufacturer'].nunique(),
+        "Total_survivors": aboard - air_fatalities,
+        "Total_deaths": air_fatalities + ground,
+    }
+
+
+# 1. Crashes per quarter
+def quarter_cases(view):
+    quarter_cases = (
+        rollup(view, 'Quarter', ['Crashes'])
+        .sort_values('Crashes', ascending=False)
+        .reset_index(drop=True)
+    )
+    quarter_cases.columns = ['Quarter', 'Crash_Count']
+    return quarter_cases
+
+
+# 2. Top 10 countries by air fatalities
+def rank_countries(totals):
+    """Top 10 of per-country air fatality sums; ties keep country order."""
+    return (
+        totals.rename(columns={_sum(AIR): AIR})
+        .sort_values(AIR, ascending=False, kind='stable')
+        .head(10)
+        .reset_index(drop=True)
+    )
+
+
+def top_countries(view):
+    return rank_countries(rollup(view[~view['Country'].isin(EXCLUDED_COUNTRIES)], 'Country', [_sum(AIR)]))
+
+
+# 3. Ground fatalities per continent
+def continent_ground_fatalities(view):
+    continent_ground_fatalities = (
+        rollup(view[view['Continent'] != 'Unknown'], 'Continent', [_sum('Ground')])
+        .sort_values(_sum('Ground'), ascending=False)
+        .reset_index(drop=True)
+    )
+    continent_ground_fatalities.columns = ['Continent', 'Ground_Fatalities']
+    return continent_ground_fatalities
+
+
+# 4. Survival vs death rate per decade
+def survival_trend(view):
+    survival_trend = rollup(view, 'Decade', [_sum('Aboard'), _sum(AIR)])
+    survival_trend.columns = ['Decade', 'Total_Aboard', 'Total_Fatalities']
+    survival_trend['Survival_Rate'] = (survival_trend['Total_Aboard'] - survival_trend['Total_Fatalities']) / survival_trend['Total_Aboard']
+    survival_trend['Death_Rate'] = survival_trend['Total_Fatalities'] / survival_trend['Total_Aboard']
+    return survival_trend
+
+
+# 5. Average air fatalities per crash per year
+def avg_fatalities_by_year(view):
+    yearly = rollup(view, 'Year', [_sum(AIR), stat_column(AIR, "count")])
+    yearly['Avg_Fatalities'] = measure_mean(yearly, AIR)
+    return yearly[['Year', 'Avg_Fatalities']]
+
+
+# 6. Ground, air fatalities and people aboard per decade
+def ground_fatalities_decade(view):
+    ground_fatalities_decade = rollup(view, 'Decade', [_sum('Ground'), _sum(AIR), _sum('Aboard')])
+    ground_fatalities_decade.columns = ['Decade', 'Ground', AIR, 'Aboard']
+    return ground_fatalities_decade
+
+
+# 7. Air fatalities per aircraft category
+def category_deaths(view):
+    category_deaths = (
+        rollup(view, 'Aircraft Category', [_sum(AIR)])
+        .sort_values(_sum(AIR), ascending=False)
+        .reset_index(drop=True)
+    )
+    category_deaths.columns = ['Category', 'Total_Fatalities']
+    category_deaths['Percentage'] = (category_deaths['Total_Fatalities'] / category_deaths['Total_Fatalities'].sum()) * 100
+    return category_deaths
+
+
+# 8. Totals and survival/death rates per manufacturer
+def manufacturer_rates(totals):
+    """Survival and death rates from per-manufacturer Aboard and air fatality sums."""
+    manufacturer_stats = totals.copy()
+    manufacturer_stats.columns = ['Aircraft Manufacturer', 'Total_Aboard', 'Total_Fatalities']
+    manufacturer_stats['Survival_Rate'] = (manufacturer_stats['Total_Aboard'] - manufacturer_stats['Total_Fatalities']) / manufacturer_stats['Total_Aboard']
+    manufacturer_stats['Death_Rate'] = manufacturer_stats['Total_Fatalities'] / manufacturer_stats['Total_Aboard']
+    return manufacturer_stats
+
+
+def manufacturer_stats(view):
+    return manufacturer_rates(rollup(view, 'Aircraft Manufacturer', [_sum('Aboard'), _sum(AIR)]))
+
+
+# 9. Top 20 manufacturers by average air fatalities per crash
+def rank_severity(totals):
+    """Top 20 of per-manufacturer air fatality sums and counts by their mean; ties keep manufacturer order."""
+    severity = totals.copy()
+    severity['Avg_Fatalities'] = measure_mean(severity, AIR)
+    manufacturer_severity = (
+        severity[['Aircraft Manufacturer', 'Avg_Fatalities']]
+        .sort_values('Avg_Fatalities', ascending=False, kind='stable')
+        .head(20)
+        .reset_index(drop=True)
+    )
+    manufacturer_severity.columns = ['Manufacturer', 'Avg_Fatalities']
+    return manufacturer_severity
+
+
+def manufacturer_severity(view):
+    return rank_severity(rollup(view, 'Aircraft Manufacturer', [_sum(AIR), stat_column(AIR, "count")]))
+
+
+# 10. Survival rate improvement between each manufacturer's first and last decade
+def manufacturer_improvement(view):
+    manufacturer_trend = rollup(view, ['Aircraft Manufacturer', 'Decade'], [_sum('Aboard'), _sum(AIR)])
+    manufacturer_trend.columns = ['Aircraft Manufacturer', 'Decade', 'Total_Aboard', 'Total_Fatalities']
+    manufacturer_trend['Survival_Rate'] = (
+        (manufacturer_trend['Total_Aboard'] - manufacturer_trend['Total_Fatalities']) /
+        manufacturer_trend['Total_Aboard']
+    )
+    return (
+        manufacturer_trend.groupby('Aircraft Manufacturer')
+        .agg(
+            First_Survival_Rate=('Survival_Rate', 'first'),
+            Last_Survival_Rate=('Survival_Rate', 'last')
+        )
+        .assign(Improvement=lambda df: df['Last_Survival_Rate'] - df['First_Survival_Rate'])
+        .sort_values(by='Improvement', ascending=False)
+        .reset_index()
+    )
+
+
+# Report entry -> function of the filtered cube cells; each one runs without Streamlit
+SECTIONS = {
+    "kpis": compute_kpis,
+    "quarter_cases": quarter_cases,
+    "top_countries": top_countries,
+    "continent_ground_fatalities": continent_ground_fatalities,
+    "survival_trend": survival_trend,
+    "avg_fatalities_by_year": avg_fatalities_by_year,
+    "ground_fatalities_decade": ground_fatalities_decade,
+    "category_deaths": category_deaths,
+    "manufacturer_stats": manufacturer_stats,
+    "manufacturer_severity": manufacturer_severity,
+    "improvement": manufacturer_improvement,
+}
+
+
+def compute_report(view, profiler=None, precomputed=None):
+    """KPIs and the data behind all ten charts for one filtered view of the cube.
+
+    Sections found in ``precomputed`` ({name: frame}) are taken from there. With
+    a ``profiling.Profiler``, every computed section is timed as its own stage.
+    """
+    results = dict(precomputed or {})
+    for name, section in SECTIONS.items():
+        if name in results:
+            continue
+        with profiler.stage(f"section:{name}") if profiler else nullcontext():
+            results[name] = section(view)
+    return {name: results[name] for name in SECTIONS}
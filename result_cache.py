@@ -0,0 +1,109 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def filter_key(selected_filters):
+    """Canonical hash of a sidebar selection, independent of filter and value order."""
+    canonical = {
+        col: sorted(str(v) for v in values)
+        for col, values in selected_filters.items()
+        if len(values)
+    }
+    payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def result_size(result):
+    """Approximate in-memory size of a cached result (DataFrames measured deeply)."""
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=True).sum())
+    if isinstance(result, dict):
+        return sum(result_size(v) for v in result.values()) + sys.getsizeof(result)
+    if isinstance(result, (tuple, list)):
+        return sum(result_size(v) for v in result) + sys.getsizeof(result)
+    # Chart specs are dominated by the frame they embed
+    data = getattr(result, "data", None)
+    if isinstance(data, pd.DataFrame):
+        return result_size(data) + sys.getsizeof(result)
+    return sys.getsizeof(result)
+
+
+class ResultCache:
+    """Thread-safe LRU cache of computed results, bounded by entry count and bytes.
+
+    Entries belong to one dataset version; asking for a different version empties
+    the cache, so results never outlive the data they were computed from.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._version = None
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, version, key, compute):
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Computed outside the lock so one slow filter state doesn't block the others
+        result = compute()
+        size = result_size(result)
+
+        with self._lock:
+            if version == self._version and key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (result, size)
+                self._nbytes += size
+                self._evict()
+        return result
+
+    def get(self, version, key, default=None):
+        """The cached result for ``key``, or ``default`` without computing anything."""
+        with self._lock:
+            entry = self._entries.get(key) if version == self._version else None
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._nbytes -= size
+            self.evictions += 1
+
+    def _clear(self):
+        self._entries.clear()
+        self._nbytes = 0
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,79 @@
+"""What the dashboard needs to draw the unfiltered report before the cube has loaded.
+
+The file holds, for one dataset version, the filter options, the unfiltered
+KPIs and the Vega-Lite specs of the charts shown without a toggle. Reading it
+costs the same whatever the size of the dataset, and needs neither the cube
+nor Altair. It is written after each dataset build, off the request path.
+"""
+import logging
+import os
+import pickle
+from typing import NamedTuple
+
+import data_loader
+import refresher
+
+logger = logging.getLogger(__name__)
+
+STARTUP_PATH = os.path.join(data_loader.CACHE_DIR, "startup.pkl")
+# Charts drawn on every page load; the rest wait for their "Show chart" toggle
+FIRST_PAINT_CHARTS = ["quarter_cases", "top_countries"]
+
+
+class Startup(NamedTuple):
+    version: str
+    as_of: object
+    options: dict
+    kpis: dict
+    charts: dict
+
+
+def write_startup(dataset, path=STARTUP_PATH):
+    """Serialize the unfiltered first paint of ``dataset`` (a refresher.Dataset), unless already there."""
+    existing = read_startup(path, version=dataset.version)
+    if existing is not None:
+        return existing
+
+    # Imported here so that reading the file never pulls in Altair
+    import altair as alt
+
+    from charts import CHARTS
+    from report import SECTIONS
+
+    # Without Altair's default theme, like st.altair_chart does, so both paths draw the same chart
+    with alt.theme.enable("none"):
+        specs = {name: CHARTS[name](SECTIONS[name](dataset.cube)).to_dict() for name in FIRST_PAINT_CHARTS}
+    startup = Startup(
+        version=dataset.version,
+        as_of=dataset.as_of,
+        options={col: list(values) for col, values in dataset.filter_engine.options.items()},
+        kpis=dataset.kpi_engine.kpis({col: [] for col in dataset.filter_engine.options})[0],
+        charts=specs,
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(tuple(startup), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return startup
+
+
+def build_dataset():
+    """refresher.build_dataset, also saving the new dataset's first paint."""
+    dataset = refresher.build_dataset()
+    try:
+        write_startup(dataset)
+    except OSError:
+        logger.exception("Could not save the first paint for version %s", dataset.version)
+    return dataset
+
+
+def read_startup(path=STARTUP_PATH, version=None):
+    """The stored first paint if it belongs to ``version`` (default: the converted store's), else None."""
+    version = version or data_loader.cached_version()
+    try:
+        with open(path, "rb") as f:
+            startup = Startup(*pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError):
+        return None
+    return startup if version is not None and startup.version == version else None
@@ -0,0 +1,212 @@
+"""Top-N rankings merged from per-partition sorted lists instead of rolling up every group.
+
+The cube is cut into partitions, one per combination of PARTITION_DIMENSIONS
+values. Each RankingIndex keeps, for every partition, the groups (countries or
+manufacturers) present in it sorted by their score there, plus the partition
+totals of each group for random access. A selection that only filters on the
+partition dimensions and on the ranked dimension itself picks a set of
+partitions, and the threshold algorithm reads their lists from the top down:
+
+* sums (questions 2 and 8): a group not read yet scores at most the sum of the
+  next unread score of every list;
+* means (question 9): at most the largest next unread score, since a group's
+  mean over several partitions never exceeds its best partition mean.
+
+Reading stops once the N-th best merged score read so far is strictly above
+that bound, so every group tied with the N-th is read too and the ranking
+matches the full roll-up exactly. Unfiltered selections read one precomputed
+list. Other filters (Quarter, Year, Country for the manufacturer charts) cut
+through partitions; those selections return None and take the full roll-up.
+
+Question 10 compares each manufacturer's first and last decade, which no
+per-partition bound orders, so it always takes the full roll-up.
+"""
+import numpy as np
+import pandas as pd
+
+from cube import stat_column
+from report import AIR, EXCLUDED_COUNTRIES, manufacturer_rates, rank_countries, rank_severity
+
+PARTITION_DIMENSIONS = ["Decade", "Continent", "Aircraft Category"]
+
+
+def _ranges(starts, lengths):
+    """Concatenated np.arange(start, start + length) for every pair."""
+    lengths = np.asarray(lengths)
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(np.asarray(starts), lengths) + np.arange(total) - offsets
+
+
+class RankingIndex:
+    """Partition lists for ranking ``group`` by the sum (or the mean) of its first column.
+
+    ``columns`` are additive cube statistics. With ``mean=True`` the score is
+    columns[0] / columns[1], otherwise columns[0]; any further columns are only
+    summed for the groups returned.
+    """
+
+    def __init__(self, cube, group, columns, mean=False):
+        self.group = group
+        self.columns = list(columns)
+        self.mean = mean
+        self.groups = np.asarray(cube[group].cat.categories)
+        n_groups = len(self.groups)
+
+        partition = np.zeros(len(cube), dtype=np.int64)
+        self.partition_codes = {}
+        for d in PARTITION_DIMENSIONS:
+            partition = partition * len(cube[d].cat.categories) + cube[d].cat.codes.to_numpy()
+        cell = partition * n_groups + cube[group].cat.codes.to_numpy()
+        keys, inverse = np.unique(cell, return_inverse=True)
+        values = np.column_stack([
+            np.bincount(inverse, weights=cube[c].to_numpy(np.float64), minlength=len(keys)) for c in self.columns
+        ])
+        entry_partition, entry_group = np.divmod(keys, n_groups)
+
+        # Partition codes back to one code per dimension, to match selections against
+        partitions = np.unique(entry_partition)
+        remaining = partitions
+        for d in reversed(PARTITION_DIMENSIONS):
+            remaining, self.partition_codes[d] = np.divmod(remaining, len(cube[d].cat.categories))
+        self.categories = {d: pd.Index(cube[d].cat.categories) for d in PARTITION_DIMENSIONS}
+        self.partitions = partitions
+
+        # Entries grouped by partition (dense position), best score first within each
+        position = np.searchsorted(partitions, entry_partition)
+        order = np.lexsort((-self._score(values), position))
+        self.entry_position = position[order]
+        self.entry_group = entry_group[order]
+        self.entry_values = values[order]
+        self.entry_score = self._score(self.entry_values)
+        self.list_start = np.searchsorted(self.entry_position, np.arange(len(partitions)))
+        self.list_stop = np.searchsorted(self.entry_position, np.arange(len(partitions)), side="right")
+
+        # Random access: every entry of a group, across partitions
+        self.group_entries = np.argsort(self.entry_group, kind="stable")
+        self.group_start = np.searchsorted(self.entry_group[self.group_entries], np.arange(n_groups))
+        self.group_stop = np.searchsorted(self.entry_group[self.group_entries], np.arange(n_groups), side="right")
+
+        # The unfiltered ranking, for selections that keep every partition
+        self.totals = np.zeros((n_groups, len(self.columns)))
+        np.add.at(self.totals, self.entry_group, self.entry_values)
+        present = np.flatnonzero(self.group_stop > self.group_start)
+        self.overall = present[np.argsort(-self._score(self.totals[present]), kind="stable")]
+
+    def _score(self, values):
+        if not self.mean:
+            return values[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return values[:, 0] / values[:, 1]
+
+    def _selected_partitions(self, selected_filters):
+        """Boolean mask over partitions, or None when every partition is selected."""
+        mask = None
+        for d in PARTITION_DIMENSIONS:
+            values = selected_filters.get(d, [])
+            if len(values):
+                wanted = self.categories[d].get_indexer(list(values))
+                selected = np.isin(self.partition_codes[d], wanted[wanted >= 0])
+                mask = selected if mask is None else mask & selected
+        return mask
+
+    def _merged(self, groups, selected):
+        """Column totals of ``groups`` over the selected partitions."""
+        lengths = self.group_stop[groups] - self.group_start[groups]
+        entries = self.group_entries[_ranges(self.group_start[groups], lengths)]
+        weights = selected[self.entry_position[entries]]
+        owner = np.repeat(np.arange(len(groups)), lengths)
+        values = np.zeros((len(groups), len(self.columns)))
+        np.add.at(values, owner[weights], self.entry_values[entries[weights]])
+        # Groups only present in unselected partitions are not part of the view
+        return values, np.bincount(owner[weights], minlength=len(groups)) > 0
+
+    def top(self, selected_filters, n, exclude=()):
+        """Groups that can be among the ``n`` best for the selection, with their column totals.
+
+        Returns a frame of the group and its summed columns in group key order,
+        holding the top ``n`` and every group tied with the n-th, or None when
+        the selection filters on a dimension the partitions don't cover.
+        """
+        for col, values in selected_filters.items():
+            if len(values) and col != self.group and col not in PARTITION_DIMENSIONS:
+                return None
+        eligible = np.ones(len(self.groups), dtype=bool)
+        if len(selected_filters.get(self.group, [])):
+            eligible[:] = False
+            found = pd.Index(self.groups).get_indexer(list(selected_filters[self.group]))
+            eligible[found[found >= 0]] = True
+        excluded = pd.Index(self.groups).get_indexer(list(exclude))
+        eligible[excluded[excluded >= 0]] = False
+
+        selected = self._selected_partitions(selected_filters)
+        if selected is None:
+            ranked = self.overall[eligible[self.overall]]
+            groups, values = ranked, self.totals[ranked]
+        else:
+            groups, values = self._threshold(selected, eligible, n)
+
+        scores = self._score(values)
+        if len(groups) > n:
+            # Keep the n best and everything tied with the n-th
+            kth = np.sort(scores)[::-1][n - 1]
+            keep = scores >= kth
+            groups, values = groups[keep], values[keep]
+        order = np.argsort(groups, kind="stable")
+        frame = pd.DataFrame({self.group: self.groups[groups[order]]})
+        for i, c in enumerate(self.columns):
+            frame[c] = values[order, i].round().astype(np.int64) if c.endswith(("_sum", "_count")) else values[order, i]
+        return frame
+
+    def _threshold(self, selected, eligible, n):
+        """Read the selected lists deeper and deeper until the n-th best merged score beats the bound."""
+        lists = np.flatnonzero(selected)
+        starts, stops = self.list_start[lists], self.list_stop[lists]
+        depth = n
+        while True:
+            lengths = np.minimum(stops - starts, depth)
+            seen = np.unique(self.entry_group[_ranges(starts, lengths)])
+            seen = seen[eligible[seen]]
+            values, present = self._merged(seen, selected)
+            seen, values = seen[present], values[present]
+
+            unread = starts + lengths < stops
+            if not unread.any():
+                return seen, values
+            next_scores = self.entry_score[(starts + lengths)[unread]]
+            bound = next_scores.max() if self.mean else next_scores.sum()
+            if len(seen) >= n and np.sort(self._score(values))[::-1][n - 1] > bound:
+                return seen, values
+            depth *= 2
+
+
+class Rankings:
+    """The ranking charts of one cube: chart data from the indexes when the selection allows."""
+
+    def __init__(self, cube):
+        self.indexes = {
+            "top_countries": RankingIndex(cube, "Country", [stat_column(AIR, "sum")]),
+            "manufacturer_stats": RankingIndex(
+                cube, "Aircraft Manufacturer", [stat_column(AIR, "sum"), stat_column("Aboard", "sum")]),
+            "manufacturer_severity": RankingIndex(
+                cube, "Aircraft Manufacturer", [stat_column(AIR, "sum"), stat_column(AIR, "count")], mean=True),
+        }
+
+    def chart_data(self, name, selected_filters):
+        """What the chart of ``name`` draws, or None to build it from the full section."""
+        if name == "top_countries":
+            found = self.indexes[name].top(selected_filters, 10, exclude=EXCLUDED_COUNTRIES)
+            return None if found is None else rank_countries(found)
+        if name == "manufacturer_stats":
+            # The chart keeps the 20 manufacturers with the most air fatalities
+            found = self.indexes[name].top(selected_filters, 20)
+            return None if found is None else manufacturer_rates(found[["Aircraft Manufacturer", stat_column("Aboard", "sum"), stat_column(AIR, "sum")]])
+        if name == "manufacturer_severity":
+            found = self.indexes[name].top(selected_filters, 20)
+            return None if found is None else rank_severity(found)
+        return None
+
+
+RANKED_CHARTS = ["top_countries", "manufacturer_stats", "manufacturer_severity"]